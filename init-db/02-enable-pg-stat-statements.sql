@@ -0,0 +1,10 @@
+-- =============================================================================
+-- Card Fraud Platform - Query statistics
+-- =============================================================================
+-- Enables pg_stat_statements in fraud_gov for `platformctl inventory db --queries`.
+-- Requires shared_preload_libraries=pg_stat_statements (set by the postgres
+-- service command in docker-compose.yml). Existing volumes can enable it with
+-- `uv run platformctl db enable-query-stats`.
+-- =============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
@@ -1,12 +1,28 @@
 """Action execution runner."""
 
+import codecs
 import json
+import os
+import signal
 import subprocess
+import sys
+import threading
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO, Any, TextIO
 
 from .models import ActionResult, ActionSpec, ActionStatus
 
+# Streaming mode bounds: stderr lines kept for the result, longest stderr line
+# read at once, and the largest stdout (the JSON payload) that is buffered.
+STDERR_TAIL_LINES = 200
+STDERR_LINE_MAX_BYTES = 8192
+MAX_STDOUT_BYTES = 1024 * 1024
+STREAM_CHUNK_BYTES = 65536
+# How long to wait for the stderr reader after the adapter exits.
+STDERR_DRAIN_TIMEOUT = 5
+
 
 class ActionRunnerError(Exception):
     """Error executing an action."""
@@ -14,11 +30,28 @@ class ActionRunnerError(Exception):
     pass
 
 
+class OutputLimitExceeded(ActionRunnerError):
+    """Adapter stdout exceeded the streaming size cap."""
+
+    def __init__(self, message: str, stderr: str = ""):
+        super().__init__(message)
+        self.stderr = stderr
+
+
 class ActionRunner:
     """Execute adapter commands with timeout and output parsing."""
 
-    def __init__(self, working_dir: Path):
+    def __init__(
+        self,
+        working_dir: Path,
+        stderr_sink: TextIO | None = None,
+        stderr_tail_lines: int = STDERR_TAIL_LINES,
+        max_stdout_bytes: int = MAX_STDOUT_BYTES,
+    ):
         self.working_dir = working_dir
+        self.stderr_sink = stderr_sink or sys.stderr
+        self.stderr_tail_lines = stderr_tail_lines
+        self.max_stdout_bytes = max_stdout_bytes
 
     def run(
         self,
@@ -27,8 +60,13 @@ class ActionRunner:
         action: str,
         action_spec: ActionSpec,
         format_json: bool = True,
+        stream: bool = False,
     ) -> ActionResult:
-        """Execute an action and return the result."""
+        """Execute an action and return the result.
+
+        With ``stream=True`` the adapter's stderr is echoed live (see
+        ``_run_streaming``) instead of appearing only when the action ends.
+        """
         started_at = datetime.now(timezone.utc)
 
         command = action_spec.command.copy()
@@ -41,23 +79,28 @@ class ActionRunner:
                 command.append("json")
 
         try:
-            result = subprocess.run(
-                command,
-                cwd=self.working_dir,
-                capture_output=True,
-                text=True,
-                timeout=action_spec.timeout_seconds,
-            )
-            completed_at = datetime.now(timezone.utc)
-
             parsed_output: dict | None = None
-            if result.stdout:
-                try:
-                    parsed_output = json.loads(result.stdout)
-                except json.JSONDecodeError:
-                    parsed_output = None
+            if stream:
+                returncode, parsed_output, stderr = self._run_streaming(
+                    command, service, action_spec.timeout_seconds
+                )
+            else:
+                result = subprocess.run(
+                    command,
+                    cwd=self.working_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=action_spec.timeout_seconds,
+                )
+                returncode, stderr = result.returncode, result.stderr
+                if result.stdout:
+                    try:
+                        parsed_output = json.loads(result.stdout)
+                    except json.JSONDecodeError:
+                        parsed_output = None
+            completed_at = datetime.now(timezone.utc)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 if parsed_output is not None:
                     mapped_status = self._map_output_status(
                         str(parsed_output.get("status", "failed")),
@@ -74,7 +117,7 @@ class ActionRunner:
                         status=mapped_status,
                         summary=str(
                             parsed_output.get(
-                                "summary", f"Command exited with code {result.returncode}"
+                                "summary", f"Command exited with code {returncode}"
                             )
                         ),
                         details=[str(item) for item in details],
@@ -83,7 +126,7 @@ class ActionRunner:
                         completed_at=completed_at,
                         artifacts=[str(item) for item in parsed_output.get("artifacts", [])],
                         next_steps=[str(item) for item in parsed_output.get("next_steps", [])],
-                        error=parsed_output.get("error") or result.stderr,
+                        error=parsed_output.get("error") or stderr,
                     )
                 return ActionResult(
                     service=service,
@@ -91,12 +134,12 @@ class ActionRunner:
                     action=action,
                     target=domain,
                     status=ActionStatus.FAILED,
-                    summary=f"Command exited with code {result.returncode}",
-                    details=[result.stderr] if result.stderr else [],
+                    summary=f"Command exited with code {returncode}",
+                    details=[stderr] if stderr else [],
                     destructive=action_spec.destructive,
                     started_at=started_at,
                     completed_at=completed_at,
-                    error=result.stderr,
+                    error=stderr,
                 )
 
             output = parsed_output if parsed_output is not None else {}
@@ -119,6 +162,22 @@ class ActionRunner:
                 next_steps=output.get("next_steps", []),
             )
 
+        except OutputLimitExceeded as e:
+            completed_at = datetime.now(timezone.utc)
+            return ActionResult(
+                service=service,
+                domain=domain,
+                action=action,
+                target=domain,
+                status=ActionStatus.INVALID_OUTPUT,
+                summary=str(e),
+                details=[e.stderr] if e.stderr else [],
+                destructive=action_spec.destructive,
+                started_at=started_at,
+                completed_at=completed_at,
+                error=str(e),
+            )
+
         except subprocess.TimeoutExpired:
             completed_at = datetime.now(timezone.utc)
             return ActionResult(
@@ -149,6 +208,79 @@ class ActionRunner:
                 error=str(e),
             )
 
+    def _run_streaming(
+        self, command: list[str], service: str, timeout: float
+    ) -> tuple[int, dict | None, str]:
+        """Run ``command`` echoing stderr live; return ``(returncode, payload, stderr)``.
+
+        Each stderr line is written to ``stderr_sink`` prefixed with the
+        service, and only the last ``stderr_tail_lines`` are kept. Stdout is
+        parsed as it arrives by ``_StdoutPayload``; once it passes
+        ``max_stdout_bytes`` the rest is drained and discarded so the adapter
+        can finish, and ``OutputLimitExceeded`` is raised. The adapter runs in
+        its own process group so a timeout also kills any children it started
+        (``uv run`` spawns one) that would otherwise keep the pipes open.
+        """
+        process = subprocess.Popen(
+            command,
+            cwd=self.working_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+        assert process.stdout is not None and process.stderr is not None
+        tail: deque[str] = deque(maxlen=self.stderr_tail_lines)
+        stderr_thread = threading.Thread(
+            target=self._tail_stderr,
+            args=(process.stderr, service, tail),
+            name=f"action-stderr-{service}",
+            daemon=True,
+        )
+        stderr_thread.start()
+
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            _kill_process_group(process)
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        payload = _StdoutPayload(self.max_stdout_bytes)
+        try:
+            while chunk := process.stdout.read1(STREAM_CHUNK_BYTES):
+                payload.feed(chunk)
+            returncode = process.wait()
+        except BaseException:
+            # Ctrl-C does not reach the detached process group; stop it here.
+            _kill_process_group(process)
+            raise
+        finally:
+            timer.cancel()
+            stderr_thread.join(STDERR_DRAIN_TIMEOUT)
+            process.stdout.close()
+            if not stderr_thread.is_alive():
+                process.stderr.close()
+
+        stderr = "".join(tail)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, timeout, stderr=stderr)
+        if payload.received > self.max_stdout_bytes:
+            raise OutputLimitExceeded(
+                f"Adapter wrote {payload.received} bytes to stdout, over the "
+                f"{self.max_stdout_bytes} byte limit",
+                stderr,
+            )
+        return returncode, payload.close(), stderr
+
+    def _tail_stderr(self, pipe: IO[bytes], service: str, tail: deque[str]) -> None:
+        # readline's limit bounds a single line from an adapter that never writes a newline.
+        while line := pipe.readline(STDERR_LINE_MAX_BYTES):
+            text = line.decode("utf-8", errors="replace")
+            tail.append(text)
+            self.stderr_sink.write(f"[{service}] {text.rstrip()}\n")
+            self.stderr_sink.flush()
+
     def _map_output_status(
         self, raw_status: str, *, default: ActionStatus
     ) -> ActionStatus:
@@ -170,6 +302,67 @@ class ActionRunner:
         return default
 
 
+class _StdoutPayload:
+    """Parse the adapter's stdout JSON document as chunks arrive.
+
+    Only the not-yet-parsed text is held; a complete document is decoded as
+    soon as its last chunk is in. ``close`` returns the document, or None
+    when stdout was empty, not JSON, or had data after the document (the
+    same cases ``json.loads`` on the whole output rejects).
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.received = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._json = json.JSONDecoder()
+        self._pending = ""
+        self._document: Any = None
+        self._parsed = False
+        self._invalid = False
+
+    def feed(self, chunk: bytes) -> None:
+        self.received += len(chunk)
+        if self.received > self.limit or self._invalid:
+            return
+        self._pending += self._decoder.decode(chunk)
+        self._parse()
+
+    def close(self) -> Any:
+        self._pending += self._decoder.decode(b"", final=True)
+        self._parse()
+        if self._invalid or not self._parsed or self._pending.strip():
+            return None
+        return self._document
+
+    def _parse(self) -> None:
+        text = self._pending.lstrip()
+        if not text:
+            self._pending = ""
+            return
+        if self._parsed:
+            # Anything but whitespace after the document.
+            self._invalid = True
+            self._pending = ""
+            return
+        try:
+            self._document, end = self._json.raw_decode(text)
+        except json.JSONDecodeError:
+            # Incomplete so far (or not JSON); wait for more output.
+            self._pending = text
+            return
+        self._parsed = True
+        self._pending = text[end:]
+        self._parse()
+
+
+def _kill_process_group(process: subprocess.Popen) -> None:
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
 def run_action(
     service: str,
     domain: str,
@@ -177,7 +370,10 @@ def run_action(
     action_spec: ActionSpec,
     working_dir: Path,
     format_json: bool = True,
+    stream: bool = False,
 ) -> ActionResult:
     """Convenience function to run an action."""
     runner = ActionRunner(working_dir)
-    return runner.run(service, domain, action, action_spec, format_json=format_json)
+    return runner.run(
+        service, domain, action, action_spec, format_json=format_json, stream=stream
+    )
@@ -0,0 +1,157 @@
+"""Artifact fetch latency from the host and from inside card-fraud-network.
+
+Rule engines download the latest ``ruleset.json`` per key and the field
+registry on cold start and hot reload. The probe fetches the same objects
+``repetitions`` times from two vantage points:
+
+- ``host``: signed GETs from platformctl to the published MinIO port.
+- ``network``: ``curl`` run inside a container on ``card-fraud-network``
+  against presigned ``http://minio:9000`` URLs, the path the engines use.
+  Presigning keeps the MinIO credentials out of the container.
+
+Each transfer records time-to-first-byte, total time and size.
+"""
+
+import math
+import shlex
+from typing import Any
+
+from .docker_api import DockerCLI, DockerEngineClient
+from .s3_client import S3Client, S3Error
+
+DEFAULT_PROBE_REPETITIONS = 5
+DEFAULT_PROBE_ENVIRONMENT = "local"
+NETWORK_ENDPOINT = "http://minio:9000"
+# Containers on card-fraud-network tried in order as the in-network vantage point.
+PROBE_CONTAINERS = (
+    "card-fraud-rule-engine-auth",
+    "card-fraud-rule-engine-monitoring",
+    "card-fraud-rule-management",
+)
+# Each curl is capped, and the exec budget covers every curl hitting its cap,
+# so a slow MinIO yields per-sample errors rather than a lost run.
+CURL_MAX_TIME = 10
+PROBE_TIMEOUT_SLACK = 10
+
+_CURL_FORMAT = (
+    "%{http_code} %{time_connect} %{time_starttransfer} %{time_total} %{size_download}\\n"
+)
+
+
+def probe_targets(
+    artifacts: dict[str, list[dict[str, Any]]],
+    artifact_paths: dict[str, dict[str, Any]],
+    environment: str,
+) -> list[str]:
+    """Return the object keys an engine loads: latest versions plus manifests."""
+    keys: list[str] = []
+    for name, entries in artifacts.items():
+        for entry in entries:
+            if entry.get("environment", environment) != environment:
+                continue
+            latest = next(v for v in entry["versions"] if v["latest"])
+            keys.extend(latest["prefix"] + obj for obj in sorted(latest["objects"]))
+        manifest = artifact_paths.get(name, {}).get("manifest")
+        if manifest:
+            keys.append(manifest.format(environment=environment))
+    return keys
+
+
+def probe_host(
+    client: S3Client, bucket: str, keys: list[str], repetitions: int
+) -> dict[str, list[dict[str, Any]]]:
+    """Fetch each key ``repetitions`` times over the host's S3 connection pool."""
+    samples: dict[str, list[dict[str, Any]]] = {}
+    for key in keys:
+        try:
+            samples[key] = [client.timed_get(bucket, key) for _ in range(repetitions)]
+        except S3Error as e:
+            samples[key] = [{"error": str(e)}]
+    return samples
+
+
+def find_probe_container(docker: DockerEngineClient | DockerCLI) -> str | None:
+    """Return the first running container on the network that has curl."""
+    for container in PROBE_CONTAINERS:
+        try:
+            if docker.exec_run(container, ["curl", "--version"], timeout=10).returncode == 0:
+                return container
+        except Exception:
+            continue
+    return None
+
+
+def probe_network(
+    docker: DockerEngineClient | DockerCLI,
+    container: str,
+    client: S3Client,
+    bucket: str,
+    keys: list[str],
+    repetitions: int,
+) -> dict[str, list[dict[str, Any]]]:
+    """Fetch each key ``repetitions`` times with curl from inside ``container``.
+
+    Every repetition is a separate curl process, so each sample includes
+    connection setup the way an engine cold start does.
+    """
+    urls = {key: client.presign_get(bucket, key, endpoint=NETWORK_ENDPOINT) for key in keys}
+    script = "\n".join(
+        f"curl -s -o /dev/null --max-time {CURL_MAX_TIME} -w {shlex.quote(_CURL_FORMAT)} "
+        f"{shlex.quote(urls[key])}"
+        for key in keys
+        for _ in range(repetitions)
+    )
+    timeout = len(keys) * repetitions * CURL_MAX_TIME + PROBE_TIMEOUT_SLACK
+    result = docker.exec_run(container, ["sh", "-c", script], timeout=timeout)
+    lines = result.stdout.splitlines()
+    if len(lines) != len(keys) * repetitions:
+        raise RuntimeError(
+            f"curl in {container} returned {len(lines)} of {len(keys) * repetitions} samples: "
+            f"{result.stderr.strip() or result.stdout.strip()}"
+        )
+
+    samples: dict[str, list[dict[str, Any]]] = {key: [] for key in keys}
+    for index, line in enumerate(lines):
+        status, connect, first_byte, total, size = line.split()
+        if status == "000":
+            # curl reports no status when it timed out or could not connect.
+            samples[keys[index // repetitions]].append({"error": "no response"})
+            continue
+        if status != "200":
+            samples[keys[index // repetitions]].append({"error": f"HTTP {status}"})
+            continue
+        samples[keys[index // repetitions]].append(
+            {
+                "connect": float(connect),
+                "ttfb": float(first_byte),
+                "total": float(total),
+                "bytes": int(float(size)),
+            }
+        )
+    return samples
+
+
+def summarize_samples(samples: list[dict[str, Any]]) -> dict[str, Any]:
+    """Median/max TTFB and total time in ms plus median throughput."""
+    ok = [sample for sample in samples if "error" not in sample]
+    errors = sorted({sample["error"] for sample in samples if "error" in sample})
+    if not ok:
+        return {"repetitions": 0, "errors": errors}
+    ttfb = sorted(sample["ttfb"] * 1000 for sample in ok)
+    total = sorted(sample["total"] * 1000 for sample in ok)
+    median_total = _median(total)
+    size = ok[0]["bytes"]
+    return {
+        "repetitions": len(ok),
+        "bytes": size,
+        "ttfb_ms": {"p50": round(_median(ttfb), 2), "max": round(ttfb[-1], 2)},
+        "total_ms": {"p50": round(median_total, 2), "max": round(total[-1], 2)},
+        "first_ms": round(ok[0]["total"] * 1000, 2),
+        "throughput_mb_s": round(size / median_total / 1000, 3) if median_total else None,
+        "errors": errors,
+    }
+
+
+def _median(values: list[float]) -> float:
+    middle = (len(values) - 1) / 2
+    return (values[math.floor(middle)] + values[math.ceil(middle)]) / 2
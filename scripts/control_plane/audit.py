@@ -1,6 +1,7 @@
 """Audit logging for control plane actions."""
 
 import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -20,11 +21,14 @@ class AuditLogger:
             )
         self.log_path = log_path
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        # Fan-out actions log from several worker threads.
+        self._lock = threading.Lock()
 
     def log(self, record: AuditRecord) -> None:
         """Write an audit record to the log."""
-        with open(self.log_path, "a") as f:
-            f.write(json.dumps(record.to_dict()) + "\n")
+        line = json.dumps(record.to_dict()) + "\n"
+        with self._lock, open(self.log_path, "a") as f:
+            f.write(line)
 
     def log_start(
         self,
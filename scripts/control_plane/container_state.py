@@ -0,0 +1,117 @@
+"""Bulk container state snapshot shared by control-plane call sites."""
+
+from typing import Any
+
+from .docker_api import DockerCLI, DockerEngineClient, get_docker
+from .models import ContainerState
+
+CONTAINER_NAME_PREFIX = "card-fraud-"
+
+
+class ContainerSnapshot:
+    """Point-in-time view of every ``card-fraud-*`` container.
+
+    The snapshot is built from one listing of matching containers and one
+    bulk inspect over all of them, so with the CLI backend the process cost
+    does not grow with the number of containers.
+    """
+
+    def __init__(
+        self,
+        containers: dict[str, ContainerState] | None = None,
+        available: bool = True,
+        error: str | None = None,
+    ):
+        self.containers = containers or {}
+        self.available = available
+        self.error = error
+
+    def get(self, name: str) -> ContainerState | None:
+        """Get the state of a container by name."""
+        return self.containers.get(name)
+
+    def exists(self, name: str) -> bool:
+        """Check whether a container exists."""
+        return name in self.containers
+
+    def is_running(self, name: str) -> bool:
+        """Check whether a container is running."""
+        state = self.containers.get(name)
+        return state is not None and state.running
+
+    def status(self, name: str) -> str:
+        """Get the Docker status string, mirroring ``{{.State.Status}}``."""
+        if not self.available:
+            return "unknown"
+        state = self.containers.get(name)
+        return state.status if state else "not-found"
+
+    def compose_project(self, name: str) -> str:
+        """Get the compose project label for a container (if any)."""
+        state = self.containers.get(name)
+        return state.compose_project if state else ""
+
+
+def load_container_snapshot(
+    prefix: str = CONTAINER_NAME_PREFIX,
+    docker: DockerEngineClient | DockerCLI | None = None,
+) -> ContainerSnapshot:
+    """Query Docker for the state of all containers matching ``prefix``."""
+    try:
+        docker = docker or get_docker()
+        container_ids = docker.list_container_ids(prefix)
+        containers = {}
+        for raw in docker.inspect_containers(container_ids):
+            state = parse_container_state(raw)
+            if state.name.startswith(prefix):
+                containers[state.name] = state
+        return ContainerSnapshot(containers)
+
+    except Exception as e:
+        return ContainerSnapshot(available=False, error=str(e))
+
+
+def parse_container_state(raw: dict[str, Any]) -> ContainerState:
+    """Convert a ``docker inspect`` document into a ContainerState."""
+    state = raw.get("State") or {}
+    labels = (raw.get("Config") or {}).get("Labels") or {}
+    health = state.get("Health") or {}
+    return ContainerState(
+        name=str(raw.get("Name", "")).lstrip("/"),
+        status=state.get("Status", "unknown"),
+        running=bool(state.get("Running", False)),
+        health=health.get("Status"),
+        compose_project=labels.get("com.docker.compose.project", ""),
+        compose_service=labels.get("com.docker.compose.service", ""),
+        restart_count=int(raw.get("RestartCount", 0) or 0),
+        ports=_format_ports((raw.get("NetworkSettings") or {}).get("Ports") or {}),
+    )
+
+
+def _format_ports(ports: dict[str, list[dict[str, str]] | None]) -> list[str]:
+    formatted = []
+    for container_port, bindings in sorted(ports.items()):
+        if not bindings:
+            formatted.append(container_port)
+            continue
+        for binding in bindings:
+            host = binding.get("HostIp", "")
+            formatted.append(f"{host}:{binding.get('HostPort', '')}->{container_port}")
+    return formatted
+
+
+_snapshot: ContainerSnapshot | None = None
+
+
+def get_container_snapshot(refresh: bool = False) -> ContainerSnapshot:
+    """Get the container snapshot, memoized for the lifetime of the process."""
+    global _snapshot
+    if _snapshot is None or refresh:
+        _snapshot = load_container_snapshot()
+    return _snapshot
+
+
+def invalidate_container_snapshot() -> None:
+    """Drop the memoized snapshot so the next lookup re-queries Docker."""
+    global _snapshot
+    _snapshot = None
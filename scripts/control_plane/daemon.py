@@ -0,0 +1,250 @@
+"""Persistent control-plane daemon serving cached status and inventory.
+
+The daemon keeps the registry, adapter manifests and the latest collector and
+health results in memory. It refreshes them on a fixed interval and whenever
+Docker reports a container lifecycle event, and serves them as JSON over a
+loopback HTTP API so ``platformctl status``/``inventory`` can answer without
+touching Docker, Postgres, Redpanda or Doppler.
+"""
+
+import json
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from .adapter_manifest import load_adapter
+from .container_state import CONTAINER_NAME_PREFIX, get_container_snapshot
+from .docker_api import DockerCLI, DockerEngineClient
+from .health import check_all_services_health
+from .inventory.catalog import build_collectors, select_collectors
+from .inventory.scheduler import run_collectors
+from .models import CollectorResult, HealthAggregate
+from .registry import Registry
+
+DAEMON_HOST = "127.0.0.1"
+DAEMON_PORT = 8765
+DAEMON_REFRESH_INTERVAL = 30
+DAEMON_URL_ENV = "PLATFORMCTL_DAEMON_URL"
+
+# Scopes refreshed right away when a container starts, stops or changes health.
+EVENT_REFRESH_SCOPES = ["services", "infra", "redis"]
+CONTAINER_EVENTS = ["start", "stop", "die", "restart", "health_status", "destroy"]
+
+
+class ControlPlaneDaemon:
+    """Cache control-plane state in memory and keep it fresh."""
+
+    def __init__(
+        self,
+        registry: Registry,
+        docker: DockerEngineClient | DockerCLI | None = None,
+        interval: float = DAEMON_REFRESH_INTERVAL,
+    ):
+        self.registry = registry
+        self.docker = docker
+        self.interval = interval
+        self.collectors = build_collectors(registry, docker)
+        self.started_at = datetime.now(timezone.utc)
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._event_pending = threading.Event()
+        self._registry_mtime: float | None = None
+        self._inventory: dict[str, CollectorResult] = {}
+        self._inventory_refreshed: dict[str, datetime] = {}
+        self._health: list[HealthAggregate] = []
+        self._health_refreshed: datetime | None = None
+        self._adapters: dict[str, dict[str, list[str]]] = {}
+        # Collectors abandoned by a timed-out refresh; later refreshes skip
+        # them until they finish instead of piling up worker threads.
+        self._in_flight: dict[str, Future] = {}
+
+    def refresh(self, scopes: list[str] | None = None) -> None:
+        """Refresh registry, health and the given inventory scopes (all by default)."""
+        self._reload_registry_if_changed()
+        get_container_snapshot(refresh=True)
+
+        selected = (
+            {scope: self.collectors[scope] for scope in scopes}
+            if scopes
+            else select_collectors(self.collectors, "all")
+        )
+        still_running = {key for key, future in self._in_flight.items() if not future.done()}
+        results = run_collectors(selected, in_flight=self._in_flight)
+        health = check_all_services_health(self.registry)
+        refreshed_at = datetime.now(timezone.utc)
+
+        with self._lock:
+            for scope, result in zip(selected, results):
+                # Keep serving the last result while a previous run is still going.
+                if scope in still_running and scope in self._inventory:
+                    continue
+                self._inventory[scope] = result
+                self._inventory_refreshed[scope] = refreshed_at
+            self._health = health
+            self._health_refreshed = refreshed_at
+
+    def status_payload(self) -> dict[str, Any]:
+        """Return the cached services inventory and health aggregates."""
+        with self._lock:
+            services = self._inventory.get("services")
+            return {
+                "services": services.data if services and services.data else {},
+                "health": [h.to_dict() for h in self._health],
+                "refreshed_at": _isoformat(self._health_refreshed),
+            }
+
+    def inventory_payload(self, scope: str) -> dict[str, Any]:
+        """Return cached collector results for an inventory scope."""
+        keys = list(select_collectors(self.collectors, scope))
+        with self._lock:
+            return {
+                "results": [
+                    self._inventory[key].to_dict() for key in keys if key in self._inventory
+                ],
+                "refreshed_at": {
+                    key: _isoformat(self._inventory_refreshed.get(key)) for key in keys
+                },
+            }
+
+    def registry_payload(self) -> dict[str, Any]:
+        """Return registered services with their adapter action domains."""
+        with self._lock:
+            return {
+                "services": self.registry.list_services(),
+                "infrastructure": self.registry.list_infrastructure(),
+                "adapters": self._adapters,
+            }
+
+    def start(self) -> None:
+        """Prime the cache and start the background refresh threads."""
+        self.refresh()
+        threading.Thread(target=self._refresh_loop, name="daemon-refresh", daemon=True).start()
+        if isinstance(self.docker, DockerEngineClient):
+            threading.Thread(target=self._event_loop, name="daemon-events", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def request_refresh(self) -> None:
+        """Ask the refresh loop to run a full refresh now."""
+        self._wake.set()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.is_set():
+            woken = self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                return
+            if woken and self._event_pending.is_set():
+                self._event_pending.clear()
+                self.refresh(EVENT_REFRESH_SCOPES)
+            else:
+                self.refresh()
+
+    def _event_loop(self) -> None:
+        filters = {
+            "type": ["container"],
+            "event": CONTAINER_EVENTS,
+        }
+        while not self._stop.is_set():
+            try:
+                for event in self.docker.events(filters=filters):
+                    name = (event.get("Actor") or {}).get("Attributes", {}).get("name", "")
+                    if name.startswith(CONTAINER_NAME_PREFIX):
+                        self._event_pending.set()
+                        self._wake.set()
+                    if self._stop.is_set():
+                        return
+            except Exception:
+                # Daemon restarts or socket hiccups; the interval refresh still runs.
+                self._stop.wait(self.interval)
+
+    def _reload_registry_if_changed(self) -> None:
+        try:
+            mtime = self.registry.path.stat().st_mtime
+        except OSError:
+            return
+        if self._registry_mtime == mtime:
+            return
+
+        self.registry.reload()
+        adapters: dict[str, dict[str, list[str]]] = {}
+        for service_id in self.registry.list_services():
+            loader = load_adapter(service_id, self.registry)
+            if loader is None:
+                continue
+            try:
+                adapters[service_id] = {
+                    domain: loader.list_actions(domain) for domain in loader.list_domains()
+                }
+            except Exception:
+                continue
+        with self._lock:
+            self._adapters = adapters
+        self._registry_mtime = mtime
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _make_handler(daemon: ControlPlaneDaemon) -> type[BaseHTTPRequestHandler]:
+    class DaemonRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path == "/v1/ping":
+                self._send(200, {"ok": True, "started_at": daemon.started_at.isoformat()})
+            elif url.path == "/v1/status":
+                self._send(200, daemon.status_payload())
+            elif url.path == "/v1/inventory":
+                scope = query.get("scope", ["all"])[0]
+                try:
+                    self._send(200, daemon.inventory_payload(scope))
+                except KeyError:
+                    self._send(404, {"error": f"Unknown inventory scope: {scope}"})
+            elif url.path == "/v1/registry":
+                self._send(200, daemon.registry_payload())
+            else:
+                self._send(404, {"error": f"Unknown path: {url.path}"})
+
+        def do_POST(self) -> None:
+            if urlparse(self.path).path == "/v1/refresh":
+                daemon.request_refresh()
+                self._send(202, {"ok": True})
+            else:
+                self._send(404, {"error": f"Unknown path: {self.path}"})
+
+        def _send(self, code: int, payload: dict[str, Any]) -> None:
+            body = json.dumps(payload, default=str).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return
+
+    return DaemonRequestHandler
+
+
+def serve(
+    daemon: ControlPlaneDaemon, host: str = DAEMON_HOST, port: int = DAEMON_PORT
+) -> None:
+    """Prime the daemon cache and serve the HTTP API until interrupted."""
+    daemon.start()
+    server = ThreadingHTTPServer((host, port), _make_handler(daemon))
+    server.daemon_threads = True
+    try:
+        server.serve_forever(poll_interval=0.5)
+    finally:
+        daemon.stop()
+        server.server_close()
+
@@ -0,0 +1,60 @@
+"""Thin client for the control-plane daemon."""
+
+import os
+
+import httpx
+
+from .daemon import DAEMON_HOST, DAEMON_PORT, DAEMON_URL_ENV
+from .models import CollectorResult, HealthAggregate
+
+DAEMON_CLIENT_TIMEOUT = 2.0
+DAEMON_CONNECT_TIMEOUT = 0.2
+
+
+def daemon_url() -> str:
+    """Resolve the daemon base URL (``PLATFORMCTL_DAEMON_URL`` overrides)."""
+    return os.environ.get(DAEMON_URL_ENV, f"http://{DAEMON_HOST}:{DAEMON_PORT}")
+
+
+class DaemonClient:
+    """Read cached status and inventory from a running daemon.
+
+    Every call returns ``None`` when the daemon is not reachable so callers
+    can fall back to collecting locally.
+    """
+
+    def __init__(self, base_url: str | None = None, transport: httpx.BaseTransport | None = None):
+        self.base_url = base_url or daemon_url()
+        self.transport = transport
+
+    def status(self) -> tuple[dict, list[HealthAggregate]] | None:
+        """Return ``(services_data, health_results)`` from the daemon cache."""
+        payload = self._get("/v1/status")
+        if payload is None:
+            return None
+        health = [HealthAggregate.from_dict(h) for h in payload.get("health", [])]
+        return payload.get("services", {}), health
+
+    def inventory(self, scope: str) -> list[CollectorResult] | None:
+        """Return cached collector results for an inventory scope."""
+        payload = self._get("/v1/inventory", params={"scope": scope})
+        if payload is None:
+            return None
+        return [CollectorResult.from_dict(r) for r in payload.get("results", [])]
+
+    def _get(self, path: str, params: dict[str, str] | None = None) -> dict | None:
+        timeout = httpx.Timeout(DAEMON_CLIENT_TIMEOUT, connect=DAEMON_CONNECT_TIMEOUT)
+        try:
+            with httpx.Client(
+                base_url=self.base_url, timeout=timeout, transport=self.transport
+            ) as client:
+                response = client.get(path, params=params)
+        except httpx.HTTPError:
+            return None
+        if response.status_code != 200:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            # Something other than the daemon is listening on its port.
+            return None
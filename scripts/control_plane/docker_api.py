@@ -0,0 +1,273 @@
+"""Docker access for the control plane.
+
+Collectors talk to Docker through one of two interchangeable backends:
+
+- ``DockerEngineClient`` speaks the Engine HTTP API directly over the unix
+  socket, keeping a single keep-alive connection for the whole command.
+- ``DockerCLI`` shells out to the ``docker`` binary and is used as a fallback
+  when the socket is not reachable (e.g. Docker Desktop named pipes).
+"""
+
+import json
+import os
+import struct
+import subprocess
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+
+DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+DOCKER_API_TIMEOUT = 10
+DOCKER_BACKENDS = ("auto", "engine", "cli")
+
+_STREAM_STDOUT = 1
+_STREAM_STDERR = 2
+
+
+class DockerEngineError(Exception):
+    """Error returned by the Docker Engine API."""
+
+    pass
+
+
+class DockerEngineClient:
+    """Minimal Docker Engine API client over the unix socket."""
+
+    backend = "engine"
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_DOCKER_SOCKET,
+        timeout: float = DOCKER_API_TIMEOUT,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self.socket_path = socket_path
+        self._client = httpx.Client(
+            base_url="http://docker",
+            transport=transport or httpx.HTTPTransport(uds=socket_path),
+            timeout=timeout,
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def ping(self) -> bool:
+        """Check whether the daemon answers on the socket."""
+        try:
+            return self._client.get("/_ping").status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    def list_containers(
+        self,
+        include_stopped: bool = True,
+        filters: dict[str, list[str]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List containers (``GET /containers/json``)."""
+        params: dict[str, str] = {"all": "1" if include_stopped else "0"}
+        if filters:
+            params["filters"] = json.dumps(filters)
+        return self._get_json("/containers/json", params=params)
+
+    def list_container_ids(self, name_filter: str) -> list[str]:
+        """List IDs of all containers whose name matches ``name_filter``."""
+        return [c["Id"] for c in self.list_containers(filters={"name": [name_filter]})]
+
+    def inspect_container(self, container: str) -> dict[str, Any]:
+        """Inspect a container (``GET /containers/{id}/json``)."""
+        return self._get_json(f"/containers/{container}/json")
+
+    def inspect_containers(self, containers: list[str]) -> list[dict[str, Any]]:
+        """Inspect several containers over the shared connection."""
+        inspected = []
+        for container in containers:
+            try:
+                inspected.append(self.inspect_container(container))
+            except DockerEngineError:
+                # Removed between listing and inspection.
+                continue
+        return inspected
+
+    def stats(self, container: str) -> dict[str, Any]:
+        """Take a single resource usage sample for a container."""
+        return self._get_json(
+            f"/containers/{container}/stats",
+            params={"stream": "false", "one-shot": "true"},
+        )
+
+    def events(
+        self,
+        since: str | None = None,
+        until: str | None = None,
+        filters: dict[str, list[str]] | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield daemon events; streams indefinitely unless ``until`` is set."""
+        params: dict[str, str] = {}
+        if since is not None:
+            params["since"] = since
+        if until is not None:
+            params["until"] = until
+        if filters:
+            params["filters"] = json.dumps(filters)
+        with self._client.stream(
+            "GET", "/events", params=params, timeout=httpx.Timeout(timeout)
+        ) as response:
+            self._raise_for_status(response)
+            for line in response.iter_lines():
+                if line.strip():
+                    yield json.loads(line)
+
+    def exec_run(
+        self, container: str, cmd: list[str], timeout: float = DOCKER_API_TIMEOUT
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a command inside a container, like ``docker exec``."""
+        created = self._client.post(
+            f"/containers/{container}/exec",
+            json={"AttachStdout": True, "AttachStderr": True, "Tty": False, "Cmd": cmd},
+        )
+        self._raise_for_status(created)
+        exec_id = created.json()["Id"]
+
+        started = self._client.post(
+            f"/exec/{exec_id}/start",
+            json={"Detach": False, "Tty": False},
+            timeout=timeout,
+        )
+        self._raise_for_status(started)
+        stdout, stderr = demux_stream(started.content)
+
+        exit_code = self._get_json(f"/exec/{exec_id}/json").get("ExitCode")
+        return subprocess.CompletedProcess(
+            args=["docker", "exec", container, *cmd],
+            returncode=exit_code if exit_code is not None else -1,
+            stdout=stdout.decode("utf-8", errors="replace"),
+            stderr=stderr.decode("utf-8", errors="replace"),
+        )
+
+    def _get_json(self, path: str, params: dict[str, str] | None = None) -> Any:
+        response = self._client.get(path, params=params)
+        self._raise_for_status(response)
+        return response.json()
+
+    def _raise_for_status(self, response: httpx.Response) -> None:
+        if response.status_code < 400:
+            return
+        response.read()
+        try:
+            message = response.json().get("message", response.text)
+        except ValueError:
+            message = response.text
+        raise DockerEngineError(f"{response.status_code}: {message}")
+
+
+class DockerCLI:
+    """Docker access through the ``docker`` CLI (fallback backend)."""
+
+    backend = "cli"
+
+    def ping(self) -> bool:
+        try:
+            result = subprocess.run(
+                ["docker", "version", "--format", "{{.Server.Version}}"],
+                capture_output=True,
+                text=True,
+                timeout=DOCKER_API_TIMEOUT,
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
+    def list_container_ids(self, name_filter: str) -> list[str]:
+        result = subprocess.run(
+            ["docker", "ps", "-aq", "--no-trunc", "--filter", f"name={name_filter}"],
+            capture_output=True,
+            text=True,
+            timeout=DOCKER_API_TIMEOUT,
+        )
+        if result.returncode != 0:
+            raise DockerEngineError(result.stderr.strip())
+        return result.stdout.split()
+
+    def inspect_containers(self, containers: list[str]) -> list[dict[str, Any]]:
+        if not containers:
+            return []
+        result = subprocess.run(
+            ["docker", "inspect", *containers],
+            capture_output=True,
+            text=True,
+            timeout=DOCKER_API_TIMEOUT,
+        )
+        # Containers removed between ps and inspect make inspect exit non-zero
+        # while still printing the remaining ones, so parse whatever came back.
+        if not result.stdout.strip():
+            raise DockerEngineError(result.stderr.strip())
+        return json.loads(result.stdout)
+
+    def exec_run(
+        self, container: str, cmd: list[str], timeout: float = DOCKER_API_TIMEOUT
+    ) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            ["docker", "exec", container, *cmd],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+
+def demux_stream(payload: bytes) -> tuple[bytes, bytes]:
+    """Split a multiplexed (non-TTY) attach stream into stdout and stderr."""
+    stdout = bytearray()
+    stderr = bytearray()
+    offset = 0
+    while offset + 8 <= len(payload):
+        stream_type, size = struct.unpack(">BxxxL", payload[offset : offset + 8])
+        frame = payload[offset + 8 : offset + 8 + size]
+        if stream_type == _STREAM_STDERR:
+            stderr.extend(frame)
+        elif stream_type == _STREAM_STDOUT:
+            stdout.extend(frame)
+        offset += 8 + size
+    return bytes(stdout), bytes(stderr)
+
+
+def docker_socket_path() -> str:
+    """Resolve the Docker socket path, honouring ``unix://`` DOCKER_HOST."""
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if docker_host.startswith("unix://"):
+        return docker_host[len("unix://") :]
+    return DEFAULT_DOCKER_SOCKET
+
+
+_docker_clients: dict[str, DockerEngineClient | DockerCLI] = {}
+
+
+def get_docker(backend: str = "auto") -> DockerEngineClient | DockerCLI:
+    """Get the Docker backend for this process.
+
+    ``auto`` prefers the Engine API when the socket answers and falls back to
+    the CLI otherwise; ``engine`` and ``cli`` force a backend.
+    """
+    if backend not in DOCKER_BACKENDS:
+        raise ValueError(f"Unknown docker backend: {backend}")
+    if backend in _docker_clients:
+        return _docker_clients[backend]
+
+    client: DockerEngineClient | DockerCLI
+    if backend == "cli":
+        client = DockerCLI()
+    else:
+        socket_path = docker_socket_path()
+        engine = DockerEngineClient(socket_path) if os.path.exists(socket_path) else None
+        if engine is not None and (backend == "engine" or engine.ping()):
+            client = engine
+        elif backend == "engine":
+            raise DockerEngineError(f"Docker socket not reachable at {socket_path}")
+        else:
+            if engine is not None:
+                engine.close()
+            client = DockerCLI()
+
+    _docker_clients[backend] = client
+    return client
@@ -1,13 +1,19 @@
 """Health aggregation for services."""
 
+import asyncio
 import subprocess
 from datetime import datetime, timezone
 from urllib.parse import urljoin
 
+import httpx
+
+from .container_state import ContainerSnapshot, get_container_snapshot
 from .models import HealthAggregate, HealthStatus, ServiceRegistryEntry
 
 
 HEALTH_HTTP_TIMEOUT = 5
+HEALTH_OVERALL_DEADLINE = 15
+HEALTH_MAX_CONNECTIONS = 16
 
 
 class HealthChecker:
@@ -83,16 +89,141 @@ class HealthChecker:
 
     def _is_container_running(self, container_name: str) -> bool:
         """Check if a Docker container is running."""
+        return get_container_snapshot().is_running(container_name)
+
+
+class AsyncHealthChecker:
+    """Probe many services at once over a shared keep-alive connection pool.
+
+    Every probe is bounded by ``probe_timeout`` and the whole fan-out is
+    bounded by ``deadline``; probes still in flight when the deadline expires
+    are cancelled and reported as unreachable.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost",
+        probe_timeout: float = HEALTH_HTTP_TIMEOUT,
+        deadline: float = HEALTH_OVERALL_DEADLINE,
+        transport: httpx.AsyncBaseTransport | None = None,
+        snapshot: ContainerSnapshot | None = None,
+    ):
+        self.base_url = base_url
+        self.probe_timeout = probe_timeout
+        self.deadline = deadline
+        self.transport = transport
+        self.snapshot = snapshot
+
+    async def check_services(
+        self, services: list[ServiceRegistryEntry]
+    ) -> list[HealthAggregate]:
+        """Check all services, returning results in input order."""
+        if not services:
+            return []
+        if self.snapshot is None:
+            self.snapshot = await asyncio.to_thread(get_container_snapshot)
+
+        limits = httpx.Limits(
+            max_connections=HEALTH_MAX_CONNECTIONS,
+            max_keepalive_connections=HEALTH_MAX_CONNECTIONS,
+        )
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(self.probe_timeout),
+            limits=limits,
+            transport=self.transport,
+        ) as client:
+            tasks = [
+                asyncio.create_task(self.check_service(client, service))
+                for service in services
+            ]
+            _, pending = await asyncio.wait(tasks, timeout=self.deadline)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        results = []
+        for service, task in zip(services, tasks):
+            if task.cancelled():
+                results.append(
+                    _build_aggregate(
+                        service,
+                        HealthStatus.UNREACHABLE,
+                        f"Health check exceeded overall deadline of {self.deadline}s",
+                    )
+                )
+            elif task.exception() is not None:
+                results.append(
+                    _build_aggregate(
+                        service,
+                        HealthStatus.UNREACHABLE,
+                        f"Health check failed: {task.exception()}",
+                    )
+                )
+            else:
+                results.append(task.result())
+        return results
+
+    async def check_service(
+        self, client: httpx.AsyncClient, service: ServiceRegistryEntry
+    ) -> HealthAggregate:
+        """Check health for a single service using the shared client."""
+        checked_at = datetime.now(timezone.utc)
+
+        if not self._is_container_running(service.container):
+            return _build_aggregate(
+                service,
+                HealthStatus.NOT_RUNNING,
+                f"Container {service.container} is not running",
+                checked_at,
+            )
+
+        health_url = urljoin(f"{self.base_url}:{service.port}", service.health.path)
         try:
-            result = subprocess.run(
-                ["docker", "inspect", "-f", "{{.State.Running}}", container_name],
-                capture_output=True,
-                text=True,
-                timeout=5,
+            response = await client.get(health_url)
+        except httpx.TimeoutException:
+            return _build_aggregate(
+                service, HealthStatus.UNREACHABLE, "Health check timed out", checked_at
+            )
+        except httpx.HTTPError as e:
+            return _build_aggregate(
+                service,
+                HealthStatus.UNREACHABLE,
+                f"Health check failed: {str(e)}",
+                checked_at,
             )
-            return result.returncode == 0 and "true" in result.stdout.lower()
-        except Exception:
-            return False
+
+        if response.status_code < 400:
+            return _build_aggregate(
+                service, HealthStatus.HEALTHY, "Service is healthy", checked_at
+            )
+        return _build_aggregate(
+            service,
+            HealthStatus.UNREACHABLE,
+            f"Health endpoint returned HTTP {response.status_code}",
+            checked_at,
+        )
+
+    def _is_container_running(self, container_name: str) -> bool:
+        """Check if a Docker container is running from the shared snapshot."""
+        snapshot = self.snapshot or get_container_snapshot()
+        return snapshot.is_running(container_name)
+
+
+def _build_aggregate(
+    service: ServiceRegistryEntry,
+    status: HealthStatus,
+    message: str,
+    checked_at: datetime | None = None,
+) -> HealthAggregate:
+    return HealthAggregate(
+        service=service.service_id,
+        runtime=service.runtime,
+        status=status,
+        checked_at=checked_at or datetime.now(timezone.utc),
+        source_path=service.health.path,
+        message=message,
+    )
 
 
 def check_service_health(service: ServiceRegistryEntry) -> HealthAggregate:
@@ -101,11 +232,10 @@ def check_service_health(service: ServiceRegistryEntry) -> HealthAggregate:
     return checker.check_service(service)
 
 
-def check_all_services_health(registry) -> list[HealthAggregate]:
-    """Check health for all registered services."""
-    checker = HealthChecker()
-    results = []
-    for service in registry.load().services.values():
-        result = checker.check_service(service)
-        results.append(result)
-    return results
+def check_all_services_health(
+    registry, deadline: float = HEALTH_OVERALL_DEADLINE
+) -> list[HealthAggregate]:
+    """Check health for all registered services concurrently."""
+    services = list(registry.load().services.values())
+    checker = AsyncHealthChecker(deadline=deadline)
+    return asyncio.run(checker.check_services(services))
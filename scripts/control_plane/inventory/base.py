@@ -3,12 +3,15 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from ..docker_api import DockerCLI, DockerEngineClient, get_docker
 from ..models import CollectorResult
 
 
 class BaseCollector(ABC):
     """Base class for inventory collectors."""
 
+    docker: DockerEngineClient | DockerCLI | None = None
+
     @abstractmethod
     def name(self) -> str:
         """Return the collector name."""
@@ -22,3 +25,7 @@ class BaseCollector(ABC):
     def supports(self, scope: str) -> bool:
         """Check if this collector supports the given scope."""
         return True
+
+    def docker_client(self) -> DockerEngineClient | DockerCLI:
+        """Return the Docker backend chosen for this collector."""
+        return self.docker or get_docker()
@@ -0,0 +1,55 @@
+"""Inventory scope catalog shared by platformctl and the daemon."""
+
+from ..docker_api import DockerCLI, DockerEngineClient
+from .auth import AuthCollector
+from .base import BaseCollector
+from .database import DatabaseCollector
+from .docker_runtime import DockerRuntimeCollector
+from .messaging import MessagingCollector
+from .redis_runtime import RedisRuntimeCollector
+from .secrets import SecretsCollector
+from .services import ServicesCollector
+from .storage import StorageCollector
+
+INVENTORY_SCOPES = [
+    "all",
+    "services",
+    "infra",
+    "redis",
+    "db",
+    "messaging",
+    "storage",
+    "auth",
+    "secrets",
+]
+
+
+def build_collectors(
+    registry, docker: DockerEngineClient | DockerCLI | None = None
+) -> dict[str, BaseCollector]:
+    """Build one collector per inventory scope."""
+    return {
+        "services": ServicesCollector(registry),
+        "infra": DockerRuntimeCollector(docker=docker),
+        "redis": RedisRuntimeCollector(docker=docker),
+        "db": DatabaseCollector(docker=docker),
+        "messaging": MessagingCollector(docker=docker),
+        "storage": StorageCollector(docker=docker),
+        "auth": AuthCollector(registry=registry),
+        "secrets": SecretsCollector(),
+    }
+
+
+def select_collectors(
+    collectors: dict[str, BaseCollector], scope: str
+) -> dict[str, BaseCollector]:
+    """Select the collectors that make up an inventory scope.
+
+    Raises:
+        KeyError: If the scope is unknown
+    """
+    if scope == "all":
+        return dict(collectors)
+    if scope == "infra":
+        return {"infra": collectors["infra"], "redis": collectors["redis"]}
+    return {scope: collectors[scope]}
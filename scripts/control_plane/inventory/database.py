@@ -1,19 +1,26 @@
 """Database inventory collector."""
 
-import subprocess
+import json
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from ..docker_api import DockerCLI, DockerEngineClient
 from ..models import CollectorResult
+from ..pg_client import PgConnectError, PgError, PgPool, get_pg_pool
 from .base import BaseCollector
 
 
 class DatabaseCollector(BaseCollector):
     """Collect database ownership information."""
 
-    def __init__(self, ownership_path: Path | None = None):
+    def __init__(
+        self,
+        ownership_path: Path | None = None,
+        docker: DockerEngineClient | DockerCLI | None = None,
+        pg: PgPool | None = None,
+    ):
         if ownership_path is None:
             ownership_path = (
                 Path(__file__).parent.parent.parent.parent
@@ -22,6 +29,8 @@ class DatabaseCollector(BaseCollector):
                 / "database.yaml"
             )
         self.ownership_path = ownership_path
+        self.docker = docker
+        self.pg = pg
 
     def name(self) -> str:
         return "database"
@@ -32,24 +41,48 @@ class DatabaseCollector(BaseCollector):
             ownership = self._load_ownership()
             services = ownership.get("services", {})
             reset_scopes = ownership.get("reset_scopes", {})
-            reachable = self._is_db_reachable()
+
+            declared: list[tuple[str, str, str]] = []
+            for spec in services.values():
+                schema = spec.get("schema", "fraud_gov")
+                declared.extend((schema, "table", name) for name in spec.get("tables", []))
+                declared.extend((schema, "index", name) for name in spec.get("indices", []))
+            catalog = self._fetch_catalog(declared)
+            reachable = catalog is not None
 
             table_ownership: dict[str, Any] = {}
             for service_name, spec in services.items():
+                schema = spec.get("schema", "fraud_gov")
                 declared_tables = spec.get("tables", [])
                 declared_indices = spec.get("indices", [])
-                table_ownership[service_name] = {
-                    "schema": spec.get("schema", "fraud_gov"),
+                entry: dict[str, Any] = {
+                    "schema": schema,
                     "declared_tables": len(declared_tables),
                     "declared_indices": len(declared_indices),
                     "reachable": reachable,
-                    "existing_tables": self._count_existing_tables(declared_tables)
-                    if reachable
-                    else None,
-                    "existing_indices": self._count_existing_indices(declared_indices)
-                    if reachable
-                    else None,
+                    "existing_tables": None,
+                    "existing_indices": None,
                 }
+                if catalog is not None:
+                    tables = {
+                        name: catalog.get((schema, "table", name), False)
+                        for name in declared_tables
+                    }
+                    indices = {
+                        name: catalog.get((schema, "index", name), False)
+                        for name in declared_indices
+                    }
+                    entry.update(
+                        {
+                            "existing_tables": sum(tables.values()),
+                            "existing_indices": sum(indices.values()),
+                            "tables": tables,
+                            "indices": indices,
+                            "missing_tables": [n for n, present in tables.items() if not present],
+                            "missing_indices": [n for n, present in indices.items() if not present],
+                        }
+                    )
+                table_ownership[service_name] = entry
 
             return CollectorResult(
                 collector=self.name(),
@@ -68,81 +101,130 @@ class DatabaseCollector(BaseCollector):
                 error=str(e),
             )
 
-    def _is_db_reachable(self) -> bool:
-        """Check if PostgreSQL is reachable."""
+    def _load_ownership(self) -> dict[str, Any]:
+        if not self.ownership_path.exists():
+            return {}
+        with open(self.ownership_path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+
+    def _fetch_catalog(
+        self, declared: list[tuple[str, str, str]]
+    ) -> dict[tuple[str, str, str], bool] | None:
+        """Check presence of every declared table and index in one query.
+
+        Returns a ``(schema, kind, name) -> present`` map, or None when
+        PostgreSQL is not reachable.
+        """
+        if not declared:
+            rows = self._run_query("SELECT 1 AS ok")
+            return {} if rows is not None else None
+
+        values = ", ".join(
+            f"({sql_literal(schema)}, {sql_literal(kind)}, {sql_literal(name)})"
+            for schema, kind, name in declared
+        )
+        sql = (
+            f"WITH declared(schema_name, kind, name) AS (VALUES {values}) "
+            "SELECT d.schema_name, d.kind, d.name, EXISTS ("
+            "SELECT 1 FROM pg_catalog.pg_class c "
+            "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = d.schema_name AND c.relname = d.name "
+            "AND ((d.kind = 'table' AND c.relkind IN ('r', 'p')) "
+            "OR (d.kind = 'index' AND c.relkind IN ('i', 'I')))"
+            ") AS present FROM declared d"
+        )
+        rows = self._run_query(sql)
+        if rows is None:
+            return None
+        return {
+            (row["schema_name"], row["kind"], row["name"]): bool(row["present"])
+            for row in rows
+        }
+
+    def _run_query(self, sql: str) -> list[dict[str, Any]] | None:
+        """Run a SELECT and return typed rows (None when PostgreSQL is unreachable).
+
+        Uses the native connection pool when admin credentials are available
+        and falls back to ``docker exec ... psql`` when no credentials are set
+        or the connection cannot be opened. A query that times out or is cut
+        off raises ``PgError`` instead: re-running it through ``psql`` would
+        double the load on the database being measured. Errors reported by
+        the server for the query itself also raise ``PgError`` so collectors
+        show the message rather than "not reachable".
+        """
+        pool = self.pg or get_pg_pool()
+        if pool is not None:
+            try:
+                return pool.query(sql)
+            except PgConnectError:
+                # Port not published or server down; try through the container.
+                pass
+            except OSError as e:
+                raise PgError(f"PostgreSQL query failed: {e}") from e
+        return self._run_psql_query(sql)
+
+    def _execute(self, sql: str) -> bool:
+        """Run a statement that returns no rows (e.g. DDL); True on success.
+
+        Like ``_run_query``, a statement the server rejects raises ``PgError``.
+        """
+        pool = self.pg or get_pg_pool()
+        if pool is not None:
+            try:
+                pool.query(sql)
+                return True
+            except PgConnectError:
+                pass
+            except OSError as e:
+                raise PgError(f"PostgreSQL statement failed: {e}") from e
         try:
-            result = subprocess.run(
+            result = self.docker_client().exec_run(
+                "card-fraud-postgres",
                 [
-                    "docker",
-                    "exec",
-                    "card-fraud-postgres",
                     "psql",
                     "-U",
                     "postgres",
                     "-d",
                     "fraud_gov",
+                    "-X",
+                    "-v",
+                    "ON_ERROR_STOP=1",
                     "-c",
-                    "SELECT 1",
+                    sql,
                 ],
-                capture_output=True,
-                timeout=10,
+                timeout=15,
             )
             return result.returncode == 0
         except Exception:
             return False
 
-    def _load_ownership(self) -> dict[str, Any]:
-        if not self.ownership_path.exists():
-            return {}
-        with open(self.ownership_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
-
-    def _count_existing_tables(self, table_names: list[str]) -> int | None:
-        if not table_names:
-            return 0
-        quoted_tables = ", ".join(f"'{name}'" for name in table_names)
-        sql = (
-            "SELECT COUNT(*) FROM information_schema.tables "
-            "WHERE table_schema = 'fraud_gov' "
-            f"AND table_name IN ({quoted_tables});"
-        )
-        return self._run_scalar_query(sql)
-
-    def _count_existing_indices(self, index_names: list[str]) -> int | None:
-        if not index_names:
-            return 0
-        quoted_indices = ", ".join(f"'{name}'" for name in index_names)
-        sql = (
-            "SELECT COUNT(*) FROM pg_indexes "
-            "WHERE schemaname = 'fraud_gov' "
-            f"AND indexname IN ({quoted_indices});"
-        )
-        return self._run_scalar_query(sql)
-
-    def _run_scalar_query(self, sql: str) -> int | None:
+    def _run_psql_query(self, sql: str) -> list[dict[str, Any]] | None:
+        """Run a SELECT through psql in the container, decoding rows via JSON."""
         try:
-            result = subprocess.run(
+            result = self.docker_client().exec_run(
+                "card-fraud-postgres",
                 [
-                    "docker",
-                    "exec",
-                    "card-fraud-postgres",
                     "psql",
                     "-U",
                     "postgres",
                     "-d",
                     "fraud_gov",
+                    "-X",
+                    "-v",
+                    "ON_ERROR_STOP=1",
                     "-t",
                     "-A",
                     "-c",
-                    sql,
+                    f"SELECT COALESCE(json_agg(q), '[]'::json) FROM ({sql}) q",
                 ],
-                capture_output=True,
-                text=True,
                 timeout=15,
             )
             if result.returncode != 0:
                 return None
-            output = result.stdout.strip()
-            return int(output) if output else 0
+            return json.loads(result.stdout.strip() or "[]")
         except Exception:
             return None
+
+
+def sql_literal(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
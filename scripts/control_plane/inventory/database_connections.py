@@ -0,0 +1,147 @@
+"""Connection saturation collector from pg_stat_activity."""
+
+from datetime import datetime, timezone
+from typing import Any
+
+from ..models import CollectorResult
+from .database import DatabaseCollector
+
+# Share of usable connections (max_connections minus reserved slots) above
+# which the pool is reported as saturated.
+SATURATION_RATIO = 0.8
+LONGEST_TRANSACTIONS = 5
+
+SETTINGS_SQL = """
+SELECT current_setting('max_connections')::int AS max_connections,
+       current_setting('superuser_reserved_connections')::int AS reserved_connections
+"""
+
+ACTIVITY_SQL = """
+SELECT pid,
+       datname AS database,
+       usename AS user_name,
+       application_name,
+       state,
+       wait_event_type,
+       wait_event,
+       EXTRACT(EPOCH FROM now() - xact_start)::float8 AS xact_seconds,
+       EXTRACT(EPOCH FROM now() - state_change)::float8 AS state_seconds,
+       CASE WHEN wait_event_type = 'Lock' THEN pg_blocking_pids(pid)::text END AS blocked_by,
+       left(query, 200) AS query
+FROM pg_catalog.pg_stat_activity
+WHERE backend_type = 'client backend'
+  AND pid <> pg_backend_pid()
+"""
+
+
+class DatabaseConnectionCollector(DatabaseCollector):
+    """Sample pg_stat_activity and compare connection use with max_connections."""
+
+    def name(self) -> str:
+        return "database-connections"
+
+    def collect(self, context: dict[str, Any] | None = None) -> CollectorResult:
+        """Group client backends by user/application, state and wait event."""
+        try:
+            settings = self._run_query(SETTINGS_SQL)
+            backends = self._run_query(ACTIVITY_SQL)
+            if not settings or backends is None:
+                return CollectorResult(
+                    collector=self.name(),
+                    success=False,
+                    error="PostgreSQL is not reachable",
+                )
+            return CollectorResult(
+                collector=self.name(),
+                success=True,
+                data=summarize_activity(settings[0], backends),
+            )
+
+        except Exception as e:
+            return CollectorResult(
+                collector=self.name(),
+                success=False,
+                error=str(e),
+            )
+
+
+def summarize_activity(
+    settings: dict[str, Any], backends: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Aggregate pg_stat_activity rows into a saturation report."""
+    max_connections = int(settings["max_connections"])
+    reserved = int(settings.get("reserved_connections") or 0)
+    usable = max(max_connections - reserved, 1)
+    # The sampling connection itself is excluded from the rows but still
+    # holds a slot.
+    in_use = len(backends) + 1
+
+    by_application: dict[str, dict[str, int]] = {}
+    by_state: dict[str, int] = {}
+    by_wait_event: dict[str, int] = {}
+    lock_waits: list[dict[str, Any]] = []
+    for backend in backends:
+        state = backend.get("state") or "unknown"
+        client = f"{backend.get('user_name') or '?'}/{backend.get('application_name') or '-'}"
+        counts = by_application.setdefault(client, {"total": 0})
+        counts["total"] += 1
+        counts[state] = counts.get(state, 0) + 1
+        by_state[state] = by_state.get(state, 0) + 1
+
+        # Idle backends always wait on ClientRead; only busy ones are interesting.
+        if state != "idle" and backend.get("wait_event"):
+            event = f"{backend.get('wait_event_type')}:{backend['wait_event']}"
+            by_wait_event[event] = by_wait_event.get(event, 0) + 1
+        if backend.get("wait_event_type") == "Lock":
+            lock_waits.append(
+                {
+                    **_backend_entry(backend),
+                    "wait_event": backend.get("wait_event"),
+                    "waiting_seconds": _seconds(backend.get("state_seconds")),
+                    "blocked_by": _parse_pids(backend.get("blocked_by")),
+                }
+            )
+
+    in_transaction = [b for b in backends if b.get("xact_seconds") is not None]
+    in_transaction.sort(key=lambda b: b["xact_seconds"], reverse=True)
+
+    return {
+        "sampled_at": datetime.now(timezone.utc).isoformat(),
+        "max_connections": max_connections,
+        "reserved_connections": reserved,
+        "connections_in_use": in_use,
+        "utilization": round(in_use / usable, 4),
+        "saturated": in_use / usable >= SATURATION_RATIO,
+        "idle_in_transaction": by_state.get("idle in transaction", 0)
+        + by_state.get("idle in transaction (aborted)", 0),
+        "by_state": dict(sorted(by_state.items(), key=lambda item: -item[1])),
+        "by_application": dict(
+            sorted(by_application.items(), key=lambda item: -item[1]["total"])
+        ),
+        "by_wait_event": dict(sorted(by_wait_event.items(), key=lambda item: -item[1])),
+        "longest_transactions": [
+            {**_backend_entry(b), "xact_seconds": _seconds(b["xact_seconds"])}
+            for b in in_transaction[:LONGEST_TRANSACTIONS]
+        ],
+        "lock_waits": sorted(lock_waits, key=lambda w: -w["waiting_seconds"]),
+    }
+
+
+def _backend_entry(backend: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "pid": backend.get("pid"),
+        "user": backend.get("user_name"),
+        "application": backend.get("application_name") or None,
+        "state": backend.get("state"),
+        "query": " ".join((backend.get("query") or "").split()),
+    }
+
+
+def _seconds(value: Any) -> float:
+    return round(float(value or 0.0), 3)
+
+
+def _parse_pids(value: str | None) -> list[int]:
+    if not value:
+        return []
+    return [int(pid) for pid in value.strip("{}").split(",") if pid]
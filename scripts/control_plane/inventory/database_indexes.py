@@ -0,0 +1,158 @@
+"""Index usage analyzer for declared database ownership."""
+
+from typing import Any
+
+from ..models import CollectorResult
+from .database import DatabaseCollector, sql_literal
+from .database_stats import format_bytes
+
+# Tables at least this large that are mostly read by sequential scans are
+# reported as candidates for a missing index.
+LARGE_TABLE_ROWS = 10_000
+SEQ_SCAN_RATIO_THRESHOLD = 0.5
+
+INDEX_USAGE_SQL = """
+SELECT s.schemaname AS schema_name,
+       s.relname AS table_name,
+       s.indexrelname AS index_name,
+       s.idx_scan,
+       pg_relation_size(s.indexrelid) AS index_bytes,
+       i.indisunique AS is_unique,
+       i.indisprimary AS is_primary
+FROM pg_catalog.pg_stat_user_indexes s
+JOIN pg_catalog.pg_index i ON i.indexrelid = s.indexrelid
+WHERE s.schemaname IN ({schemas})
+"""
+
+TABLE_SCAN_SQL = """
+SELECT schemaname AS schema_name,
+       relname AS table_name,
+       n_live_tup AS live_tuples,
+       seq_scan,
+       seq_tup_read,
+       COALESCE(idx_scan, 0) AS idx_scan
+FROM pg_catalog.pg_stat_user_tables
+WHERE schemaname IN ({schemas})
+"""
+
+
+class DatabaseIndexCollector(DatabaseCollector):
+    """Compare index and scan statistics against declared index ownership."""
+
+    def name(self) -> str:
+        return "database-indexes"
+
+    def collect(self, context: dict[str, Any] | None = None) -> CollectorResult:
+        """Report unused, undeclared and missing indices per owning service."""
+        try:
+            services = self._load_ownership().get("services", {})
+            schemas = sorted({spec.get("schema", "fraud_gov") for spec in services.values()})
+            schema_list = ", ".join(sql_literal(s) for s in schemas or ["fraud_gov"])
+
+            index_rows = self._run_query(INDEX_USAGE_SQL.format(schemas=schema_list))
+            table_rows = self._run_query(TABLE_SCAN_SQL.format(schemas=schema_list))
+            if index_rows is None or table_rows is None:
+                return CollectorResult(
+                    collector=self.name(),
+                    success=False,
+                    error="PostgreSQL is not reachable",
+                )
+
+            indexes = {(row["schema_name"], row["index_name"]): row for row in index_rows}
+            tables = {(row["schema_name"], row["table_name"]): row for row in table_rows}
+            declared_indices = {
+                (spec.get("schema", "fraud_gov"), index)
+                for spec in services.values()
+                for index in spec.get("indices", [])
+            }
+            table_owner = {
+                (spec.get("schema", "fraud_gov"), table): service_name
+                for service_name, spec in services.items()
+                for table in spec.get("tables", [])
+            }
+
+            by_service: dict[str, Any] = {}
+            for service_name, spec in services.items():
+                schema = spec.get("schema", "fraud_gov")
+                unused: list[dict[str, Any]] = []
+                missing: list[str] = []
+                for index in spec.get("indices", []):
+                    row = indexes.get((schema, index))
+                    if row is None:
+                        missing.append(index)
+                    elif int(row.get("idx_scan") or 0) == 0:
+                        unused.append(_index_entry(row))
+                by_service[service_name] = {
+                    "schema": schema,
+                    "unused_indices": unused,
+                    "missing_indices": missing,
+                    "undeclared_indices": [],
+                    "seq_scan_hotspots": [],
+                }
+
+            undeclared: list[dict[str, Any]] = []
+            for key, row in sorted(indexes.items()):
+                # Primary keys are created implicitly and never declared.
+                if key in declared_indices or row.get("is_primary"):
+                    continue
+                owner = table_owner.get((row["schema_name"], row["table_name"]))
+                if owner is None:
+                    undeclared.append(_index_entry(row))
+                else:
+                    by_service[owner]["undeclared_indices"].append(_index_entry(row))
+
+            for key, row in sorted(tables.items()):
+                hotspot = _seq_scan_hotspot(row)
+                owner = table_owner.get(key)
+                if hotspot is not None and owner is not None:
+                    by_service[owner]["seq_scan_hotspots"].append(hotspot)
+
+            return CollectorResult(
+                collector=self.name(),
+                success=True,
+                data={
+                    "services": by_service,
+                    "unowned_undeclared_indices": undeclared,
+                    "thresholds": {
+                        "large_table_rows": LARGE_TABLE_ROWS,
+                        "seq_scan_ratio": SEQ_SCAN_RATIO_THRESHOLD,
+                    },
+                },
+            )
+
+        except Exception as e:
+            return CollectorResult(
+                collector=self.name(),
+                success=False,
+                error=str(e),
+            )
+
+
+def _index_entry(row: dict[str, Any]) -> dict[str, Any]:
+    size = int(row.get("index_bytes") or 0)
+    return {
+        "index": row["index_name"],
+        "table": row["table_name"],
+        "idx_scan": int(row.get("idx_scan") or 0),
+        "size": format_bytes(size),
+        "unique": bool(row.get("is_unique")),
+    }
+
+
+def _seq_scan_hotspot(row: dict[str, Any]) -> dict[str, Any] | None:
+    live = int(row.get("live_tuples") or 0)
+    seq_scan = int(row.get("seq_scan") or 0)
+    idx_scan = int(row.get("idx_scan") or 0)
+    if live < LARGE_TABLE_ROWS or seq_scan + idx_scan == 0:
+        return None
+    ratio = seq_scan / (seq_scan + idx_scan)
+    if ratio < SEQ_SCAN_RATIO_THRESHOLD:
+        return None
+    return {
+        "table": row["table_name"],
+        "live_tuples": live,
+        "seq_scan": seq_scan,
+        "seq_tup_read": int(row.get("seq_tup_read") or 0),
+        "idx_scan": idx_scan,
+        "seq_scan_ratio": round(ratio, 4),
+    }
@@ -0,0 +1,234 @@
+"""Top-query report per owning service from pg_stat_statements."""
+
+import re
+import time
+from typing import Any
+
+from ..models import CollectorResult
+from ..pg_client import PgError
+from .database import DatabaseCollector
+
+DEFAULT_TOP_QUERIES = 10
+QUERY_TEXT_LIMIT = 200
+
+EXTENSION_SQL = """
+SELECT EXISTS (
+    SELECT 1 FROM pg_catalog.pg_extension WHERE extname = 'pg_stat_statements'
+) AS installed
+"""
+
+PRELOAD_SQL = "SELECT current_setting('shared_preload_libraries') AS libraries"
+
+STATEMENTS_SQL = """
+SELECT r.rolname AS role_name,
+       s.queryid,
+       s.query,
+       s.calls,
+       s.total_exec_time,
+       s.rows,
+       s.shared_blks_hit,
+       s.shared_blks_read
+FROM pg_stat_statements s
+JOIN pg_catalog.pg_roles r ON r.oid = s.userid
+JOIN pg_catalog.pg_database d ON d.oid = s.dbid
+WHERE d.datname = current_database()
+"""
+
+_COUNTERS = ("calls", "total_exec_time", "rows", "shared_blks_hit", "shared_blks_read")
+_ORDERINGS = {
+    "top_by_total_time": "total_time_ms",
+    "top_by_mean_time": "mean_time_ms",
+    "top_by_calls": "calls",
+    "top_by_rows": "rows",
+}
+
+
+class DatabaseQueryCollector(DatabaseCollector):
+    """Report the most expensive statements and the service that issued them.
+
+    pg_stat_statements only records the role, and the application services
+    share ``fraud_gov_app_user``, so statements are attributed by role when
+    the role maps to a single service in ``database.yaml`` and otherwise by
+    the owner of the first declared table the statement references.
+
+    With ``window`` set, two snapshots are taken ``window`` seconds apart and
+    only the activity in between is reported.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        top: int = DEFAULT_TOP_QUERIES,
+        window: float | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.top = top
+        self.window = window
+
+    def name(self) -> str:
+        return "database-queries"
+
+    def collect(self, context: dict[str, Any] | None = None) -> CollectorResult:
+        """Collect the top statements by time, calls and rows."""
+        try:
+            installed = self._run_query(EXTENSION_SQL)
+            if installed is None:
+                return self._failure("PostgreSQL is not reachable")
+            if not installed or not installed[0]["installed"]:
+                return self._failure(
+                    "pg_stat_statements is not enabled; "
+                    "run 'platformctl db enable-query-stats'"
+                )
+
+            before = self._snapshot()
+            if before is None:
+                return self._failure("Could not read pg_stat_statements")
+            if self.window:
+                time.sleep(self.window)
+                after = self._snapshot()
+                if after is None:
+                    return self._failure("Could not read pg_stat_statements")
+                rows = statement_deltas(before, after)
+            else:
+                rows = list(before.values())
+
+            ownership = self._load_ownership()
+            attribute = StatementAttributor(ownership)
+            statements = [_statement_entry(row, attribute(row)) for row in rows]
+
+            by_service: dict[str, dict[str, Any]] = {}
+            for entry in statements:
+                totals = by_service.setdefault(
+                    entry["service"],
+                    {"statements": 0, "calls": 0, "total_time_ms": 0.0, "rows": 0},
+                )
+                totals["statements"] += 1
+                totals["calls"] += entry["calls"]
+                totals["total_time_ms"] += entry["total_time_ms"]
+                totals["rows"] += entry["rows"]
+            for totals in by_service.values():
+                totals["total_time_ms"] = round(totals["total_time_ms"], 3)
+
+            data: dict[str, Any] = {
+                "window_seconds": self.window,
+                "services": dict(
+                    sorted(by_service.items(), key=lambda item: -item[1]["total_time_ms"])
+                ),
+            }
+            for section, field in _ORDERINGS.items():
+                data[section] = sorted(statements, key=lambda e: e[field], reverse=True)[
+                    : self.top
+                ]
+            return CollectorResult(collector=self.name(), success=True, data=data)
+
+        except Exception as e:
+            return self._failure(str(e))
+
+    def enable_extension(self) -> tuple[bool, str]:
+        """Create the pg_stat_statements extension in fraud_gov."""
+        try:
+            rows = self._run_query(PRELOAD_SQL)
+            if rows is None:
+                return False, "PostgreSQL is not reachable"
+            libraries = rows[0]["libraries"] if rows else ""
+            if "pg_stat_statements" not in libraries:
+                return False, (
+                    "pg_stat_statements is not in shared_preload_libraries; recreate the "
+                    "postgres container to pick up the compose command "
+                    "(docker compose up -d --force-recreate postgres)"
+                )
+            if not self._execute("CREATE EXTENSION IF NOT EXISTS pg_stat_statements"):
+                return False, "CREATE EXTENSION pg_stat_statements failed"
+        except PgError as e:
+            return False, f"CREATE EXTENSION pg_stat_statements failed: {e}"
+        return True, "pg_stat_statements is enabled in fraud_gov"
+
+    def _snapshot(self) -> dict[tuple[str, int], dict[str, Any]] | None:
+        rows = self._run_query(STATEMENTS_SQL)
+        if rows is None:
+            return None
+        snapshot: dict[tuple[str, int], dict[str, Any]] = {}
+        for row in rows:
+            key = (row["role_name"], row["queryid"])
+            existing = snapshot.get(key)
+            if existing is None:
+                snapshot[key] = dict(row)
+            else:
+                # Top-level and nested executions of the same statement.
+                for counter in _COUNTERS:
+                    existing[counter] = (existing.get(counter) or 0) + (row.get(counter) or 0)
+        return snapshot
+
+    def _failure(self, error: str) -> CollectorResult:
+        return CollectorResult(collector=self.name(), success=False, error=error)
+
+
+class StatementAttributor:
+    """Map a pg_stat_statements row to the service that issued it."""
+
+    def __init__(self, ownership: dict[str, Any]):
+        self.role_services = {
+            role: spec.get("services", [])
+            for role, spec in (ownership.get("roles") or {}).items()
+        }
+        self.table_owners: dict[str, str] = {}
+        for service_name, spec in (ownership.get("services") or {}).items():
+            for table in spec.get("tables", []):
+                self.table_owners[table] = service_name
+        names = sorted(self.table_owners, key=len, reverse=True)
+        self._tables = (
+            re.compile(r"\b(" + "|".join(re.escape(n) for n in names) + r")\b")
+            if names
+            else None
+        )
+
+    def __call__(self, row: dict[str, Any]) -> str:
+        candidates = self.role_services.get(row.get("role_name") or "", [])
+        if len(candidates) == 1:
+            return candidates[0]
+        if self._tables is not None:
+            for match in self._tables.finditer(row.get("query") or ""):
+                owner = self.table_owners[match.group(1)]
+                if not candidates or owner in candidates:
+                    return owner
+        return "unattributed"
+
+
+def statement_deltas(
+    before: dict[tuple[str, int], dict[str, Any]],
+    after: dict[tuple[str, int], dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Subtract two snapshots, keeping statements that ran in between."""
+    deltas = []
+    for key, row in after.items():
+        previous = before.get(key)
+        delta = dict(row)
+        # A statement evicted or reset in between restarts its counters.
+        if previous is not None and (row.get("calls") or 0) >= (previous.get("calls") or 0):
+            for counter in _COUNTERS:
+                delta[counter] = (row.get(counter) or 0) - (previous.get(counter) or 0)
+        if (delta.get("calls") or 0) > 0:
+            deltas.append(delta)
+    return deltas
+
+
+def _statement_entry(row: dict[str, Any], service: str) -> dict[str, Any]:
+    calls = int(row.get("calls") or 0)
+    total = float(row.get("total_exec_time") or 0.0)
+    hit = int(row.get("shared_blks_hit") or 0)
+    read = int(row.get("shared_blks_read") or 0)
+    query = " ".join((row.get("query") or "").split())
+    if len(query) > QUERY_TEXT_LIMIT:
+        query = query[: QUERY_TEXT_LIMIT - 3] + "..."
+    return {
+        "service": service,
+        "role": row.get("role_name"),
+        "queryid": row.get("queryid"),
+        "calls": calls,
+        "total_time_ms": round(total, 3),
+        "mean_time_ms": round(total / calls, 3) if calls else 0.0,
+        "rows": int(row.get("rows") or 0),
+        "cache_hit_ratio": round(hit / (hit + read), 4) if hit + read else None,
+        "query": query,
+    }
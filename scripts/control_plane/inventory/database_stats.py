@@ -0,0 +1,138 @@
+"""Per-owner table size, bloat and scan statistics collector."""
+
+from datetime import datetime
+from typing import Any
+
+from ..models import CollectorResult
+from .database import DatabaseCollector, sql_literal
+
+TABLE_STATS_SQL = """
+SELECT s.schemaname AS schema_name,
+       s.relname AS table_name,
+       c.reltuples::bigint AS row_estimate,
+       s.n_live_tup AS live_tuples,
+       s.n_dead_tup AS dead_tuples,
+       pg_relation_size(c.oid) AS heap_bytes,
+       pg_indexes_size(c.oid) AS index_bytes,
+       COALESCE(pg_total_relation_size(NULLIF(c.reltoastrelid, 0)), 0) AS toast_bytes,
+       s.seq_scan,
+       s.seq_tup_read,
+       COALESCE(s.idx_scan, 0) AS idx_scan,
+       s.last_autovacuum,
+       s.last_vacuum,
+       s.last_autoanalyze,
+       s.last_analyze
+FROM pg_catalog.pg_stat_user_tables s
+JOIN pg_catalog.pg_class c ON c.oid = s.relid
+WHERE s.schemaname IN ({schemas})
+"""
+
+
+class DatabaseStatsCollector(DatabaseCollector):
+    """Collect table size, dead tuple and scan statistics grouped by owner."""
+
+    def name(self) -> str:
+        return "database-stats"
+
+    def collect(self, context: dict[str, Any] | None = None) -> CollectorResult:
+        """Collect per-table statistics for every declared table."""
+        try:
+            services = self._load_ownership().get("services", {})
+            schemas = sorted({spec.get("schema", "fraud_gov") for spec in services.values()})
+            rows = self._run_query(
+                TABLE_STATS_SQL.format(
+                    schemas=", ".join(sql_literal(s) for s in schemas or ["fraud_gov"])
+                )
+            )
+            if rows is None:
+                return CollectorResult(
+                    collector=self.name(),
+                    success=False,
+                    error="PostgreSQL is not reachable",
+                )
+
+            stats = {(row["schema_name"], row["table_name"]): row for row in rows}
+            declared: set[tuple[str, str]] = set()
+            by_service: dict[str, Any] = {}
+            for service_name, spec in services.items():
+                schema = spec.get("schema", "fraud_gov")
+                tables: dict[str, Any] = {}
+                missing: list[str] = []
+                for table in spec.get("tables", []):
+                    declared.add((schema, table))
+                    row = stats.get((schema, table))
+                    if row is None:
+                        missing.append(table)
+                        continue
+                    tables[table] = _table_stats(row)
+                by_service[service_name] = {
+                    "schema": schema,
+                    "total_bytes": sum(t["total_bytes"] for t in tables.values()),
+                    "total_size": format_bytes(sum(t["total_bytes"] for t in tables.values())),
+                    "tables": tables,
+                    "missing_tables": missing,
+                }
+
+            undeclared = sorted(
+                f"{schema}.{table}" for schema, table in stats if (schema, table) not in declared
+            )
+            return CollectorResult(
+                collector=self.name(),
+                success=True,
+                data={"services": by_service, "undeclared_tables": undeclared},
+            )
+
+        except Exception as e:
+            return CollectorResult(
+                collector=self.name(),
+                success=False,
+                error=str(e),
+            )
+
+
+def _table_stats(row: dict[str, Any]) -> dict[str, Any]:
+    live = int(row.get("live_tuples") or 0)
+    dead = int(row.get("dead_tuples") or 0)
+    seq_scan = int(row.get("seq_scan") or 0)
+    idx_scan = int(row.get("idx_scan") or 0)
+    heap = int(row.get("heap_bytes") or 0)
+    index = int(row.get("index_bytes") or 0)
+    toast = int(row.get("toast_bytes") or 0)
+    row_estimate = int(row.get("row_estimate") or 0)
+    return {
+        # reltuples is -1 until the table is first analyzed.
+        "row_estimate": row_estimate if row_estimate >= 0 else live,
+        "heap_bytes": heap,
+        "index_bytes": index,
+        "toast_bytes": toast,
+        "total_bytes": heap + index + toast,
+        "total_size": format_bytes(heap + index + toast),
+        "dead_tuple_ratio": round(dead / (live + dead), 4) if live + dead else 0.0,
+        "seq_scan": seq_scan,
+        "seq_tup_read": int(row.get("seq_tup_read") or 0),
+        "idx_scan": idx_scan,
+        "seq_scan_ratio": round(seq_scan / (seq_scan + idx_scan), 4)
+        if seq_scan + idx_scan
+        else 0.0,
+        "last_autovacuum": _timestamp(row.get("last_autovacuum")),
+        "last_vacuum": _timestamp(row.get("last_vacuum")),
+        "last_autoanalyze": _timestamp(row.get("last_autoanalyze")),
+        "last_analyze": _timestamp(row.get("last_analyze")),
+    }
+
+
+def _timestamp(value: Any) -> str | None:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("kB", "MB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
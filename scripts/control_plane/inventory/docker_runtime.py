@@ -3,6 +3,7 @@
 import subprocess
 from typing import Any
 
+from ..docker_api import DockerCLI, DockerEngineClient
 from ..models import CollectorResult
 from .base import BaseCollector
 
@@ -10,38 +11,45 @@ from .base import BaseCollector
 class DockerRuntimeCollector(BaseCollector):
     """Collect Docker container runtime information."""
 
+    def __init__(self, docker: DockerEngineClient | DockerCLI | None = None):
+        self.docker = docker
+
     def name(self) -> str:
         return "docker-runtime"
 
     def collect(self, context: dict[str, Any] | None = None) -> CollectorResult:
         """Collect Docker runtime data."""
         try:
-            result = subprocess.run(
-                ["docker", "ps", "-a", "--format", "{{.Names}}|{{.Status}}|{{.Ports}}"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if result.returncode != 0:
-                return CollectorResult(
-                    collector=self.name(),
-                    success=False,
-                    error=result.stderr,
+            docker = self.docker_client()
+            if isinstance(docker, DockerEngineClient):
+                containers = self._list_engine_containers(docker)
+            else:
+                result = subprocess.run(
+                    ["docker", "ps", "-a", "--format", "{{.Names}}|{{.Status}}|{{.Ports}}"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10,
                 )
 
-            containers = []
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    parts = line.split("|")
-                    containers.append(
-                        {
-                            "name": parts[0] if len(parts) > 0 else "",
-                            "status": parts[1] if len(parts) > 1 else "",
-                            "ports": parts[2] if len(parts) > 2 else "",
-                        }
+                if result.returncode != 0:
+                    return CollectorResult(
+                        collector=self.name(),
+                        success=False,
+                        error=result.stderr,
                     )
 
+                containers = []
+                for line in result.stdout.strip().split("\n"):
+                    if line:
+                        parts = line.split("|")
+                        containers.append(
+                            {
+                                "name": parts[0] if len(parts) > 0 else "",
+                                "status": parts[1] if len(parts) > 1 else "",
+                                "ports": parts[2] if len(parts) > 2 else "",
+                            }
+                        )
+
             return CollectorResult(
                 collector=self.name(),
                 success=True,
@@ -57,3 +65,23 @@ class DockerRuntimeCollector(BaseCollector):
 
     def supports(self, scope: str) -> bool:
         return scope in ("all", "infra", "docker")
+
+    def _list_engine_containers(self, docker: DockerEngineClient) -> list[dict[str, str]]:
+        containers = []
+        for container in docker.list_containers(include_stopped=True):
+            names = container.get("Names") or [""]
+            ports = []
+            for port in container.get("Ports") or []:
+                target = f"{port.get('PrivatePort')}/{port.get('Type', 'tcp')}"
+                if port.get("PublicPort"):
+                    ports.append(f"{port.get('IP', '')}:{port['PublicPort']}->{target}")
+                else:
+                    ports.append(target)
+            containers.append(
+                {
+                    "name": names[0].lstrip("/"),
+                    "status": container.get("Status", ""),
+                    "ports": ", ".join(ports),
+                }
+            )
+        return containers
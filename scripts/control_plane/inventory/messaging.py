@@ -1,19 +1,30 @@
 """Messaging (Kafka) inventory collector."""
 
-import subprocess
+import struct
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from ..docker_api import DockerCLI, DockerEngineClient
+from ..kafka_client import KafkaAdminClient, KafkaError, get_kafka_admin
 from ..models import CollectorResult
+from ..topic_conformance import TopicPlan, check_topic, plan_topic_changes
+from ..topic_throughput import DEFAULT_DLQ_ENVIRONMENT, dlq_topics, sample_throughput
 from .base import BaseCollector
 
 
 class MessagingCollector(BaseCollector):
     """Collect Kafka/Redpanda messaging inventory."""
 
-    def __init__(self, ownership_path: Path | None = None):
+    def __init__(
+        self,
+        ownership_path: Path | None = None,
+        docker: DockerEngineClient | DockerCLI | None = None,
+        kafka: KafkaAdminClient | None = None,
+    ):
         if ownership_path is None:
             ownership_path = (
                 Path(__file__).parent.parent.parent.parent
@@ -22,6 +33,12 @@ class MessagingCollector(BaseCollector):
                 / "messaging.yaml"
             )
         self.ownership_path = ownership_path
+        self.docker = docker
+        self.kafka = kafka
+        # Previous lag sample per group; rates need two samples, so they are
+        # reported from the second collect() of a long-lived collector
+        # (daemon or --watch) onwards.
+        self._lag_samples: dict[str, LagSample] = {}
 
     def name(self) -> str:
         return "messaging"
@@ -30,13 +47,56 @@ class MessagingCollector(BaseCollector):
         """Collect messaging inventory."""
         try:
             ownership = self._load_ownership()
-            runtime_topics = self._list_topics()
-            runtime_groups = self._list_consumer_groups()
+            declared_topics = ownership.get("topics", {})
+            declared_group_specs = ownership.get("consumer_groups", {})
+            declared_groups = list(declared_group_specs)
+            snapshot = self._fetch_snapshot(declared_groups, list(declared_topics))
+            descriptions: dict[str, dict[str, Any]] | None = None
+            if snapshot is not None:
+                runtime_topics = [
+                    {"name": name, "partitions": len(topic["partitions"])}
+                    for name, topic in snapshot["topics"].items()
+                    if not topic["internal"]
+                ]
+                runtime_groups = [{"name": name} for name in snapshot["groups"]]
+                # Declared groups are described even before they join or
+                # commit, so their backlog counts from the log start.
+                descriptions = {
+                    group: group_description(snapshot, group, (spec or {}).get("topics", []))
+                    for group, spec in declared_group_specs.items()
+                }
+                reachable = True
+            else:
+                runtime_topics = self._list_topics()
+                runtime_groups = self._list_consumer_groups()
+                reachable = self._is_redpanda_reachable()
 
-            topics = self._merge_topic_ownership(ownership.get("topics", {}), runtime_topics)
+            topics = self._merge_topic_ownership(declared_topics, runtime_topics)
+            # Partition and config drift needs live configs, which only the
+            # Kafka protocol path fetches.
+            drifted: list[str] | None = None
+            if snapshot is not None:
+                drifted = []
+                for topic in topics:
+                    if topic.get("declared"):
+                        spec = declared_topics[topic["name"]]
+                        report = check_topic(topic["name"], spec, snapshot)
+                        topic["conformance"] = report
+                        if not report["conformant"]:
+                            drifted.append(topic["name"])
             consumer_groups = self._merge_consumer_group_ownership(
-                ownership.get("consumer_groups", {}), runtime_groups
+                declared_group_specs, runtime_groups
             )
+            for group in consumer_groups:
+                if group.get("declared") and (
+                    group.get("present_in_runtime") or descriptions is not None
+                ):
+                    description = (
+                        descriptions.get(group["name"])
+                        if descriptions is not None
+                        else self._describe_group(group["name"])
+                    )
+                    group["lag"] = self._group_lag(group["name"], description)
 
             return CollectorResult(
                 collector=self.name(),
@@ -45,7 +105,9 @@ class MessagingCollector(BaseCollector):
                     "topics": topics,
                     "consumer_groups": consumer_groups,
                     "dlq_pattern": ownership.get("dlq_pattern", {}),
-                    "redpanda_reachable": self._is_redpanda_reachable(),
+                    "drifted_topics": drifted,
+                    "redpanda_reachable": reachable,
+                    "source": "kafka" if snapshot is not None else "rpk",
                 },
             )
 
@@ -62,13 +124,50 @@ class MessagingCollector(BaseCollector):
         with open(self.ownership_path, "r", encoding="utf-8") as f:
             return yaml.safe_load(f) or {}
 
+    def topic_plan(self) -> TopicPlan:
+        """Plan the topic changes that would match messaging.yaml.
+
+        Raises ``OSError``/``KafkaError`` when the Kafka API is unreachable.
+        """
+        topics = self._load_ownership().get("topics", {})
+        snapshot = (self.kafka or get_kafka_admin()).snapshot([], config_topics=list(topics))
+        return plan_topic_changes(topics, snapshot)
+
+    def apply_topic_plan(self, plan: TopicPlan) -> dict[str, str]:
+        """Apply a plan in one batched request; returns per-topic errors."""
+        return (self.kafka or get_kafka_admin()).apply_topics(
+            plan.create, plan.add_partitions, plan.alter_configs
+        )
+
+    def sample_throughput(
+        self, window: float, environment: str = DEFAULT_DLQ_ENVIRONMENT
+    ) -> dict[str, Any]:
+        """Measure declared and DLQ topic throughput over ``window`` seconds.
+
+        Raises ``OSError``/``KafkaError`` when the Kafka API is unreachable.
+        """
+        ownership = self._load_ownership()
+        return sample_throughput(
+            self.kafka or get_kafka_admin(),
+            list(ownership.get("topics", {})),
+            dlq_topics(ownership, environment),
+            window,
+        )
+
+    def _fetch_snapshot(
+        self, groups: list[str], config_topics: list[str]
+    ) -> dict[str, Any] | None:
+        """Fetch everything over the Kafka protocol; None falls back to rpk."""
+        try:
+            return (self.kafka or get_kafka_admin()).snapshot(groups, config_topics)
+        except (OSError, KafkaError, struct.error):
+            return None
+
     def _is_redpanda_reachable(self) -> bool:
         """Check if Redpanda is reachable."""
         try:
-            result = subprocess.run(
-                ["docker", "exec", "card-fraud-redpanda", "rpk", "cluster", "info"],
-                capture_output=True,
-                timeout=10,
+            result = self.docker_client().exec_run(
+                "card-fraud-redpanda", ["rpk", "cluster", "info"], timeout=10
             )
             return result.returncode == 0
         except Exception:
@@ -77,11 +176,8 @@ class MessagingCollector(BaseCollector):
     def _list_topics(self) -> list[dict]:
         """List Kafka topics."""
         try:
-            result = subprocess.run(
-                ["docker", "exec", "card-fraud-redpanda", "rpk", "topic", "list"],
-                capture_output=True,
-                text=True,
-                timeout=10,
+            result = self.docker_client().exec_run(
+                "card-fraud-redpanda", ["rpk", "topic", "list"], timeout=10
             )
             if result.returncode != 0:
                 return []
@@ -99,11 +195,8 @@ class MessagingCollector(BaseCollector):
     def _list_consumer_groups(self) -> list[dict]:
         """List Kafka consumer groups."""
         try:
-            result = subprocess.run(
-                ["docker", "exec", "card-fraud-redpanda", "rpk", "group", "list"],
-                capture_output=True,
-                text=True,
-                timeout=10,
+            result = self.docker_client().exec_run(
+                "card-fraud-redpanda", ["rpk", "group", "list"], timeout=10
             )
             if result.returncode != 0:
                 return []
@@ -118,6 +211,28 @@ class MessagingCollector(BaseCollector):
         except Exception:
             return []
 
+    def _group_lag(
+        self, group: str, description: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        if description is None:
+            return None
+        sample = LagSample.from_description(description)
+        report = lag_report(description, sample, self._lag_samples.get(group))
+        self._lag_samples[group] = sample
+        return report
+
+    def _describe_group(self, group: str) -> dict[str, Any] | None:
+        """Describe a consumer group's members and per-partition offsets."""
+        try:
+            result = self.docker_client().exec_run(
+                "card-fraud-redpanda", ["rpk", "group", "describe", group], timeout=10
+            )
+            if result.returncode != 0:
+                return None
+            return parse_group_describe(result.stdout)
+        except Exception:
+            return None
+
     def _merge_topic_ownership(
         self, owned_topics: dict[str, dict[str, Any]], runtime_topics: list[dict[str, str]]
     ) -> list[dict[str, Any]]:
@@ -179,3 +294,146 @@ class MessagingCollector(BaseCollector):
                 )
 
         return merged
+
+
+@dataclass
+class LagSample:
+    """Summed offsets of a consumer group at one point in time."""
+
+    taken_at: float
+    committed: int
+    high_watermark: int
+
+    @classmethod
+    def from_description(cls, description: dict[str, Any]) -> "LagSample":
+        partitions = description.get("partitions", [])
+        return cls(
+            taken_at=time.monotonic(),
+            committed=sum(_committed_or_start(p) for p in partitions),
+            high_watermark=sum(p["high_watermark"] for p in partitions),
+        )
+
+    @property
+    def lag(self) -> int:
+        return max(self.high_watermark - self.committed, 0)
+
+
+def lag_report(
+    description: dict[str, Any], sample: LagSample, previous: LagSample | None
+) -> dict[str, Any]:
+    """Build the lag section for one group, with rates when a prior sample exists."""
+    partitions = [
+        {
+            "topic": p["topic"],
+            "partition": p["partition"],
+            "committed_offset": p.get("committed_offset"),
+            "high_watermark": p["high_watermark"],
+            "lag": max(p["high_watermark"] - _committed_or_start(p), 0),
+        }
+        for p in description.get("partitions", [])
+    ]
+    report: dict[str, Any] = {
+        "state": description.get("state"),
+        "members": description.get("members"),
+        "total_lag": sum(p["lag"] for p in partitions),
+        "partitions": partitions,
+        "sample_interval_seconds": None,
+        "lag_growth_per_second": None,
+        "consume_rate": None,
+        "produce_rate": None,
+        "time_to_drain_seconds": 0.0 if sample.lag == 0 else None,
+    }
+    if previous is None or sample.taken_at <= previous.taken_at:
+        return report
+
+    elapsed = sample.taken_at - previous.taken_at
+    consume_rate = (sample.committed - previous.committed) / elapsed
+    produce_rate = (sample.high_watermark - previous.high_watermark) / elapsed
+    report.update(
+        {
+            "sample_interval_seconds": round(elapsed, 3),
+            "lag_growth_per_second": round((sample.lag - previous.lag) / elapsed, 3),
+            "consume_rate": round(consume_rate, 3),
+            "produce_rate": round(produce_rate, 3),
+        }
+    )
+    # The backlog only shrinks while consumers outpace producers.
+    if sample.lag > 0 and consume_rate > produce_rate:
+        report["time_to_drain_seconds"] = round(sample.lag / (consume_rate - produce_rate), 1)
+    return report
+
+
+def group_description(
+    snapshot: dict[str, Any], group: str, declared_topics: list[str] | None = None
+) -> dict[str, Any]:
+    """Build a group description from a native Kafka snapshot.
+
+    Uses the same shape as ``parse_group_describe``: every partition of each
+    topic the group has committed offsets for or is declared to consume.
+    Partitions without a commit have ``committed_offset`` None, so their lag
+    counts from the log start.
+    """
+    committed = snapshot["group_offsets"].get(group, {})
+    consumed = sorted({topic for topic, _ in committed} | set(declared_topics or []))
+    info = snapshot["groups"].get(group, {})
+    partitions = []
+    for topic in consumed:
+        for partition in snapshot["topics"].get(topic, {}).get("partitions", []):
+            log_start, high_watermark = snapshot["topic_offsets"].get((topic, partition), (0, 0))
+            partitions.append(
+                {
+                    "topic": topic,
+                    "partition": partition,
+                    "committed_offset": committed.get((topic, partition)),
+                    "log_start_offset": log_start,
+                    "high_watermark": high_watermark,
+                }
+            )
+    return {"state": info.get("state"), "members": info.get("members"), "partitions": partitions}
+
+
+def parse_group_describe(output: str) -> dict[str, Any]:
+    """Parse ``rpk group describe`` text output."""
+    description: dict[str, Any] = {"state": None, "members": None, "partitions": []}
+    header: list[str] | None = None
+    for line in output.splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        if header is None:
+            if parts[0] == "TOPIC":
+                header = parts
+            elif parts[0] == "STATE" and len(parts) > 1:
+                description["state"] = parts[1]
+            elif parts[0] == "MEMBERS" and len(parts) > 1 and parts[1].isdigit():
+                description["members"] = int(parts[1])
+            continue
+
+        row = dict(zip(header, parts))
+        high_watermark = _offset(row.get("LOG-END-OFFSET"))
+        if high_watermark is None or not row.get("PARTITION", "").isdigit():
+            continue
+        description["partitions"].append(
+            {
+                "topic": row["TOPIC"],
+                "partition": int(row["PARTITION"]),
+                "committed_offset": _offset(row.get("CURRENT-OFFSET")),
+                "log_start_offset": _offset(row.get("LOG-START-OFFSET")) or 0,
+                "high_watermark": high_watermark,
+            }
+        )
+    return description
+
+
+def _offset(value: str | None) -> int | None:
+    if value is None or not value.lstrip("-").isdigit():
+        return None
+    return int(value)
+
+
+def _committed_or_start(partition: dict[str, Any]) -> int:
+    # A partition without a committed offset is consumed from the log start.
+    committed = partition.get("committed_offset")
+    if committed is None or committed < 0:
+        return partition.get("log_start_offset") or 0
+    return committed
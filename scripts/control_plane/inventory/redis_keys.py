@@ -0,0 +1,193 @@
+"""Redis key-prefix memory profiler."""
+
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from ..models import CollectorResult
+from ..redis_client import RedisClient, RedisError, get_redis
+from .base import BaseCollector
+
+DEFAULT_MAX_KEYS = 10_000
+DEFAULT_TIME_BUDGET = 5.0
+SCAN_COUNT = 500
+BIG_KEYS = 10
+
+# Upper bounds (seconds) of the TTL buckets; keys without a TTL go to "none".
+TTL_BUCKETS = [("<1m", 60), ("<1h", 3600), ("<1d", 86_400), (">=1d", None)]
+
+
+class RedisKeyCollector(BaseCollector):
+    """Sample the keyspace with SCAN and group memory by key prefix.
+
+    Sampling stops at ``max_keys`` keys or after ``time_budget`` seconds,
+    whichever comes first, so it is safe to run against a live instance.
+    Each SCAN page is followed by one pipelined round trip of
+    ``MEMORY USAGE``/``PTTL`` for the keys on that page.
+    """
+
+    def __init__(
+        self,
+        ownership_path: Path | None = None,
+        redis: RedisClient | None = None,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+    ):
+        if ownership_path is None:
+            ownership_path = (
+                Path(__file__).parent.parent.parent.parent
+                / "control-plane"
+                / "ownership"
+                / "redis.yaml"
+            )
+        self.ownership_path = ownership_path
+        self.redis = redis
+        self.max_keys = max_keys
+        self.time_budget = time_budget
+
+    def name(self) -> str:
+        return "redis-keys"
+
+    def collect(self, context: dict[str, Any] | None = None) -> CollectorResult:
+        """Collect per-prefix memory, counts and TTL distribution."""
+        try:
+            ownership = self._load_ownership()
+            client = self.redis or get_redis()
+            samples, complete, elapsed = self._sample(client)
+            total_keys = client.execute("DBSIZE")
+            big_keys = sorted(samples, key=lambda s: s[1], reverse=True)[:BIG_KEYS]
+            types = client.pipeline([["TYPE", key] for key, _, _ in big_keys])
+
+            data = summarize_keys(samples, ownership, total_keys)
+            data.update(
+                {
+                    "scan_complete": complete,
+                    "elapsed_seconds": round(elapsed, 3),
+                    "budget": {"max_keys": self.max_keys, "time_seconds": self.time_budget},
+                    "big_keys": [
+                        {
+                            "key": key,
+                            "bytes": size,
+                            "type": kind if isinstance(kind, str) else None,
+                            "ttl_seconds": _ttl_seconds(ttl),
+                            "prefix": key_prefix(key, ownership),
+                        }
+                        for (key, size, ttl), kind in zip(big_keys, types)
+                    ],
+                }
+            )
+            return CollectorResult(collector=self.name(), success=True, data=data)
+
+        except (OSError, RedisError) as e:
+            return CollectorResult(
+                collector=self.name(),
+                success=False,
+                error=f"Redis not reachable over RESP: {e}",
+            )
+        except Exception as e:
+            return CollectorResult(
+                collector=self.name(),
+                success=False,
+                error=str(e),
+            )
+
+    def _load_ownership(self) -> dict[str, Any]:
+        if not self.ownership_path.exists():
+            return {}
+        with open(self.ownership_path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+
+    def _sample(self, client: RedisClient) -> tuple[list[tuple[str, int, int]], bool, float]:
+        """Return ``(key, bytes, pttl)`` samples, whether SCAN finished, and elapsed time."""
+        started = time.monotonic()
+        samples: list[tuple[str, int, int]] = []
+        cursor = "0"
+        while True:
+            cursor, keys = client.execute("SCAN", cursor, "COUNT", SCAN_COUNT)
+            keys = keys[: self.max_keys - len(samples)]
+            if keys:
+                replies = client.pipeline(
+                    [cmd for key in keys for cmd in (["MEMORY", "USAGE", key], ["PTTL", key])]
+                )
+                for index, key in enumerate(keys):
+                    size, ttl = replies[2 * index], replies[2 * index + 1]
+                    # Keys deleted between SCAN and MEMORY USAGE come back as nil.
+                    if isinstance(size, int) and isinstance(ttl, int) and ttl != -2:
+                        samples.append((key, size, ttl))
+            if cursor == "0":
+                return samples, True, time.monotonic() - started
+            if len(samples) >= self.max_keys or time.monotonic() - started >= self.time_budget:
+                return samples, False, time.monotonic() - started
+
+
+def summarize_keys(
+    samples: list[tuple[str, int, int]], ownership: dict[str, Any], total_keys: int
+) -> dict[str, Any]:
+    """Group sampled keys by declared (or first-segment) prefix."""
+    declared = ownership.get("prefixes") or {}
+    prefixes: dict[str, dict[str, Any]] = {}
+    for key, size, ttl in samples:
+        prefix = key_prefix(key, ownership)
+        spec = declared.get(prefix)
+        group = prefixes.setdefault(
+            prefix,
+            {
+                "owner": spec.get("owner") if spec else None,
+                "declared": spec is not None,
+                "keys": 0,
+                "bytes": 0,
+                "ttl": {"none": 0, **{label: 0 for label, _ in TTL_BUCKETS}},
+            },
+        )
+        group["keys"] += 1
+        group["bytes"] += size
+        group["ttl"][_ttl_bucket(ttl)] += 1
+
+    sampled_bytes = sum(g["bytes"] for g in prefixes.values())
+    for group in prefixes.values():
+        group["share_of_sampled_bytes"] = (
+            round(group["bytes"] / sampled_bytes, 4) if sampled_bytes else 0.0
+        )
+        group["avg_bytes"] = group["bytes"] // group["keys"]
+
+    by_owner: dict[str, int] = {}
+    for group in prefixes.values():
+        owner = group["owner"] or "unowned"
+        by_owner[owner] = by_owner.get(owner, 0) + group["bytes"]
+
+    coverage = len(samples) / total_keys if total_keys else 1.0
+    return {
+        "total_keys": total_keys,
+        "sampled_keys": len(samples),
+        "coverage": round(min(coverage, 1.0), 4),
+        "sampled_bytes": sampled_bytes,
+        # Linear extrapolation; exact when the scan covered the whole keyspace.
+        "estimated_total_bytes": int(sampled_bytes / coverage) if coverage else None,
+        "bytes_by_owner": dict(sorted(by_owner.items(), key=lambda item: -item[1])),
+        "prefixes": dict(sorted(prefixes.items(), key=lambda item: -item[1]["bytes"])),
+    }
+
+
+def key_prefix(key: str, ownership: dict[str, Any]) -> str:
+    """Return the longest declared prefix of ``key``, else its first segment."""
+    declared = ownership.get("prefixes") or {}
+    matches = [prefix for prefix in declared if key.startswith(prefix)]
+    if matches:
+        return max(matches, key=len)
+    head, sep, _ = key.partition(ownership.get("key_delimiter", ":"))
+    return head + sep if sep else "(no prefix)"
+
+
+def _ttl_bucket(pttl: int) -> str:
+    if pttl < 0:
+        return "none"
+    for label, limit in TTL_BUCKETS:
+        if limit is None or pttl < limit * 1000:
+            return label
+    return TTL_BUCKETS[-1][0]
+
+
+def _ttl_seconds(pttl: int) -> float | None:
+    return round(pttl / 1000, 3) if pttl >= 0 else None
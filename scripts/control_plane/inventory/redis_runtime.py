@@ -1,30 +1,42 @@
 """Redis runtime inventory collector."""
 
-import subprocess
 from typing import Any
 
+from ..docker_api import DockerCLI, DockerEngineClient
 from ..models import CollectorResult
+from ..redis_client import RedisClient, RedisError, get_redis, parse_info
 from .base import BaseCollector
 
+SLOWLOG_ENTRIES = 10
+SLOWLOG_COMMAND_LIMIT = 120
+
+_SUMMARY_KEYS = ("redis_version", "uptime_in_seconds", "used_memory_human")
+
 
 class RedisRuntimeCollector(BaseCollector):
     """Collect Redis runtime inventory."""
 
+    def __init__(
+        self,
+        docker: DockerEngineClient | DockerCLI | None = None,
+        redis: RedisClient | None = None,
+    ):
+        self.docker = docker
+        self.redis = redis
+
     def name(self) -> str:
         return "redis-runtime"
 
     def collect(self, context: dict[str, Any] | None = None) -> CollectorResult:
-        """Collect Redis health and summary runtime details."""
+        """Collect Redis health, performance counters and slow commands."""
         try:
-            reachable = self._ping()
-            info = self._info_summary() if reachable else {}
+            data = self._collect_native()
+            if data is None:
+                data = self._collect_cli()
             return CollectorResult(
                 collector=self.name(),
                 success=True,
-                data={
-                    "reachable": reachable,
-                    "summary": info,
-                },
+                data=data,
             )
         except Exception as exc:
             return CollectorResult(
@@ -33,47 +45,142 @@ class RedisRuntimeCollector(BaseCollector):
                 error=str(exc),
             )
 
+    def _collect_native(self) -> dict[str, Any] | None:
+        """Fetch everything in one pipelined round trip; None falls back to redis-cli."""
+        try:
+            ping, info, slowlog, latency, config = (self.redis or get_redis()).pipeline(
+                [
+                    ["PING"],
+                    ["INFO", "all"],
+                    ["SLOWLOG", "GET", SLOWLOG_ENTRIES],
+                    ["LATENCY", "LATEST"],
+                    ["CONFIG", "GET", "maxmemory*"],
+                ]
+            )
+        except (OSError, RedisError):
+            return None
+
+        parsed = parse_info(info) if isinstance(info, str) else {}
+        config_values = _pairs(config) if isinstance(config, list) else {}
+        return {
+            "reachable": ping == "PONG",
+            "source": "resp",
+            "summary": _summary(parsed),
+            "stats": redis_stats(parsed, config_values),
+            "config": config_values,
+            "slowlog": _slowlog(slowlog) if isinstance(slowlog, list) else [],
+            "latency": _latency(latency) if isinstance(latency, list) else [],
+        }
+
+    def _collect_cli(self) -> dict[str, Any]:
+        reachable = self._ping()
+        info = self._info() if reachable else {}
+        return {
+            "reachable": reachable,
+            "source": "redis-cli",
+            "summary": _summary(info),
+            "stats": redis_stats(info, {}) if info else {},
+        }
+
     def _ping(self) -> bool:
         try:
-            result = subprocess.run(
-                ["docker", "exec", "card-fraud-redis", "redis-cli", "ping"],
-                capture_output=True,
-                text=True,
-                timeout=8,
+            result = self.docker_client().exec_run(
+                "card-fraud-redis", ["redis-cli", "ping"], timeout=8
             )
             return result.returncode == 0 and "PONG" in result.stdout
         except Exception:
             return False
 
-    def _info_summary(self) -> dict[str, str]:
+    def _info(self) -> dict[str, str]:
         try:
-            result = subprocess.run(
-                [
-                    "docker",
-                    "exec",
-                    "card-fraud-redis",
-                    "redis-cli",
-                    "INFO",
-                    "server",
-                    "memory",
-                    "keyspace",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=8,
+            result = self.docker_client().exec_run(
+                "card-fraud-redis", ["redis-cli", "INFO", "all"], timeout=8
             )
             if result.returncode != 0:
                 return {}
-
-            summary: dict[str, str] = {}
-            for line in result.stdout.splitlines():
-                if not line or line.startswith("#") or ":" not in line:
-                    continue
-                key, value = line.split(":", 1)
-                if key in ("redis_version", "uptime_in_seconds", "used_memory_human"):
-                    summary[key] = value.strip()
-                if key.startswith("db"):
-                    summary[key] = value.strip()
-            return summary
+            return parse_info(result.stdout)
         except Exception:
             return {}
+
+
+def redis_stats(info: dict[str, str], config: dict[str, str]) -> dict[str, Any]:
+    """Derive cache and memory health figures from INFO and maxmemory config."""
+    hits = _int(info.get("keyspace_hits"))
+    misses = _int(info.get("keyspace_misses"))
+    used_memory = _int(info.get("used_memory"))
+    maxmemory = _int(config.get("maxmemory", info.get("maxmemory")))
+    return {
+        "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+        "keyspace_hits": hits,
+        "keyspace_misses": misses,
+        "ops_per_sec": _int(info.get("instantaneous_ops_per_sec")),
+        "mem_fragmentation_ratio": _float(info.get("mem_fragmentation_ratio")),
+        "used_memory": used_memory,
+        "maxmemory": maxmemory or None,
+        "memory_usage_ratio": round(used_memory / maxmemory, 4) if maxmemory else None,
+        "maxmemory_policy": config.get("maxmemory-policy", info.get("maxmemory_policy")),
+        "evicted_keys": _int(info.get("evicted_keys")),
+        "expired_keys": _int(info.get("expired_keys")),
+        "connected_clients": _int(info.get("connected_clients")),
+        "blocked_clients": _int(info.get("blocked_clients")),
+        "rejected_connections": _int(info.get("rejected_connections")),
+    }
+
+
+def _summary(info: dict[str, str]) -> dict[str, str]:
+    return {
+        key: value
+        for key, value in info.items()
+        if key in _SUMMARY_KEYS or (key.startswith("db") and key[2:].isdigit())
+    }
+
+
+def _pairs(values: list[Any]) -> dict[str, str]:
+    return {str(values[i]): str(values[i + 1]) for i in range(0, len(values) - 1, 2)}
+
+
+def _slowlog(entries: list[Any]) -> list[dict[str, Any]]:
+    slowlog = []
+    for entry in entries:
+        if not isinstance(entry, list) or len(entry) < 4:
+            continue
+        command = " ".join(str(arg) for arg in entry[3]) if isinstance(entry[3], list) else ""
+        if len(command) > SLOWLOG_COMMAND_LIMIT:
+            command = command[: SLOWLOG_COMMAND_LIMIT - 3] + "..."
+        slowlog.append(
+            {
+                "id": entry[0],
+                "timestamp": entry[1],
+                "duration_us": entry[2],
+                "command": command,
+                "client": entry[4] if len(entry) > 4 else None,
+            }
+        )
+    return slowlog
+
+
+def _latency(events: list[Any]) -> list[dict[str, Any]]:
+    return [
+        {
+            "event": event[0],
+            "timestamp": event[1],
+            "latest_ms": event[2],
+            "max_ms": event[3],
+        }
+        for event in events
+        if isinstance(event, list) and len(event) >= 4
+    ]
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,120 @@
+"""Concurrent execution of inventory collectors."""
+
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+from ..models import CollectorResult
+from ..timeouts import get_collector_timeout
+from .base import BaseCollector
+
+DEFAULT_MAX_WORKERS = 4
+_POLL_INTERVAL = 0.05
+
+
+def run_collectors(
+    collectors: dict[str, BaseCollector],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeouts: dict[str, float] | None = None,
+    deadline: float | None = None,
+    in_flight: dict[str, Future] | None = None,
+) -> list[CollectorResult]:
+    """Run collectors concurrently and return their results in input order.
+
+    Each collector gets its own budget (``timeouts`` or the defaults from
+    ``timeouts.COLLECTOR_TIMEOUTS``), measured from when it is submitted, so
+    a collector queued behind a stuck one is still bounded; ``deadline``
+    bounds the whole run. A collector that misses its budget is reported as
+    a failed ``CollectorResult`` instead of blocking the report, and is never
+    started if it was still queued. Workers are daemon threads, so an
+    abandoned collector never delays exit.
+
+    Repeated runs (``inventory --watch``) pass the same ``in_flight`` dict:
+    a collector abandoned while still running is recorded there, and later
+    runs skip it until it finishes instead of starting another thread.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    if not collectors:
+        return []
+
+    timeouts = timeouts or {}
+    in_flight = in_flight if in_flight is not None else {}
+    jobs: queue.Queue[tuple[str, BaseCollector, Future]] = queue.Queue()
+    futures: dict[str, Future] = {}
+    results: dict[str, CollectorResult] = {}
+    for key, collector in collectors.items():
+        previous = in_flight.get(key)
+        if previous is not None and not previous.done():
+            results[key] = _timeout_result(
+                collector, "Skipped: still running from a previous sample"
+            )
+            continue
+        in_flight.pop(key, None)
+        future: Future = Future()
+        futures[key] = future
+        jobs.put((key, collector, future))
+
+    for index in range(min(max_workers, len(futures))):
+        threading.Thread(
+            target=_worker,
+            args=(jobs,),
+            name=f"collector-{index}",
+            daemon=True,
+        ).start()
+
+    begin = time.monotonic()
+    pending = set(futures)
+    while pending:
+        now = time.monotonic()
+        for key in sorted(pending):
+            future = futures[key]
+            collector = collectors[key]
+            budget = get_collector_timeout(key, timeouts.get(key))
+            if future.done() and not future.cancelled():
+                results[key] = future.result()
+            elif deadline is not None and now - begin >= deadline:
+                future.cancel()
+                results[key] = _timeout_result(
+                    collector, f"Exceeded inventory deadline of {deadline}s"
+                )
+            elif now - begin >= budget:
+                future.cancel()
+                results[key] = _timeout_result(
+                    collector, f"Collector timed out after {budget}s"
+                )
+            else:
+                continue
+            pending.discard(key)
+            if not future.done():
+                in_flight[key] = future
+
+        if pending:
+            wait([futures[k] for k in pending], timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+    return [results[key] for key in collectors]
+
+
+def _worker(jobs: queue.Queue[tuple[str, BaseCollector, Future]]) -> None:
+    while True:
+        try:
+            _, collector, future = jobs.get_nowait()
+        except queue.Empty:
+            return
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(collector.collect())
+        except Exception as e:
+            future.set_result(
+                CollectorResult(collector=collector.name(), success=False, error=str(e))
+            )
+
+
+def _timeout_result(collector: BaseCollector, message: str) -> CollectorResult:
+    return CollectorResult(
+        collector=collector.name(),
+        success=False,
+        error=message,
+    )
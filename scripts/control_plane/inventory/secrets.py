@@ -1,7 +1,13 @@
 """Secrets (Doppler) inventory collector."""
 
+import atexit
 import json
+import os
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
@@ -10,11 +16,98 @@ import yaml
 from ..models import CollectorResult
 from .base import BaseCollector
 
+DEFAULT_DOPPLER_CACHE_TTL = 3600
+DOPPLER_CACHE_MODES = ("auto", "refresh", "offline")
+# Budget for one full project + configs listing; below the collector's 35s timeout.
+DOPPLER_LIST_BUDGET = 25
+DOPPLER_MAX_PARALLEL = 8
+# After a failed refresh, Doppler is not retried automatically for this long.
+DOPPLER_REFRESH_BACKOFF = 300
+# How long a one-shot command waits at exit for a background refresh to finish.
+DOPPLER_REFRESH_EXIT_GRACE = 3
+
+
+class DopplerProjectCache:
+    """On-disk cache of Doppler project and config names (never values)."""
+
+    def __init__(self, path: Path | None = None, ttl: float | None = None):
+        if path is None:
+            path = (
+                Path(__file__).parent.parent.parent.parent
+                / "control-plane"
+                / "cache"
+                / "doppler-projects.json"
+            )
+        if ttl is None:
+            ttl = float(os.environ.get("DOPPLER_CACHE_TTL", DEFAULT_DOPPLER_CACHE_TTL))
+        self.path = path
+        self.ttl = ttl
+
+    def load(self) -> dict[str, Any] | None:
+        """Return ``{"fetched_at", "projects"}`` or None when there is no usable cache."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            datetime.fromisoformat(cached["fetched_at"])
+            return cached
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, projects: list[dict[str, Any]]) -> dict[str, Any]:
+        cached = {
+            "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "projects": projects,
+        }
+        self._write(cached)
+        return cached
+
+    def record_attempt(self) -> None:
+        """Mark a Doppler listing as started, keeping any cached names.
+
+        ``save`` clears the mark, so a listing that failed or was cut short
+        at process exit still counts as a recent failure.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = {}
+        cached["refresh_attempted_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self._write(cached)
+
+    def failed_recently(self, backoff: float = DOPPLER_REFRESH_BACKOFF) -> bool:
+        """Whether an unfinished listing started less than ``backoff`` seconds ago."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                failed_at = datetime.fromisoformat(json.load(f)["refresh_attempted_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return (datetime.now(timezone.utc) - failed_at).total_seconds() < backoff
+
+    def age(self, cached: dict[str, Any]) -> float:
+        fetched_at = datetime.fromisoformat(cached["fetched_at"])
+        return (datetime.now(timezone.utc) - fetched_at).total_seconds()
+
+    def _write(self, cached: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cached, f, indent=2)
+        tmp.replace(self.path)
+
 
 class SecretsCollector(BaseCollector):
     """Collect Doppler secrets inventory."""
 
-    def __init__(self, ownership_path: Path | None = None):
+    # One background refresh at a time across collector instances.
+    _refresh_lock = threading.Lock()
+
+    def __init__(
+        self,
+        ownership_path: Path | None = None,
+        cache: DopplerProjectCache | None = None,
+        cache_mode: str = "auto",
+    ):
         if ownership_path is None:
             ownership_path = (
                 Path(__file__).parent.parent.parent.parent
@@ -22,7 +115,11 @@ class SecretsCollector(BaseCollector):
                 / "ownership"
                 / "secrets.yaml"
             )
+        if cache_mode not in DOPPLER_CACHE_MODES:
+            raise ValueError(f"Unknown Doppler cache mode: {cache_mode}")
         self.ownership_path = ownership_path
+        self.cache = cache or DopplerProjectCache()
+        self.cache_mode = cache_mode
 
     def name(self) -> str:
         return "secrets"
@@ -32,7 +129,7 @@ class SecretsCollector(BaseCollector):
         try:
             ownership = self._load_ownership()
             declared_projects = ownership.get("projects", {})
-            runtime_projects = self._list_doppler_projects()
+            runtime_projects, cache_status = self._runtime_projects()
             runtime_names = {p.get("name", "") for p in runtime_projects}
 
             return CollectorResult(
@@ -53,6 +150,7 @@ class SecretsCollector(BaseCollector):
                         name for name in declared_projects if name not in runtime_names
                     ],
                     "configs": ownership.get("configs", []),
+                    "runtime_cache": cache_status,
                     "note": "Secret values are not fetched. Ownership is sourced from control-plane/ownership/secrets.yaml.",
                 },
             )
@@ -70,20 +168,122 @@ class SecretsCollector(BaseCollector):
         with open(self.ownership_path, "r", encoding="utf-8") as f:
             return yaml.safe_load(f) or {}
 
-    def _list_doppler_projects(self) -> list[dict]:
-        """List Doppler projects (name-only, no values)."""
-        try:
-            result = subprocess.run(
-                ["doppler", "projects", "list", "--json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode != 0:
-                return []
+    def _runtime_projects(self) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Return project/config names from Doppler or the cache, with cache status.
+
+        ``refresh`` always asks Doppler; ``offline`` never does. In ``auto``
+        a fresh cache is returned as is, and a stale one is returned
+        immediately while a background thread refreshes it. Doppler is only
+        waited on when there is no cache at all. A listing that did not
+        complete is recorded in the cache file and ``auto`` does not retry it
+        for ``DOPPLER_REFRESH_BACKOFF`` seconds.
+        """
+        cached = self.cache.load()
+        refreshing = False
+        if self.cache_mode == "refresh" or (
+            self.cache_mode == "auto" and cached is None and not self.cache.failed_recently()
+        ):
+            projects = self._fetch_and_store()
+            if projects is not None:
+                return projects, self._cache_status("doppler", self.cache.load(), refreshing)
+        elif (
+            self.cache_mode == "auto"
+            and cached is not None
+            and self.cache.age(cached) > self.cache.ttl
+            and not self.cache.failed_recently()
+        ):
+            refreshing = self._refresh_in_background()
+
+        if cached is None:
+            return [], self._cache_status("none", None, refreshing)
+        return cached["projects"], self._cache_status("cache", cached, refreshing)
+
+    def _cache_status(
+        self, source: str, cached: dict[str, Any] | None, refreshing: bool
+    ) -> dict[str, Any]:
+        age = round(self.cache.age(cached)) if cached else None
+        return {
+            "source": source,
+            "fetched_at": cached["fetched_at"] if cached else None,
+            "age_seconds": age,
+            "stale": age is None or age > self.cache.ttl,
+            "ttl_seconds": self.cache.ttl,
+            "refreshing": refreshing,
+            "backoff": self.cache.failed_recently(),
+        }
 
-            projects_data = json.loads(result.stdout)
-            return [{"name": p.get("name", "")} for p in projects_data]
+    def _fetch_and_store(self) -> list[dict[str, Any]] | None:
+        self.cache.record_attempt()
+        projects = self._list_doppler_projects()
+        if projects is not None:
+            self.cache.save(projects)
+        return projects
 
-        except Exception:
+    def _refresh_in_background(self) -> bool:
+        """Start a cache refresh unless one is already running."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return True
+
+        def refresh() -> None:
+            try:
+                self._fetch_and_store()
+            finally:
+                # Long-lived callers (daemon, --watch) refresh repeatedly;
+                # drop the exit hook so finished threads don't pile up.
+                atexit.unregister(thread.join)
+                self._refresh_lock.release()
+
+        # A daemon thread never holds the process open for the full listing
+        # budget; a one-shot command gives it a short grace period at exit.
+        thread = threading.Thread(target=refresh, name="doppler-cache-refresh", daemon=True)
+        atexit.register(thread.join, DOPPLER_REFRESH_EXIT_GRACE)
+        thread.start()
+        return True
+
+    def _list_doppler_projects(self) -> list[dict[str, Any]] | None:
+        """List Doppler projects and their configs (names only, no values).
+
+        Config listings run concurrently, and every call shares one
+        ``DOPPLER_LIST_BUDGET`` deadline. Returns None when Doppler is
+        unreachable or the listing is incomplete, so callers keep the cache.
+        """
+        deadline = time.monotonic() + DOPPLER_LIST_BUDGET
+        projects = _doppler_json(["doppler", "projects", "list", "--json"], deadline)
+        if projects is None:
+            return None
+        names = [p.get("name", "") for p in projects]
+        if not names:
             return []
+        with ThreadPoolExecutor(max_workers=min(len(names), DOPPLER_MAX_PARALLEL)) as pool:
+            configs = list(
+                pool.map(
+                    lambda name: _doppler_json(
+                        ["doppler", "configs", "list", "--project", name, "--json"], deadline
+                    ),
+                    names,
+                )
+            )
+        if any(listed is None for listed in configs):
+            return None
+        return [
+            {"name": name, "configs": sorted(c.get("name", "") for c in listed or [])}
+            for name, listed in zip(names, configs)
+        ]
+
+
+def _doppler_json(cmd: list[str], deadline: float) -> list[dict[str, Any]] | None:
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return None
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=remaining,
+        )
+        if result.returncode != 0:
+            return None
+        return json.loads(result.stdout)
+    except Exception:
+        return None
@@ -1,8 +1,8 @@
 """Services inventory collector."""
 
-import subprocess
 from typing import Any
 
+from ..container_state import get_container_snapshot
 from ..models import CollectorResult
 from .base import BaseCollector
 
@@ -20,13 +20,15 @@ class ServicesCollector(BaseCollector):
         """Collect service metadata."""
         try:
             registry_data = self.registry.load()
+            snapshot = get_container_snapshot()
             services = {}
 
             for service_id, entry in registry_data.services.items():
                 adapter_path = self.registry.get_service_adapter_path(service_id)
                 adapter_exists = adapter_path.exists() if adapter_path else False
 
-                container_state = self._get_container_state(entry.container)
+                container_state = snapshot.status(entry.container)
+                container = snapshot.get(entry.container)
 
                 services[service_id] = {
                     "repo": entry.repo,
@@ -34,6 +36,8 @@ class ServicesCollector(BaseCollector):
                     "port": entry.port,
                     "container": entry.container,
                     "container_state": container_state,
+                    "container_health": container.health if container else None,
+                    "restart_count": container.restart_count if container else None,
                     "auth_model": entry.auth_model.value,
                     "engine_family": entry.engine_family,
                     "action_domains": entry.action_domains,
@@ -54,18 +58,3 @@ class ServicesCollector(BaseCollector):
                 success=False,
                 error=str(e),
             )
-
-    def _get_container_state(self, container_name: str) -> str:
-        """Get Docker container state."""
-        try:
-            result = subprocess.run(
-                ["docker", "inspect", "-f", "{{.State.Status}}", container_name],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-            return "not-found"
-        except Exception:
-            return "unknown"
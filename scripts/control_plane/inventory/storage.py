@@ -4,16 +4,24 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+import httpx
 import yaml
 
+from ..docker_api import DockerCLI, DockerEngineClient
 from ..models import CollectorResult
+from ..s3_client import S3Client, S3Error, get_s3
 from .base import BaseCollector
 
 
 class StorageCollector(BaseCollector):
     """Collect MinIO/S3 storage inventory."""
 
-    def __init__(self, ownership_path: Path | None = None):
+    def __init__(
+        self,
+        ownership_path: Path | None = None,
+        docker: DockerEngineClient | DockerCLI | None = None,
+        s3: S3Client | None = None,
+    ):
         if ownership_path is None:
             ownership_path = (
                 Path(__file__).parent.parent.parent.parent
@@ -22,6 +30,8 @@ class StorageCollector(BaseCollector):
                 / "storage.yaml"
             )
         self.ownership_path = ownership_path
+        self.docker = docker
+        self.s3 = s3
 
     def name(self) -> str:
         return "storage"
@@ -30,19 +40,23 @@ class StorageCollector(BaseCollector):
         """Collect storage inventory."""
         try:
             ownership = self._load_ownership()
-            runtime_buckets = self._list_runtime_buckets()
-            buckets = self._merge_bucket_ownership(
+            data = self._collect_native(ownership)
+            if data is None:
+                data = {
+                    "runtime_buckets": self._list_runtime_buckets(),
+                    "minio_reachable": self._is_minio_reachable(),
+                    "source": "mc",
+                }
+            runtime_buckets = data.pop("runtime_buckets")
+            data["buckets"] = self._merge_bucket_ownership(
                 ownership.get("buckets", {}), runtime_buckets
             )
+            data["artifact_paths"] = ownership.get("artifact_paths", {})
 
             return CollectorResult(
                 collector=self.name(),
                 success=True,
-                data={
-                    "buckets": buckets,
-                    "artifact_paths": ownership.get("artifact_paths", {}),
-                    "minio_reachable": self._is_minio_reachable(),
-                },
+                data=data,
             )
 
         except Exception as e:
@@ -52,6 +66,46 @@ class StorageCollector(BaseCollector):
                 error=str(e),
             )
 
+    def _collect_native(self, ownership: dict[str, Any]) -> dict[str, Any] | None:
+        """List buckets and artifact prefixes over S3; None falls back to mc."""
+        client = self.s3 or get_s3()
+        if client is None:
+            return None
+        try:
+            runtime_buckets = [bucket["name"] for bucket in client.list_buckets()]
+        except (httpx.HTTPError, S3Error):
+            return None
+
+        # Artifact paths live in the first declared bucket (fraud-gov-artifacts).
+        bucket = next((b for b in ownership.get("buckets", {}) if b in runtime_buckets), None)
+        prefixes = {
+            name: artifact_prefix(spec.get("pattern", ""))
+            for name, spec in ownership.get("artifact_paths", {}).items()
+        }
+        listings, errors = (
+            client.list_prefixes(bucket, sorted(set(prefixes.values()))) if bucket else ({}, {})
+        )
+        usage: dict[str, Any] = {}
+        for name, prefix in prefixes.items():
+            if prefix in errors:
+                usage[name] = {"bucket": bucket, "prefix": prefix, "error": errors[prefix]}
+                continue
+            objects = listings.get(prefix, [])
+            usage[name] = {
+                "bucket": bucket,
+                "prefix": prefix,
+                "objects": len(objects),
+                "bytes": sum(obj["size"] for obj in objects),
+                "last_modified": max((obj["last_modified"] for obj in objects), default=None),
+            }
+
+        return {
+            "runtime_buckets": runtime_buckets,
+            "minio_reachable": True,
+            "source": "s3",
+            "artifact_usage": usage,
+        }
+
     def _load_ownership(self) -> dict[str, Any]:
         if not self.ownership_path.exists():
             return {}
@@ -79,11 +133,8 @@ class StorageCollector(BaseCollector):
     def _list_runtime_buckets(self) -> list[str]:
         """List runtime buckets from MinIO if the CLI alias is available."""
         try:
-            result = subprocess.run(
-                ["docker", "exec", "card-fraud-minio", "mc", "ls", "local/"],
-                capture_output=True,
-                text=True,
-                timeout=10,
+            result = self.docker_client().exec_run(
+                "card-fraud-minio", ["mc", "ls", "local/"], timeout=10
             )
             if result.returncode != 0:
                 return []
@@ -132,3 +183,8 @@ class StorageCollector(BaseCollector):
                 )
 
         return merged
+
+
+def artifact_prefix(pattern: str) -> str:
+    """Return the fixed leading part of an artifact path pattern."""
+    return pattern.split("{", 1)[0]
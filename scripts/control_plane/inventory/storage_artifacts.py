@@ -0,0 +1,276 @@
+"""Ruleset and field-registry artifact index for fraud-gov-artifacts."""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from ..artifact_probe import (
+    DEFAULT_PROBE_ENVIRONMENT,
+    DEFAULT_PROBE_REPETITIONS,
+    find_probe_container,
+    probe_host,
+    probe_network,
+    probe_targets,
+    summarize_samples,
+)
+from ..docker_api import DockerCLI, DockerEngineClient
+from ..models import CollectorResult
+from ..s3_client import S3Client, S3Error, get_s3
+from .storage import StorageCollector
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+class ArtifactIndexCollector(StorageCollector):
+    """Index artifact versions per environment and key from the declared layout.
+
+    The layout in ``storage.yaml`` is walked one path segment at a time with
+    delimiter listings. Version prefixes are immutable by convention, so a
+    version already in the on-disk cache is only revalidated with a
+    conditional HEAD of its first object (``If-None-Match``/
+    ``If-Modified-Since``); it is relisted only when that reports a change.
+    """
+
+    def __init__(
+        self,
+        ownership_path: Path | None = None,
+        s3: S3Client | None = None,
+        cache_path: Path | None = None,
+        docker: DockerEngineClient | DockerCLI | None = None,
+    ):
+        super().__init__(ownership_path=ownership_path, docker=docker, s3=s3)
+        if cache_path is None:
+            cache_path = (
+                Path(__file__).parent.parent.parent.parent
+                / "control-plane"
+                / "cache"
+                / "artifact-index.json"
+            )
+        self.cache_path = cache_path
+
+    def name(self) -> str:
+        return "storage-artifacts"
+
+    def collect(self, context: dict[str, Any] | None = None) -> CollectorResult:
+        """Build the artifact index, reusing cached listings that are unchanged."""
+        try:
+            client = self.s3 or get_s3()
+            if client is None:
+                return CollectorResult(
+                    collector=self.name(),
+                    success=False,
+                    error="S3 credentials not set (S3_ACCESS_KEY_ID or MINIO_ROOT_USER)",
+                )
+            ownership = self._load_ownership()
+            bucket = next(iter(ownership.get("buckets", {})), None)
+            if bucket is None:
+                return CollectorResult(
+                    collector=self.name(),
+                    success=False,
+                    error="No bucket declared in storage.yaml",
+                )
+
+            cache = self._load_cache().get(bucket, {})
+            index = _ArtifactIndexer(client, bucket, cache)
+            artifacts = {
+                name: index.build(spec.get("pattern", ""))
+                for name, spec in ownership.get("artifact_paths", {}).items()
+            }
+            self._save_cache({bucket: index.fresh_cache})
+
+            return CollectorResult(
+                collector=self.name(),
+                success=True,
+                data={
+                    "bucket": bucket,
+                    "artifacts": artifacts,
+                    "cache": {"reused": index.reused, "relisted": index.relisted},
+                },
+            )
+
+        except (httpx.HTTPError, S3Error) as e:
+            return CollectorResult(
+                collector=self.name(),
+                success=False,
+                error=f"S3 API unreachable: {e}",
+            )
+        except Exception as e:
+            return CollectorResult(
+                collector=self.name(),
+                success=False,
+                error=str(e),
+            )
+
+    def probe_fetch_latency(
+        self,
+        environment: str = DEFAULT_PROBE_ENVIRONMENT,
+        repetitions: int = DEFAULT_PROBE_REPETITIONS,
+        container: str | None = None,
+    ) -> dict[str, Any]:
+        """Time fetches of the latest artifacts from the host and from card-fraud-network."""
+        result = self.collect()
+        if not result.success:
+            raise S3Error(result.error or "artifact index failed")
+        client = self.s3 or get_s3()
+        assert client is not None
+        data = result.data or {}
+        bucket = data["bucket"]
+        keys = probe_targets(
+            data["artifacts"], self._load_ownership().get("artifact_paths", {}), environment
+        )
+
+        vantages = {"host": probe_host(client, bucket, keys, repetitions)}
+        container = container or find_probe_container(self.docker_client())
+        if container is not None:
+            vantages["network"] = probe_network(
+                self.docker_client(), container, client, bucket, keys, repetitions
+            )
+        return {
+            "bucket": bucket,
+            "environment": environment,
+            "repetitions": repetitions,
+            "network_container": container,
+            "objects": {
+                key: {name: summarize_samples(samples[key]) for name, samples in vantages.items()}
+                for key in keys
+            },
+        }
+
+    def _load_cache(self) -> dict[str, Any]:
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache: dict[str, Any]) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+
+
+class _ArtifactIndexer:
+    """Walk one artifact path pattern, reusing cached version listings."""
+
+    def __init__(self, client: S3Client, bucket: str, cache: dict[str, Any]):
+        self.client = client
+        self.bucket = bucket
+        self.cache = cache
+        self.fresh_cache: dict[str, Any] = {}
+        self.reused = 0
+        self.relisted = 0
+
+    def build(self, pattern: str) -> list[dict[str, Any]]:
+        """Return one entry per distinct non-version placeholder combination."""
+        segments = [segment for segment in pattern.split("/") if segment]
+        found: list[tuple[dict[str, str], str]] = []
+        self._walk(segments, "", {}, found)
+
+        with ThreadPoolExecutor(max_workers=self.client.max_connections) as pool:
+            listed = list(pool.map(lambda item: self._version(item[1]), found))
+
+        groups: dict[tuple[tuple[str, str], ...], list[dict[str, Any]]] = {}
+        for (values, prefix), (objects, reused) in zip(found, listed):
+            self.fresh_cache[prefix] = {"objects": objects}
+            if reused:
+                self.reused += 1
+            else:
+                self.relisted += 1
+            labels = tuple((k, v) for k, v in values.items() if k != "version")
+            groups.setdefault(labels, []).append(
+                {"version": values["version"], **_version_summary(prefix, objects)}
+            )
+
+        entries = []
+        for labels, group in sorted(groups.items()):
+            group.sort(key=lambda v: _version_number(v["version"]))
+            latest = group[-1]
+            for version in group:
+                version["latest"] = version is latest
+            previous = group[-2] if len(group) > 1 else None
+            entries.append(
+                {
+                    **dict(labels),
+                    "latest_version": latest["version"],
+                    "latest_bytes": latest["bytes"],
+                    "growth_bytes": latest["bytes"] - previous["bytes"] if previous else None,
+                    "versions": group,
+                }
+            )
+        return entries
+
+    def _walk(
+        self,
+        segments: list[str],
+        prefix: str,
+        values: dict[str, str],
+        found: list[tuple[dict[str, str], str]],
+    ) -> None:
+        if not segments:
+            if "version" in values:
+                found.append((values, prefix))
+            return
+        segment, rest = segments[0], segments[1:]
+        if not _PLACEHOLDER.search(segment):
+            self._walk(rest, f"{prefix}{segment}/", values, found)
+            return
+
+        parts = _PLACEHOLDER.split(segment)
+        matcher = re.compile(
+            "".join(
+                f"(?P<{part}>[^/]+)" if index % 2 else re.escape(part)
+                for index, part in enumerate(parts)
+            )
+        )
+        for child in self.client.list_common_prefixes(self.bucket, prefix):
+            match = matcher.fullmatch(child[len(prefix) :].rstrip("/"))
+            if match:
+                self._walk(rest, child, {**values, **match.groupdict()}, found)
+
+    def _version(self, prefix: str) -> tuple[list[dict[str, Any]], bool]:
+        """Return the objects under a version prefix and whether the cache was reused."""
+        cached = self.cache.get(prefix, {}).get("objects")
+        if cached:
+            first = cached[0]
+            try:
+                changed = self.client.head_object(
+                    self.bucket, first["key"], first["etag"], _http_date(first["last_modified"])
+                )
+            except S3Error as e:
+                # A deleted object (404) or failed precondition (412) means the
+                # version changed under us; relist it instead of failing.
+                if e.status not in (404, 412):
+                    raise
+            else:
+                if changed is None:
+                    return cached, True
+        objects = sorted(self.client.iter_objects(self.bucket, prefix), key=lambda o: o["key"])
+        return objects, False
+
+
+def _version_summary(prefix: str, objects: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "prefix": prefix,
+        "objects": {obj["key"][len(prefix) :]: obj["size"] for obj in objects},
+        "bytes": sum(obj["size"] for obj in objects),
+        "last_modified": max((obj["last_modified"] for obj in objects), default=None),
+    }
+
+
+def _http_date(timestamp: str | None) -> str | None:
+    """Convert a ListObjects ISO timestamp to the HTTP date If-Modified-Since expects."""
+    if not timestamp:
+        return None
+    return format_datetime(datetime.fromisoformat(timestamp.replace("Z", "+00:00")), usegmt=True)
+
+
+def _version_number(version: str) -> tuple[int, str]:
+    return (int(version), "") if version.isdigit() else (-1, version)
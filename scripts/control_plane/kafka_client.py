@@ -0,0 +1,529 @@
+"""Minimal native Kafka admin client for control-plane inventory.
+
+Speaks the Kafka wire protocol directly against the single local Redpanda
+broker, using fixed non-flexible API versions that Redpanda supports:
+Metadata v1, ListOffsets v1, ListGroups v0, DescribeGroups v0,
+OffsetFetch v2 and DescribeConfigs v0 for reads, and CreateTopics v1,
+CreatePartitions v0 and IncrementalAlterConfigs v0 for topic changes.
+Requests are pipelined over one connection: a batch is written in full and
+the responses are read back in order, so a complete messaging snapshot
+takes two round trips.
+"""
+
+import os
+import socket
+import struct
+import threading
+from typing import Any
+
+KAFKA_HOST = "localhost"
+KAFKA_PORT = 9092
+KAFKA_CONNECT_TIMEOUT = 2
+KAFKA_REQUEST_TIMEOUT = 10
+KAFKA_CLIENT_ID = "platformctl"
+
+_LIST_OFFSETS = 2
+_METADATA = 3
+_OFFSET_FETCH = 9
+_DESCRIBE_GROUPS = 15
+_LIST_GROUPS = 16
+_CREATE_TOPICS = 19
+_DESCRIBE_CONFIGS = 32
+_CREATE_PARTITIONS = 37
+_INCREMENTAL_ALTER_CONFIGS = 44
+
+_TOPIC_RESOURCE = 2
+_CONFIG_SET = 0
+_ADMIN_TIMEOUT_MS = 10_000
+
+_LATEST_TIMESTAMP = -1
+_EARLIEST_TIMESTAMP = -2
+
+
+class KafkaError(Exception):
+    """Error reported by the broker or raised by the protocol client."""
+
+    pass
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+
+    def int8(self, value: int) -> "_Writer":
+        self._parts.append(struct.pack("!b", value))
+        return self
+
+    def int16(self, value: int) -> "_Writer":
+        self._parts.append(struct.pack("!h", value))
+        return self
+
+    def int32(self, value: int) -> "_Writer":
+        self._parts.append(struct.pack("!i", value))
+        return self
+
+    def int64(self, value: int) -> "_Writer":
+        self._parts.append(struct.pack("!q", value))
+        return self
+
+    def string(self, value: str | None) -> "_Writer":
+        if value is None:
+            return self.int16(-1)
+        encoded = value.encode("utf-8")
+        self.int16(len(encoded))
+        self._parts.append(encoded)
+        return self
+
+    def getvalue(self) -> bytes:
+        return b"".join(self._parts)
+
+
+class _Reader:
+    def __init__(self, payload: bytes):
+        self._payload = payload
+        self._offset = 0
+
+    def _unpack(self, fmt: str, size: int) -> Any:
+        value = struct.unpack_from(fmt, self._payload, self._offset)[0]
+        self._offset += size
+        return value
+
+    def int8(self) -> int:
+        return self._unpack("!b", 1)
+
+    def int16(self) -> int:
+        return self._unpack("!h", 2)
+
+    def int32(self) -> int:
+        return self._unpack("!i", 4)
+
+    def int64(self) -> int:
+        return self._unpack("!q", 8)
+
+    def string(self) -> str | None:
+        length = self.int16()
+        if length < 0:
+            return None
+        value = self._payload[self._offset : self._offset + length].decode("utf-8")
+        self._offset += length
+        return value
+
+    def skip_bytes(self) -> None:
+        length = self.int32()
+        if length > 0:
+            self._offset += length
+
+    def count(self) -> int:
+        return max(self.int32(), 0)
+
+
+class KafkaAdminClient:
+    """Read-only Kafka admin operations over a single broker connection."""
+
+    def __init__(
+        self,
+        host: str = KAFKA_HOST,
+        port: int = KAFKA_PORT,
+        connect_timeout: float = KAFKA_CONNECT_TIMEOUT,
+        request_timeout: float = KAFKA_REQUEST_TIMEOUT,
+    ):
+        self.host = host
+        self.port = port
+        self._connect_timeout = connect_timeout
+        self._request_timeout = request_timeout
+        self._sock: socket.socket | None = None
+        self._buffer = b""
+        self._correlation_id = 0
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def snapshot(
+        self, groups: list[str], config_topics: list[str] | None = None
+    ) -> dict[str, Any]:
+        """Fetch metadata, group state and all offsets for ``groups``.
+
+        Returns ``{"brokers", "controller_id", "topics", "groups",
+        "group_offsets", "topic_offsets", "topic_configs"}`` where topic
+        offsets map ``(topic, partition)`` to ``(log_start, high_watermark)``
+        and topic configs are fetched for ``config_topics`` that exist.
+        """
+        config_topics = config_topics or []
+        requests = [(_METADATA, 1, _metadata_request()), (_LIST_GROUPS, 0, b"")]
+        if config_topics:
+            requests.append((_DESCRIBE_CONFIGS, 0, _describe_configs_request(config_topics)))
+        if groups:
+            requests.append((_DESCRIBE_GROUPS, 0, _describe_groups_request(groups)))
+        requests.extend((_OFFSET_FETCH, 2, _offset_fetch_request(group)) for group in groups)
+        responses = iter(self.batch(requests))
+
+        metadata = _parse_metadata(next(responses))
+        listed = _parse_list_groups(next(responses))
+        topic_configs = _parse_describe_configs(next(responses)) if config_topics else {}
+        described = _parse_describe_groups(next(responses)) if groups else {}
+        group_offsets = {group: _parse_offset_fetch(next(responses)) for group in groups}
+
+        partitions = {
+            name: topic["partitions"] for name, topic in metadata["topics"].items()
+        }
+        latest, earliest = self.batch(
+            [
+                (_LIST_OFFSETS, 1, _list_offsets_request(partitions, _LATEST_TIMESTAMP)),
+                (_LIST_OFFSETS, 1, _list_offsets_request(partitions, _EARLIEST_TIMESTAMP)),
+            ]
+        )
+        high_watermarks = _parse_list_offsets(latest)
+        log_starts = _parse_list_offsets(earliest)
+        topic_offsets = {
+            key: (log_starts.get(key, 0), high_watermark)
+            for key, high_watermark in high_watermarks.items()
+        }
+
+        return {
+            "brokers": metadata["brokers"],
+            "controller_id": metadata["controller_id"],
+            "topics": metadata["topics"],
+            "groups": {
+                name: described.get(name, {"state": None, "members": None}) for name in listed
+            },
+            "group_offsets": group_offsets,
+            "topic_offsets": topic_offsets,
+            "topic_configs": topic_configs,
+        }
+
+    def topic_partitions(self) -> dict[str, list[int]]:
+        """Return partition ids for every topic in the cluster."""
+        (payload,) = self.batch([(_METADATA, 1, _metadata_request())])
+        return {
+            name: topic["partitions"] for name, topic in _parse_metadata(payload)["topics"].items()
+        }
+
+    def high_watermarks(self, partitions: dict[str, list[int]]) -> dict[tuple[str, int], int]:
+        """Return the latest offset of each ``(topic, partition)``."""
+        if not partitions:
+            return {}
+        (payload,) = self.batch(
+            [(_LIST_OFFSETS, 1, _list_offsets_request(partitions, _LATEST_TIMESTAMP))]
+        )
+        return _parse_list_offsets(payload)
+
+    def apply_topics(
+        self,
+        create: dict[str, tuple[int, int, dict[str, str]]],
+        partitions: dict[str, int],
+        configs: dict[str, dict[str, str]],
+    ) -> dict[str, str]:
+        """Create topics, add partitions and set configs in one pipelined batch.
+
+        ``create`` maps a topic to ``(partitions, replication_factor, configs)``;
+        ``partitions`` maps existing topics to their new total partition count.
+        Returns ``{topic: error message}`` for every operation that failed.
+        """
+        requests = []
+        parsers = []
+        if create:
+            requests.append((_CREATE_TOPICS, 1, _create_topics_request(create)))
+            parsers.append(_parse_create_topics)
+        if partitions:
+            requests.append((_CREATE_PARTITIONS, 0, _create_partitions_request(partitions)))
+            parsers.append(_parse_topic_results)
+        if configs:
+            requests.append(
+                (_INCREMENTAL_ALTER_CONFIGS, 0, _incremental_alter_configs_request(configs))
+            )
+            parsers.append(_parse_alter_configs)
+
+        errors: dict[str, str] = {}
+        for parse, payload in zip(parsers, self.batch(requests) if requests else []):
+            for topic, message in parse(payload).items():
+                errors[topic] = f"{errors[topic]}; {message}" if topic in errors else message
+        return errors
+
+    def batch(self, requests: list[tuple[int, int, bytes]]) -> list[bytes]:
+        """Send ``(api_key, api_version, body)`` requests pipelined; return bodies."""
+        with self._lock:
+            try:
+                sock = self._connect()
+                expected = []
+                frames = []
+                for api_key, api_version, body in requests:
+                    self._correlation_id = (self._correlation_id + 1) % 2**31
+                    expected.append(self._correlation_id)
+                    header = (
+                        _Writer()
+                        .int16(api_key)
+                        .int16(api_version)
+                        .int32(self._correlation_id)
+                        .string(KAFKA_CLIENT_ID)
+                        .getvalue()
+                    )
+                    frames.append(struct.pack("!i", len(header) + len(body)) + header + body)
+                sock.sendall(b"".join(frames))
+
+                responses = []
+                for correlation_id in expected:
+                    size = struct.unpack("!i", self._read_exact(4))[0]
+                    payload = self._read_exact(size)
+                    if struct.unpack("!i", payload[:4])[0] != correlation_id:
+                        raise KafkaError("Out-of-order response from broker")
+                    responses.append(payload[4:])
+                return responses
+            except (OSError, KafkaError):
+                self._disconnect()
+                raise
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            self._sock = socket.create_connection(
+                (self.host, self.port), timeout=self._connect_timeout
+            )
+            self._sock.settimeout(self._request_timeout)
+            self._buffer = b""
+        return self._sock
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _read_exact(self, size: int) -> bytes:
+        assert self._sock is not None
+        while len(self._buffer) < size:
+            chunk = self._sock.recv(max(65536, size - len(self._buffer)))
+            if not chunk:
+                raise KafkaError("Connection closed by broker")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _metadata_request() -> bytes:
+    # Null topic array: all topics.
+    return _Writer().int32(-1).getvalue()
+
+
+def _describe_groups_request(groups: list[str]) -> bytes:
+    writer = _Writer().int32(len(groups))
+    for group in groups:
+        writer.string(group)
+    return writer.getvalue()
+
+
+def _offset_fetch_request(group: str) -> bytes:
+    # Null topic array (v2+): every partition the group has committed.
+    return _Writer().string(group).int32(-1).getvalue()
+
+
+def _list_offsets_request(partitions: dict[str, list[int]], timestamp: int) -> bytes:
+    writer = _Writer().int32(-1).int32(len(partitions))
+    for topic, ids in partitions.items():
+        writer.string(topic).int32(len(ids))
+        for partition in ids:
+            writer.int32(partition).int64(timestamp)
+    return writer.getvalue()
+
+
+def _describe_configs_request(topics: list[str]) -> bytes:
+    writer = _Writer().int32(len(topics))
+    for topic in topics:
+        # Null config names: every config of the topic.
+        writer.int8(_TOPIC_RESOURCE).string(topic).int32(-1)
+    return writer.getvalue()
+
+
+def _create_topics_request(create: dict[str, tuple[int, int, dict[str, str]]]) -> bytes:
+    writer = _Writer().int32(len(create))
+    for topic, (num_partitions, replication_factor, configs) in create.items():
+        writer.string(topic).int32(num_partitions).int16(replication_factor).int32(0)
+        writer.int32(len(configs))
+        for name, value in configs.items():
+            writer.string(name).string(value)
+    return writer.int32(_ADMIN_TIMEOUT_MS).int8(0).getvalue()
+
+
+def _create_partitions_request(partitions: dict[str, int]) -> bytes:
+    writer = _Writer().int32(len(partitions))
+    for topic, count in partitions.items():
+        writer.string(topic).int32(count).int32(-1)
+    return writer.int32(_ADMIN_TIMEOUT_MS).int8(0).getvalue()
+
+
+def _incremental_alter_configs_request(configs: dict[str, dict[str, str]]) -> bytes:
+    writer = _Writer().int32(len(configs))
+    for topic, values in configs.items():
+        writer.int8(_TOPIC_RESOURCE).string(topic).int32(len(values))
+        for name, value in values.items():
+            writer.string(name).int8(_CONFIG_SET).string(value)
+    return writer.int8(0).getvalue()
+
+
+def _parse_metadata(payload: bytes) -> dict[str, Any]:
+    reader = _Reader(payload)
+    brokers = []
+    for _ in range(reader.count()):
+        node_id = reader.int32()
+        host = reader.string()
+        port = reader.int32()
+        reader.string()  # rack
+        brokers.append({"node_id": node_id, "host": host, "port": port})
+    controller_id = reader.int32()
+
+    topics: dict[str, dict[str, Any]] = {}
+    for _ in range(reader.count()):
+        error_code = reader.int16()
+        name = reader.string() or ""
+        internal = bool(reader.int8())
+        partitions = []
+        for _ in range(reader.count()):
+            reader.int16()  # partition error code
+            partitions.append(reader.int32())
+            reader.int32()  # leader
+            for _ in range(reader.count()):
+                reader.int32()  # replicas
+            for _ in range(reader.count()):
+                reader.int32()  # isr
+        if error_code == 0:
+            topics[name] = {"partitions": sorted(partitions), "internal": internal}
+    return {"brokers": brokers, "controller_id": controller_id, "topics": topics}
+
+
+def _parse_list_groups(payload: bytes) -> list[str]:
+    reader = _Reader(payload)
+    error_code = reader.int16()
+    if error_code != 0:
+        raise KafkaError(f"ListGroups failed with error code {error_code}")
+    groups = []
+    for _ in range(reader.count()):
+        groups.append(reader.string() or "")
+        reader.string()  # protocol type
+    return groups
+
+
+def _parse_describe_groups(payload: bytes) -> dict[str, dict[str, Any]]:
+    reader = _Reader(payload)
+    groups: dict[str, dict[str, Any]] = {}
+    for _ in range(reader.count()):
+        error_code = reader.int16()
+        group_id = reader.string() or ""
+        state = reader.string()
+        reader.string()  # protocol type
+        reader.string()  # protocol
+        members = reader.count()
+        for _ in range(members):
+            reader.string()  # member id
+            reader.string()  # client id
+            reader.string()  # client host
+            reader.skip_bytes()  # metadata
+            reader.skip_bytes()  # assignment
+        if error_code == 0:
+            groups[group_id] = {"state": state, "members": members}
+    return groups
+
+
+def _parse_offset_fetch(payload: bytes) -> dict[tuple[str, int], int]:
+    reader = _Reader(payload)
+    offsets: dict[tuple[str, int], int] = {}
+    for _ in range(reader.count()):
+        topic = reader.string() or ""
+        for _ in range(reader.count()):
+            partition = reader.int32()
+            committed = reader.int64()
+            reader.string()  # metadata
+            error_code = reader.int16()
+            if error_code == 0 and committed >= 0:
+                offsets[(topic, partition)] = committed
+    error_code = reader.int16()
+    if error_code != 0:
+        raise KafkaError(f"OffsetFetch failed with error code {error_code}")
+    return offsets
+
+
+def _parse_describe_configs(payload: bytes) -> dict[str, dict[str, str | None]]:
+    reader = _Reader(payload)
+    reader.int32()  # throttle time
+    configs: dict[str, dict[str, str | None]] = {}
+    for _ in range(reader.count()):
+        error_code = reader.int16()
+        reader.string()  # error message
+        reader.int8()  # resource type
+        name = reader.string() or ""
+        values: dict[str, str | None] = {}
+        for _ in range(reader.count()):
+            key = reader.string() or ""
+            values[key] = reader.string()
+            reader.int8()  # read only
+            reader.int8()  # is default
+            reader.int8()  # is sensitive
+        if error_code == 0:
+            configs[name] = values
+    return configs
+
+
+def _parse_create_topics(payload: bytes) -> dict[str, str]:
+    reader = _Reader(payload)
+    errors: dict[str, str] = {}
+    for _ in range(reader.count()):
+        name = reader.string() or ""
+        error_code = reader.int16()
+        message = reader.string()
+        if error_code != 0:
+            errors[name] = message or f"CreateTopics error code {error_code}"
+    return errors
+
+
+def _parse_topic_results(payload: bytes) -> dict[str, str]:
+    reader = _Reader(payload)
+    reader.int32()  # throttle time
+    errors: dict[str, str] = {}
+    for _ in range(reader.count()):
+        name = reader.string() or ""
+        error_code = reader.int16()
+        message = reader.string()
+        if error_code != 0:
+            errors[name] = message or f"CreatePartitions error code {error_code}"
+    return errors
+
+
+def _parse_alter_configs(payload: bytes) -> dict[str, str]:
+    reader = _Reader(payload)
+    reader.int32()  # throttle time
+    errors: dict[str, str] = {}
+    for _ in range(reader.count()):
+        error_code = reader.int16()
+        message = reader.string()
+        reader.int8()  # resource type
+        name = reader.string() or ""
+        if error_code != 0:
+            errors[name] = message or f"IncrementalAlterConfigs error code {error_code}"
+    return errors
+
+
+def _parse_list_offsets(payload: bytes) -> dict[tuple[str, int], int]:
+    reader = _Reader(payload)
+    offsets: dict[tuple[str, int], int] = {}
+    for _ in range(reader.count()):
+        topic = reader.string() or ""
+        for _ in range(reader.count()):
+            partition = reader.int32()
+            error_code = reader.int16()
+            reader.int64()  # timestamp
+            offset = reader.int64()
+            if error_code == 0:
+                offsets[(topic, partition)] = offset
+    return offsets
+
+
+_admin: KafkaAdminClient | None = None
+
+
+def get_kafka_admin() -> KafkaAdminClient:
+    """Get the admin client for the local broker (connects lazily)."""
+    global _admin
+    if _admin is None:
+        _admin = KafkaAdminClient(
+            host=os.environ.get("KAFKA_HOST", KAFKA_HOST),
+            port=int(os.environ.get("KAFKA_PORT", KAFKA_PORT)),
+        )
+    return _admin
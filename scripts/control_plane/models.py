@@ -200,6 +200,47 @@ class CollectorResult:
     data: dict[str, Any] | None = None
     error: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "collector": self.collector,
+            "success": self.success,
+            "data": self.data,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CollectorResult":
+        return cls(
+            collector=data["collector"],
+            success=data["success"],
+            data=data.get("data"),
+            error=data.get("error"),
+        )
+
+
+@dataclass
+class ContainerState:
+    name: str
+    status: str
+    running: bool
+    health: str | None = None
+    compose_project: str = ""
+    compose_service: str = ""
+    restart_count: int = 0
+    ports: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "running": self.running,
+            "health": self.health,
+            "compose_project": self.compose_project,
+            "compose_service": self.compose_service,
+            "restart_count": self.restart_count,
+            "ports": self.ports,
+        }
+
 
 @dataclass
 class HealthAggregate:
@@ -221,3 +262,17 @@ class HealthAggregate:
             "source_path": self.source_path,
             "message": self.message,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "HealthAggregate":
+        return cls(
+            service=data["service"],
+            runtime=data["runtime"],
+            status=HealthStatus(data["status"]),
+            checked_at=datetime.fromisoformat(data["checked_at"]),
+            dependencies={
+                k: HealthStatus(v) for k, v in data.get("dependencies", {}).items()
+            },
+            source_path=data.get("source_path", ""),
+            message=data.get("message", ""),
+        )
@@ -0,0 +1,358 @@
+"""Minimal native PostgreSQL client for control-plane database work.
+
+Implements just enough of the frontend/backend protocol (v3) for
+control-plane queries: startup with trust, cleartext, MD5 or SCRAM-SHA-256
+authentication, the simple query protocol, and typed row decoding for the
+common built-in types. Connections are kept in a small pool for the lifetime
+of a command or daemon.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import socket
+import struct
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Any
+
+PG_HOST = "localhost"
+PG_PORT = 5432
+PG_DATABASE = "fraud_gov"
+PG_ADMIN_USER = "postgres"
+PG_PASSWORD_ENV = "POSTGRES_ADMIN_PASSWORD"
+PG_CONNECT_TIMEOUT = 5
+PG_QUERY_TIMEOUT = 15
+PG_POOL_SIZE = 4
+PG_APPLICATION_NAME = "platformctl"
+
+_PROTOCOL_VERSION = 196608
+
+_BOOL_OID = 16
+_INT_OIDS = {20, 21, 23, 26, 28}
+_FLOAT_OIDS = {700, 701, 1700}
+_TIMESTAMP_OIDS = {1114, 1184}
+_DATE_OID = 1082
+
+
+class PgError(Exception):
+    """Error reported by PostgreSQL or raised by the protocol client."""
+
+    pass
+
+
+class PgConnectError(PgError):
+    """The server could not be reached or the startup handshake was cut off."""
+
+    pass
+
+
+class PgConnection:
+    """A single PostgreSQL connection speaking the simple query protocol."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        database: str,
+        connect_timeout: float = PG_CONNECT_TIMEOUT,
+        query_timeout: float = PG_QUERY_TIMEOUT,
+    ):
+        self.user = user
+        self.broken = False
+        self._password = password
+        try:
+            self._sock = socket.create_connection((host, port), timeout=connect_timeout)
+        except OSError as e:
+            raise PgConnectError(f"Cannot connect to {host}:{port}: {e}") from e
+        self._sock.settimeout(query_timeout)
+        self._buffer = b""
+        try:
+            self._startup(user, database)
+        except OSError as e:
+            self.close()
+            raise PgConnectError(f"Handshake with {host}:{port} failed: {e}") from e
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        try:
+            self._sock.sendall(b"X" + struct.pack("!i", 4))
+        except OSError:
+            pass
+        self._sock.close()
+
+    def query(self, sql: str) -> list[dict[str, Any]]:
+        """Run a query and return the rows of its last result set."""
+        self._send(b"Q", sql.encode("utf-8") + b"\x00")
+        columns: list[tuple[str, int]] = []
+        rows: list[dict[str, Any]] = []
+        error: str | None = None
+        while True:
+            kind, payload = self._read_message()
+            if kind == b"T":
+                columns = _parse_row_description(payload)
+                rows = []
+            elif kind == b"D":
+                rows.append(_parse_data_row(payload, columns))
+            elif kind == b"E":
+                error = _parse_error(payload)
+            elif kind == b"Z":
+                break
+        if error is not None:
+            raise PgError(error)
+        return rows
+
+    def _startup(self, user: str, database: str) -> None:
+        params = {
+            "user": user,
+            "database": database,
+            "application_name": PG_APPLICATION_NAME,
+            "client_encoding": "UTF8",
+        }
+        body = struct.pack("!i", _PROTOCOL_VERSION)
+        for key, value in params.items():
+            body += key.encode() + b"\x00" + value.encode() + b"\x00"
+        body += b"\x00"
+        self._sock.sendall(struct.pack("!i", len(body) + 4) + body)
+
+        scram: _ScramSha256 | None = None
+        while True:
+            kind, payload = self._read_message()
+            if kind == b"E":
+                raise PgError(_parse_error(payload))
+            if kind == b"Z":
+                return
+            if kind != b"R":
+                continue
+
+            code = struct.unpack("!i", payload[:4])[0]
+            if code == 0:
+                continue
+            if code == 3:
+                self._send(b"p", self._password.encode() + b"\x00")
+            elif code == 5:
+                inner = hashlib.md5((self._password + user).encode()).hexdigest()
+                digest = hashlib.md5(inner.encode() + payload[4:8]).hexdigest()
+                self._send(b"p", b"md5" + digest.encode() + b"\x00")
+            elif code == 10:
+                mechanisms = payload[4:].split(b"\x00")
+                if b"SCRAM-SHA-256" not in mechanisms:
+                    raise PgError(f"Unsupported SASL mechanisms: {mechanisms}")
+                scram = _ScramSha256(self._password)
+                first = scram.client_first()
+                self._send(
+                    b"p",
+                    b"SCRAM-SHA-256\x00" + struct.pack("!i", len(first)) + first,
+                )
+            elif code == 11 and scram is not None:
+                self._send(b"p", scram.client_final(payload[4:]))
+            elif code == 12 and scram is not None:
+                scram.verify_server_final(payload[4:])
+            else:
+                raise PgError(f"Unsupported authentication request: {code}")
+
+    def _send(self, kind: bytes, payload: bytes) -> None:
+        self._sock.sendall(kind + struct.pack("!i", len(payload) + 4) + payload)
+
+    def _read_exact(self, size: int) -> bytes:
+        while len(self._buffer) < size:
+            chunk = self._sock.recv(max(65536, size - len(self._buffer)))
+            if not chunk:
+                self.broken = True
+                raise PgError("Connection closed by server")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def _read_message(self) -> tuple[bytes, bytes]:
+        header = self._read_exact(5)
+        length = struct.unpack("!i", header[1:])[0]
+        return header[:1], self._read_exact(length - 4)
+
+
+class _ScramSha256:
+    """Client side of SCRAM-SHA-256 (RFC 7677) as used by PostgreSQL."""
+
+    def __init__(self, password: str):
+        self._password = password.encode("utf-8")
+        self._nonce = base64.b64encode(secrets.token_bytes(18)).decode()
+        self._client_first_bare = f"n=,r={self._nonce}"
+        self._auth_message = b""
+        self._salted_password = b""
+
+    def client_first(self) -> bytes:
+        return f"n,,{self._client_first_bare}".encode()
+
+    def client_final(self, server_first: bytes) -> bytes:
+        attrs = dict(part.split("=", 1) for part in server_first.decode().split(","))
+        if not attrs["r"].startswith(self._nonce):
+            raise PgError("SCRAM server nonce mismatch")
+        self._salted_password = hashlib.pbkdf2_hmac(
+            "sha256", self._password, base64.b64decode(attrs["s"]), int(attrs["i"])
+        )
+        without_proof = f"c=biws,r={attrs['r']}"
+        self._auth_message = (
+            f"{self._client_first_bare},{server_first.decode()},{without_proof}"
+        ).encode()
+        client_key = hmac.digest(self._salted_password, b"Client Key", "sha256")
+        stored_key = hashlib.sha256(client_key).digest()
+        signature = hmac.digest(stored_key, self._auth_message, "sha256")
+        proof = bytes(a ^ b for a, b in zip(client_key, signature))
+        return f"{without_proof},p={base64.b64encode(proof).decode()}".encode()
+
+    def verify_server_final(self, server_final: bytes) -> None:
+        attrs = dict(part.split("=", 1) for part in server_final.decode().split(","))
+        server_key = hmac.digest(self._salted_password, b"Server Key", "sha256")
+        expected = hmac.digest(server_key, self._auth_message, "sha256")
+        if not hmac.compare_digest(base64.b64decode(attrs.get("v", "")), expected):
+            raise PgError("SCRAM server signature mismatch")
+
+
+def _parse_row_description(payload: bytes) -> list[tuple[str, int]]:
+    count = struct.unpack("!h", payload[:2])[0]
+    offset = 2
+    columns = []
+    for _ in range(count):
+        end = payload.index(b"\x00", offset)
+        name = payload[offset:end].decode("utf-8")
+        offset = end + 1
+        type_oid = struct.unpack("!i", payload[offset + 6 : offset + 10])[0]
+        offset += 18
+        columns.append((name, type_oid))
+    return columns
+
+
+def _parse_data_row(payload: bytes, columns: list[tuple[str, int]]) -> dict[str, Any]:
+    count = struct.unpack("!h", payload[:2])[0]
+    offset = 2
+    row: dict[str, Any] = {}
+    for index in range(count):
+        length = struct.unpack("!i", payload[offset : offset + 4])[0]
+        offset += 4
+        name, type_oid = columns[index] if index < len(columns) else (str(index), 0)
+        if length < 0:
+            row[name] = None
+            continue
+        row[name] = decode_value(payload[offset : offset + length].decode("utf-8"), type_oid)
+        offset += length
+    return row
+
+
+def _parse_error(payload: bytes) -> str:
+    fields: dict[str, str] = {}
+    for part in payload.split(b"\x00"):
+        if part:
+            fields[chr(part[0])] = part[1:].decode("utf-8", errors="replace")
+    return f"{fields.get('S', 'ERROR')}: {fields.get('M', 'unknown error')}"
+
+
+def decode_value(text: str, type_oid: int) -> Any:
+    """Convert a text-format column value to a Python value."""
+    if type_oid == _BOOL_OID:
+        return text == "t"
+    if type_oid in _INT_OIDS:
+        return int(text)
+    if type_oid in _FLOAT_OIDS:
+        return float(text)
+    if type_oid in _TIMESTAMP_OIDS:
+        return datetime.fromisoformat(text)
+    if type_oid == _DATE_OID:
+        return date.fromisoformat(text)
+    return text
+
+
+class PgPool:
+    """Small pool of PostgreSQL connections reused across queries."""
+
+    def __init__(
+        self,
+        password: str,
+        host: str = PG_HOST,
+        port: int = PG_PORT,
+        user: str = PG_ADMIN_USER,
+        database: str = PG_DATABASE,
+        max_size: int = PG_POOL_SIZE,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.database = database
+        self.max_size = max_size
+        self._password = password
+        self._idle: list[PgConnection] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[PgConnection]:
+        """Borrow a connection, returning it to the pool if it is still healthy."""
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = PgConnection(
+                self.host, self.port, self.user, self._password, self.database
+            )
+        try:
+            yield conn
+        except OSError:
+            conn.close()
+            raise
+        except PgError:
+            if conn.broken:
+                conn.close()
+            else:
+                self._release(conn)
+            raise
+        except BaseException:
+            # The protocol state is unknown (e.g. KeyboardInterrupt mid-read).
+            conn.close()
+            raise
+        else:
+            self._release(conn)
+
+    def query(self, sql: str) -> list[dict[str, Any]]:
+        """Run a query on a pooled connection."""
+        with self.connection() as conn:
+            return conn.query(sql)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _release(self, conn: PgConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+
+_pool: PgPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pg_pool() -> PgPool | None:
+    """Get the admin connection pool, or None when no credentials are present."""
+    global _pool
+    if _pool is None:
+        password = os.environ.get(PG_PASSWORD_ENV)
+        if not password:
+            return None
+        # Collectors run concurrently; only one of them may create the pool.
+        with _pool_lock:
+            if _pool is None:
+                _pool = PgPool(
+                    password,
+                    host=os.environ.get("POSTGRES_HOST", PG_HOST),
+                    port=int(os.environ.get("POSTGRES_PORT", PG_PORT)),
+                )
+    return _pool
@@ -4,7 +4,7 @@ import json
 from typing import Any
 
 
-def format_json(data: Any, indent: int = 2) -> str:
+def format_json(data: Any, indent: int | None = 2) -> str:
     """Format data as JSON."""
     return json.dumps(data, indent=indent, default=str)
 
@@ -14,20 +14,10 @@ def format_action_json(result) -> str:
     return format_json(result.to_dict())
 
 
-def format_inventory_json(results: list) -> str:
+def format_inventory_json(results: list, indent: int | None = 2) -> str:
     """Format inventory results as JSON."""
-    data = {
-        "results": [
-            {
-                "collector": r.collector,
-                "success": r.success,
-                "data": r.data,
-                "error": r.error,
-            }
-            for r in results
-        ]
-    }
-    return format_json(data)
+    data = {"results": [r.to_dict() for r in results]}
+    return format_json(data, indent=indent)
 
 
 def format_health_json(results: list) -> str:
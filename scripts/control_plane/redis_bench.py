@@ -0,0 +1,225 @@
+"""Redis round-trip latency benchmark shaped like velocity counters.
+
+Each worker thread owns one connection and issues requests back to back
+until the duration elapses, timing every round trip. The keys live under
+``BENCH_KEY_PREFIX`` and are deleted when the run finishes. Every key is
+created with an expiry before the workers start (``INCR`` keeps it), so
+keys left behind by an interrupted run expire on their own.
+"""
+
+import json
+import math
+import random
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .redis_client import RedisClient, RedisError, new_redis
+
+BENCH_KEY_PREFIX = "platformctl:bench:velocity:"
+WORKLOADS = ("set", "get", "incr", "pipeline")
+DEFAULT_CONCURRENCY = 8
+DEFAULT_DURATION = 10.0
+DEFAULT_PIPELINE_DEPTH = 16
+DEFAULT_KEYSPACE = 10_000
+COUNTER_TTL_MS = 60_000
+_PRIME_BATCH = 1000
+# A worker that loses its connection waits before reconnecting, doubling up to the cap.
+RECONNECT_BACKOFF = 0.01
+RECONNECT_BACKOFF_MAX = 0.5
+PERCENTILES = (50.0, 95.0, 99.0, 99.9)
+
+# Upper bounds (microseconds) of the reported histogram buckets.
+HISTOGRAM_BOUNDS_US = (100, 250, 500, 1_000, 2_500, 5_000, 10_000, 25_000, 100_000)
+
+
+def _workload_commands(
+    workload: str, rng: random.Random, keyspace: int, depth: int
+) -> Callable[[], list[list[str | bytes | int]]]:
+    """Return a factory for the commands sent in one round trip."""
+
+    def key() -> str:
+        return f"{BENCH_KEY_PREFIX}card:{rng.randrange(keyspace)}"
+
+    if workload == "get":
+        return lambda: [["GET", key()]]
+    if workload == "set":
+        return lambda: [["SET", key(), rng.randrange(1_000_000), "PX", COUNTER_TTL_MS]]
+    if workload == "incr":
+        return lambda: [["INCR", key()]]
+    if workload == "pipeline":
+        # A velocity check: bump the counter and refresh its window, for a batch of cards.
+        def batch() -> list[list[str | bytes | int]]:
+            commands: list[list[str | bytes | int]] = []
+            for _ in range(depth):
+                counter = key()
+                commands.append(["INCR", counter])
+                commands.append(["PEXPIRE", counter, COUNTER_TTL_MS])
+            return commands
+
+        return batch
+    raise ValueError(f"Unknown workload: {workload}")
+
+
+def run_bench(
+    workload: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    duration: float = DEFAULT_DURATION,
+    pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+    keyspace: int = DEFAULT_KEYSPACE,
+    connect: Callable[[], RedisClient] | None = None,
+) -> dict[str, Any]:
+    """Run one workload and return throughput and latency percentiles."""
+    if concurrency < 1 or keyspace < 1 or pipeline_depth < 1:
+        raise ValueError("concurrency, keyspace and pipeline_depth must be at least 1")
+    clients = [(connect or new_redis)() for _ in range(concurrency)]
+    latencies: list[list[float]] = [[] for _ in clients]
+    errors = [0] * concurrency
+    ops_per_request = 2 * pipeline_depth if workload == "pipeline" else 1
+    start = threading.Barrier(concurrency + 1)
+
+    def worker(index: int) -> None:
+        client = clients[index]
+        commands = _workload_commands(workload, random.Random(index), keyspace, pipeline_depth)
+        samples = latencies[index]
+        start.wait()
+        deadline = time.perf_counter() + duration
+        backoff = RECONNECT_BACKOFF
+        while True:
+            batch = commands()
+            began = time.perf_counter()
+            if began >= deadline:
+                return
+            try:
+                replies = client.pipeline(batch)
+            except (OSError, RedisError):
+                # The client reconnects on the next call; don't hammer a failing server.
+                errors[index] += 1
+                time.sleep(max(min(backoff, deadline - time.perf_counter()), 0))
+                backoff = min(backoff * 2, RECONNECT_BACKOFF_MAX)
+                continue
+            backoff = RECONNECT_BACKOFF
+            samples.append((time.perf_counter() - began) * 1_000_000)
+            errors[index] += sum(isinstance(reply, RedisError) for reply in replies)
+
+    try:
+        # Warm the connections so TCP setup is not counted in the first sample.
+        for client in clients:
+            client.execute("PING")
+        # Outlive the run so INCR never recreates an expired key without a TTL.
+        prime_keyspace(clients[0], keyspace, int(duration * 1000) + COUNTER_TTL_MS)
+        threads = [
+            threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        start.wait()
+        began = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - began
+    finally:
+        for client in clients:
+            client.close()
+
+    samples = [sample for worker_samples in latencies for sample in worker_samples]
+    report = latency_report(samples, elapsed)
+    report.update(
+        {
+            "workload": workload,
+            "concurrency": concurrency,
+            "duration_seconds": duration,
+            "pipeline_depth": pipeline_depth if workload == "pipeline" else 1,
+            "keyspace": keyspace,
+            "errors": sum(errors),
+            "ops_per_second": round(report["requests_per_second"] * ops_per_request, 1),
+        }
+    )
+    return report
+
+
+def latency_report(samples_us: list[float], elapsed: float) -> dict[str, Any]:
+    """Summarize round-trip latencies (microseconds) into percentiles and a histogram."""
+    ordered = sorted(samples_us)
+    count = len(ordered)
+    histogram: dict[str, int] = {}
+    lower = 0
+    for bound in HISTOGRAM_BOUNDS_US:
+        histogram[f"<{bound}us"] = sum(1 for s in ordered if lower <= s < bound)
+        lower = bound
+    histogram[f">={HISTOGRAM_BOUNDS_US[-1]}us"] = sum(1 for s in ordered if s >= lower)
+    return {
+        "requests": count,
+        "elapsed_seconds": round(elapsed, 3),
+        "requests_per_second": round(count / elapsed, 1) if elapsed else 0.0,
+        "latency_us": {
+            **{f"p{p:g}": round(percentile(ordered, p), 1) for p in PERCENTILES},
+            "mean": round(sum(ordered) / count, 1) if count else 0.0,
+            "max": round(ordered[-1], 1) if count else 0.0,
+        },
+        "histogram": histogram,
+    }
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    # Round first so 99.9% of 1000 samples is rank 999, not 1000 from float error.
+    rank = max(math.ceil(round(pct * len(ordered) / 100, 9)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def prime_keyspace(client: RedisClient, keyspace: int, ttl_ms: int) -> None:
+    """Create every benchmark key with an expiry of ``ttl_ms``."""
+    for offset in range(0, keyspace, _PRIME_BATCH):
+        client.pipeline(
+            [
+                ["SET", f"{BENCH_KEY_PREFIX}card:{n}", 0, "PX", ttl_ms]
+                for n in range(offset, min(offset + _PRIME_BATCH, keyspace))
+            ]
+        )
+
+
+def cleanup_bench_keys(client: RedisClient, keyspace: int) -> int:
+    """Delete the benchmark keys; returns how many existed."""
+    keys = [f"{BENCH_KEY_PREFIX}card:{n}" for n in range(keyspace)]
+    deleted = 0
+    for offset in range(0, len(keys), 1000):
+        deleted += client.execute("UNLINK", *keys[offset : offset + 1000])
+    return deleted
+
+
+class BenchLog:
+    """Append benchmark runs to a JSONL file so runs can be compared."""
+
+    def __init__(self, log_path: Path | None = None):
+        if log_path is None:
+            log_path = (
+                Path(__file__).parent.parent.parent
+                / "control-plane"
+                / "logs"
+                / "redis-bench.jsonl"
+            )
+        self.log_path = log_path
+
+    def append(self, results: list[dict[str, Any]]) -> None:
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        record = {"timestamp": datetime.now(timezone.utc).isoformat(), "results": results}
+        with open(self.log_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def previous(self) -> dict[str, dict[str, Any]]:
+        """Return the most recent earlier result for each workload."""
+        if not self.log_path.exists():
+            return {}
+        latest: dict[str, dict[str, Any]] = {}
+        with open(self.log_path, "r") as f:
+            for line in f:
+                if line.strip():
+                    for result in json.loads(line).get("results", []):
+                        latest[result["workload"]] = result
+        return latest
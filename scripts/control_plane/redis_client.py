@@ -0,0 +1,167 @@
+"""Minimal native Redis client for control-plane inventory.
+
+Speaks RESP2 over a plain TCP socket and pipelines a batch of commands in a
+single round trip: all commands are written at once and the replies are read
+back in order. Error replies are returned in place as ``RedisError`` values
+so one failing command does not hide the others.
+"""
+
+import os
+import socket
+import threading
+from typing import Any
+
+REDIS_HOST = "localhost"
+REDIS_PORT = 6379
+REDIS_CONNECT_TIMEOUT = 2
+REDIS_COMMAND_TIMEOUT = 5
+
+
+class RedisError(Exception):
+    """Error reply from Redis or a protocol failure."""
+
+    pass
+
+
+class RedisClient:
+    """A single pipelining Redis connection."""
+
+    def __init__(
+        self,
+        host: str = REDIS_HOST,
+        port: int = REDIS_PORT,
+        password: str | None = None,
+        connect_timeout: float = REDIS_CONNECT_TIMEOUT,
+        command_timeout: float = REDIS_COMMAND_TIMEOUT,
+    ):
+        self.host = host
+        self.port = port
+        self._password = password
+        self._connect_timeout = connect_timeout
+        self._command_timeout = command_timeout
+        self._sock: socket.socket | None = None
+        self._buffer = b""
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def execute(self, *args: str | bytes | int) -> Any:
+        """Run one command and return its reply, raising on an error reply."""
+        (reply,) = self.pipeline([list(args)])
+        if isinstance(reply, RedisError):
+            raise reply
+        return reply
+
+    def pipeline(self, commands: list[list[str | bytes | int]]) -> list[Any]:
+        """Send ``commands`` in one write and return their replies in order."""
+        if not commands:
+            return []
+        with self._lock:
+            try:
+                sock = self._connect()
+                sock.sendall(b"".join(encode_command(command) for command in commands))
+                return [self._read_reply() for _ in commands]
+            except (OSError, RedisError):
+                self._disconnect()
+                raise
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            self._sock = socket.create_connection(
+                (self.host, self.port), timeout=self._connect_timeout
+            )
+            self._sock.settimeout(self._command_timeout)
+            self._buffer = b""
+            if self._password:
+                self._sock.sendall(encode_command(["AUTH", self._password]))
+                reply = self._read_reply()
+                if isinstance(reply, RedisError):
+                    raise reply
+        return self._sock
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _fill(self) -> None:
+        assert self._sock is not None
+        chunk = self._sock.recv(65536)
+        if not chunk:
+            raise RedisError("Connection closed by server")
+        self._buffer += chunk
+
+    def _read_line(self) -> bytes:
+        while b"\r\n" not in self._buffer:
+            self._fill()
+        line, self._buffer = self._buffer.split(b"\r\n", 1)
+        return line
+
+    def _read_exact(self, size: int) -> bytes:
+        while len(self._buffer) < size + 2:
+            self._fill()
+        data, self._buffer = self._buffer[:size], self._buffer[size + 2 :]
+        return data
+
+    def _read_reply(self) -> Any:
+        line = self._read_line()
+        kind, rest = line[:1], line[1:]
+        if kind == b"+":
+            return rest.decode("utf-8", errors="replace")
+        if kind == b"-":
+            return RedisError(rest.decode("utf-8", errors="replace"))
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            return self._read_exact(length).decode("utf-8", errors="replace")
+        if kind == b"*":
+            length = int(rest)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected RESP reply: {line[:40]!r}")
+
+
+def encode_command(args: list[str | bytes | int]) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def parse_info(text: str) -> dict[str, str]:
+    """Parse ``INFO`` output into a flat ``key -> value`` map."""
+    info: dict[str, str] = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#") or ":" not in line:
+            continue
+        key, value = line.split(":", 1)
+        info[key] = value.strip()
+    return info
+
+
+_client: RedisClient | None = None
+
+
+def new_redis() -> RedisClient:
+    """Create a separate client for the local Redis (connects lazily)."""
+    return RedisClient(
+        host=os.environ.get("REDIS_HOST", REDIS_HOST),
+        port=int(os.environ.get("REDIS_PORT", REDIS_PORT)),
+        password=os.environ.get("REDIS_PASSWORD") or None,
+    )
+
+
+def get_redis() -> RedisClient:
+    """Get the shared client for the local Redis (connects lazily)."""
+    global _client
+    if _client is None:
+        _client = new_redis()
+    return _client
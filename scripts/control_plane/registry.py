@@ -24,6 +24,16 @@ class Registry:
         self._registry_path = registry_path
         self._registry: ServiceRegistry | None = None
 
+    @property
+    def path(self) -> Path:
+        """Path to the services.yaml registry file."""
+        return self._registry_path
+
+    def reload(self) -> ServiceRegistry:
+        """Drop the cached registry and parse services.yaml again."""
+        self._registry = None
+        return self.load()
+
     def load(self) -> ServiceRegistry:
         """Load and parse the services.yaml registry."""
         if self._registry is not None:
@@ -0,0 +1,364 @@
+"""Minimal native S3 client for the local MinIO.
+
+Signs requests with AWS Signature Version 4 and sends them over one pooled
+``httpx.Client``, so bucket listing does not depend on an ``mc`` alias being
+configured inside the MinIO container. Only the read calls the control
+plane needs are implemented: ListBuckets, ListObjectsV2 (with continuation
+pagination), conditional HeadObject, timed and presigned GetObject, and the
+MinIO readiness probe. Requests use path-style addressing, which MinIO
+accepts without DNS for bucket subdomains.
+"""
+
+import hashlib
+import hmac
+import os
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+
+MINIO_HOST = "localhost"
+MINIO_PORT = 9000
+S3_DEFAULT_REGION = "us-east-1"
+S3_TIMEOUT = 10
+S3_MAX_CONNECTIONS = 8
+S3_PAGE_SIZE = 1000
+S3_PRESIGN_EXPIRES = 300
+
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+_NS = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+
+
+class S3Error(Exception):
+    """Error response from the S3 API."""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+class S3Client:
+    """SigV4-signing S3 client over a shared connection pool."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        access_key: str,
+        secret_key: str,
+        region: str = S3_DEFAULT_REGION,
+        timeout: float = S3_TIMEOUT,
+        max_connections: int = S3_MAX_CONNECTIONS,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self.endpoint = endpoint.rstrip("/")
+        self.region = region
+        self.max_connections = max_connections
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._client = httpx.Client(
+            base_url=self.endpoint,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            transport=transport,
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def ready(self) -> bool:
+        """Check MinIO's unauthenticated readiness endpoint."""
+        try:
+            return self._client.get("/minio/health/ready").status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    def list_buckets(self) -> list[dict[str, Any]]:
+        """List buckets (``GET /``)."""
+        root = self._get_xml("/")
+        return [
+            {"name": _text(bucket, "Name"), "created": _text(bucket, "CreationDate")}
+            for bucket in root.iter(f"{_NS}Bucket")
+        ]
+
+    def iter_objects(
+        self, bucket: str, prefix: str = "", page_size: int = S3_PAGE_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every object under ``prefix``, following continuation tokens."""
+        token: str | None = None
+        while True:
+            params = {"list-type": "2", "prefix": prefix, "max-keys": str(page_size)}
+            if token:
+                params["continuation-token"] = token
+            root = self._get_xml(f"/{bucket}", params)
+            for item in root.iter(f"{_NS}Contents"):
+                yield {
+                    "key": _text(item, "Key"),
+                    "size": int(_text(item, "Size") or 0),
+                    "last_modified": _text(item, "LastModified"),
+                    "etag": (_text(item, "ETag") or "").strip('"'),
+                }
+            if _text(root, "IsTruncated") != "true":
+                return
+            token = _text(root, "NextContinuationToken")
+            if not token:
+                return
+
+    def list_common_prefixes(self, bucket: str, prefix: str = "") -> list[str]:
+        """Return the immediate "sub-directories" of ``prefix`` (``delimiter=/``)."""
+        prefixes: list[str] = []
+        token: str | None = None
+        while True:
+            params = {"list-type": "2", "prefix": prefix, "delimiter": "/"}
+            if token:
+                params["continuation-token"] = token
+            root = self._get_xml(f"/{bucket}", params)
+            prefixes.extend(
+                _text(item, "Prefix") or "" for item in root.iter(f"{_NS}CommonPrefixes")
+            )
+            token = _text(root, "NextContinuationToken")
+            if _text(root, "IsTruncated") != "true" or not token:
+                return prefixes
+
+    def head_object(
+        self, bucket: str, key: str, etag: str | None = None, last_modified: str | None = None
+    ) -> dict[str, Any] | None:
+        """HEAD an object; returns None when it matches ``etag``/``last_modified`` (304)."""
+        # Sign the decoded path; sign_request applies the canonical URI encoding.
+        headers = self._sign("HEAD", f"/{bucket}/{key}", {})
+        if etag:
+            headers["If-None-Match"] = f'"{etag}"'
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response = self._client.head(
+            f"/{quote(bucket, safe='')}/{quote(key, safe='/-_.~')}", headers=headers
+        )
+        if response.status_code == 304:
+            return None
+        if response.status_code != 200:
+            raise S3Error(f"HTTP {response.status_code} for {key}", response.status_code)
+        return {
+            "etag": response.headers.get("ETag", "").strip('"'),
+            "last_modified": response.headers.get("Last-Modified"),
+            "size": int(response.headers.get("Content-Length", 0)),
+        }
+
+    def presign_get(self, bucket: str, key: str, endpoint: str | None = None) -> str:
+        """Presign a GET for ``key``, optionally for another endpoint (e.g. http://minio:9000)."""
+        return presign_url(
+            endpoint or self.endpoint,
+            f"/{bucket}/{key}",
+            self._access_key,
+            self._secret_key,
+            self.region,
+        )
+
+    def timed_get(self, bucket: str, key: str) -> dict[str, float | int]:
+        """Download an object, timing first byte and total transfer (seconds)."""
+        path = f"/{bucket}/{key}"
+        request = self._client.build_request(
+            "GET",
+            f"/{quote(bucket, safe='')}/{quote(key, safe='/-_.~')}",
+            headers=self._sign("GET", path, {}),
+        )
+        started = time.perf_counter()
+        response = self._client.send(request, stream=True)
+        try:
+            if response.status_code != 200:
+                response.read()
+                raise S3Error(_error_message(response), response.status_code)
+            size = 0
+            first_byte: float | None = None
+            for chunk in response.iter_raw():
+                if first_byte is None:
+                    first_byte = time.perf_counter() - started
+                size += len(chunk)
+            total = time.perf_counter() - started
+        finally:
+            response.close()
+        ttfb = first_byte if first_byte is not None else total
+        return {"ttfb": ttfb, "total": total, "bytes": size}
+
+    def list_prefixes(
+        self, bucket: str, prefixes: list[str], page_size: int = S3_PAGE_SIZE
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, str]]:
+        """List several prefixes of one bucket concurrently over the shared pool.
+
+        Returns ``(listings, errors)``: a prefix that fails to list appears in
+        ``errors`` with its message instead of failing the other prefixes.
+        """
+        if not prefixes:
+            return {}, {}
+
+        def list_one(prefix: str) -> list[dict[str, Any]] | str:
+            try:
+                return list(self.iter_objects(bucket, prefix, page_size))
+            except (httpx.HTTPError, S3Error) as e:
+                return str(e)
+
+        with ThreadPoolExecutor(max_workers=min(len(prefixes), self.max_connections)) as pool:
+            results = dict(zip(prefixes, pool.map(list_one, prefixes)))
+        listings = {prefix: r for prefix, r in results.items() if not isinstance(r, str)}
+        errors = {prefix: r for prefix, r in results.items() if isinstance(r, str)}
+        return listings, errors
+
+    def _get_xml(self, path: str, params: dict[str, str] | None = None) -> ET.Element:
+        params = params or {}
+        response = self._client.get(path, params=params, headers=self._sign("GET", path, params))
+        if response.status_code != 200:
+            raise S3Error(_error_message(response), response.status_code)
+        return ET.fromstring(response.content)
+
+    def _sign(self, method: str, path: str, params: dict[str, str]) -> dict[str, str]:
+        return sign_request(
+            method,
+            self._client.base_url.netloc.decode(),
+            path,
+            params,
+            self._access_key,
+            self._secret_key,
+            self.region,
+        )
+
+
+def sign_request(
+    method: str,
+    host: str,
+    path: str,
+    params: dict[str, str],
+    access_key: str,
+    secret_key: str,
+    region: str,
+    now: datetime | None = None,
+) -> dict[str, str]:
+    """Return the SigV4 headers for a request with an empty body."""
+    amz_date = (now or datetime.now(timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+    scope = f"{amz_date[:8]}/{region}/s3/aws4_request"
+    headers = {"host": host, "x-amz-content-sha256": _EMPTY_SHA256, "x-amz-date": amz_date}
+    signed_headers, signature = _signature(
+        method, path, params, headers, _EMPTY_SHA256, amz_date, scope, secret_key
+    )
+    return {
+        "x-amz-content-sha256": _EMPTY_SHA256,
+        "x-amz-date": amz_date,
+        "Authorization": (
+            f"AWS4-HMAC-SHA256 Credential={access_key}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        ),
+    }
+
+
+def presign_url(
+    endpoint: str,
+    path: str,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    expires: int = S3_PRESIGN_EXPIRES,
+    now: datetime | None = None,
+) -> str:
+    """Return a SigV4 query-string signed GET URL for ``endpoint`` + ``path``."""
+    amz_date = (now or datetime.now(timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+    scope = f"{amz_date[:8]}/{region}/s3/aws4_request"
+    params = {
+        "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+        "X-Amz-Credential": f"{access_key}/{scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expires),
+        "X-Amz-SignedHeaders": "host",
+    }
+    endpoint = endpoint.rstrip("/")
+    host = endpoint.split("://", 1)[-1]
+    _, signature = _signature(
+        "GET", path, params, {"host": host}, "UNSIGNED-PAYLOAD", amz_date, scope, secret_key
+    )
+    params["X-Amz-Signature"] = signature
+    return f"{endpoint}{quote(path, safe='/-_.~')}?{_canonical_query(params)}"
+
+
+def _signature(
+    method: str,
+    path: str,
+    params: dict[str, str],
+    headers: dict[str, str],
+    payload_hash: str,
+    amz_date: str,
+    scope: str,
+    secret_key: str,
+) -> tuple[str, str]:
+    """Return ``(signed_headers, signature)`` for a canonical request."""
+    signed_headers = ";".join(sorted(headers))
+    canonical_request = "\n".join(
+        [
+            method,
+            quote(path, safe="/-_.~"),
+            _canonical_query(params),
+            "".join(f"{name}:{headers[name]}\n" for name in sorted(headers)),
+            signed_headers,
+            payload_hash,
+        ]
+    )
+    string_to_sign = "\n".join(
+        [
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ]
+    )
+
+    key = f"AWS4{secret_key}".encode()
+    for part in scope.split("/"):
+        key = hmac.digest(key, part.encode(), "sha256")
+    return signed_headers, hmac.new(key, string_to_sign.encode(), "sha256").hexdigest()
+
+
+def _canonical_query(params: dict[str, str]) -> str:
+    return "&".join(
+        f"{quote(key, safe='-_.~')}={quote(value, safe='-_.~')}"
+        for key, value in sorted(params.items())
+    )
+
+
+def _text(element: ET.Element, tag: str) -> str | None:
+    child = element.find(f"{_NS}{tag}")
+    return child.text if child is not None else None
+
+
+def _error_message(response: httpx.Response) -> str:
+    try:
+        root = ET.fromstring(response.content)
+        code = root.findtext("Code") or str(response.status_code)
+        return f"{code}: {root.findtext('Message') or response.reason_phrase}"
+    except ET.ParseError:
+        return f"HTTP {response.status_code}: {response.reason_phrase}"
+
+
+_client: S3Client | None = None
+
+
+def get_s3() -> S3Client | None:
+    """Get the client for the local MinIO, or None when no credentials are present."""
+    global _client
+    if _client is None:
+        access_key = os.environ.get("S3_ACCESS_KEY_ID") or os.environ.get("MINIO_ROOT_USER")
+        secret_key = os.environ.get("S3_SECRET_ACCESS_KEY") or os.environ.get(
+            "MINIO_ROOT_PASSWORD"
+        )
+        if not access_key or not secret_key:
+            return None
+        host = os.environ.get("MINIO_HOST", MINIO_HOST)
+        port = int(os.environ.get("MINIO_PORT", MINIO_PORT))
+        _client = S3Client(
+            f"http://{host}:{port}",
+            access_key,
+            secret_key,
+            region=os.environ.get("S3_REGION") or S3_DEFAULT_REGION,
+        )
+    return _client
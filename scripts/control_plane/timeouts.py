@@ -16,6 +16,35 @@ DEFAULT_TIMEOUTS: Final[dict[str, int]] = {
 }
 
 
+COLLECTOR_TIMEOUTS: Final[dict[str, int]] = {
+    "services": 15,
+    "infra": 15,
+    "redis": 15,
+    "db": 30,
+    "messaging": 30,
+    "storage": 20,
+    "auth": 5,
+    "secrets": 35,
+}
+
+DEFAULT_COLLECTOR_TIMEOUT: Final[int] = 30
+
+
+def get_collector_timeout(scope: str, override: float | None = None) -> float:
+    """Get the time budget for an inventory collector.
+
+    Args:
+        scope: Inventory scope key of the collector (e.g. ``db``)
+        override: Explicit budget (if any)
+
+    Returns:
+        Timeout in seconds
+    """
+    if override is not None:
+        return override
+    return COLLECTOR_TIMEOUTS.get(scope, DEFAULT_COLLECTOR_TIMEOUT)
+
+
 def get_timeout(action_name: str, manifest_timeout: int | None = None) -> int:
     """Get timeout for an action.
 
@@ -0,0 +1,123 @@
+"""Compare live Kafka topics with the declarations in messaging.yaml."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_REPLICATION_FACTOR = 1
+
+# messaging.yaml topic keys mapped to Kafka topic configs and their encoding.
+DECLARED_TOPIC_CONFIGS = {
+    "retention_days": ("retention.ms", lambda days: str(int(days * 86_400_000))),
+    "cleanup_policy": ("cleanup.policy", str),
+    "segment_bytes": ("segment.bytes", lambda size: str(int(size))),
+    "segment_ms": ("segment.ms", lambda ms: str(int(ms))),
+}
+
+
+@dataclass
+class TopicPlan:
+    """Changes needed to bring live topics in line with their declarations."""
+
+    create: dict[str, tuple[int, int, dict[str, str]]] = field(default_factory=dict)
+    add_partitions: dict[str, int] = field(default_factory=dict)
+    alter_configs: dict[str, dict[str, str]] = field(default_factory=dict)
+    unfixable: list[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.create or self.add_partitions or self.alter_configs)
+
+    @property
+    def alters_existing(self) -> bool:
+        return bool(self.add_partitions or self.alter_configs)
+
+    def describe(self) -> list[str]:
+        lines = []
+        for topic, (partitions, replication, configs) in self.create.items():
+            settings = ", ".join(f"{k}={v}" for k, v in configs.items())
+            lines.append(
+                f"create {topic} (partitions={partitions}, replication={replication}"
+                + (f", {settings})" if settings else ")")
+            )
+        for topic, count in self.add_partitions.items():
+            lines.append(f"increase {topic} to {count} partitions")
+        for topic, configs in self.alter_configs.items():
+            for name, value in configs.items():
+                lines.append(f"set {topic} {name}={value}")
+        lines.extend(f"cannot fix: {issue}" for issue in self.unfixable)
+        return lines
+
+
+def declared_topic_configs(spec: dict[str, Any]) -> dict[str, str]:
+    """Return the Kafka configs a topic declaration pins."""
+    return {
+        config: encode(spec[key])
+        for key, (config, encode) in DECLARED_TOPIC_CONFIGS.items()
+        if spec.get(key) is not None
+    }
+
+
+def check_topic(name: str, spec: dict[str, Any], snapshot: dict[str, Any]) -> dict[str, Any]:
+    """Compare one declared topic with the live metadata and configs."""
+    live = snapshot["topics"].get(name)
+    declared_partitions = spec.get("partitions")
+    report: dict[str, Any] = {
+        "exists": live is not None,
+        "partitions": {
+            "declared": declared_partitions,
+            "actual": len(live["partitions"]) if live else None,
+        },
+        "configs": {},
+        "drift": [],
+    }
+    if live is None:
+        report["drift"].append("topic does not exist")
+        report["conformant"] = False
+        return report
+
+    actual_partitions = len(live["partitions"])
+    if declared_partitions is not None and actual_partitions != declared_partitions:
+        report["drift"].append(
+            f"partitions: declared {declared_partitions}, actual {actual_partitions}"
+        )
+
+    live_configs = snapshot.get("topic_configs", {}).get(name, {})
+    for config, value in declared_topic_configs(spec).items():
+        actual = live_configs.get(config)
+        report["configs"][config] = {"declared": value, "actual": actual}
+        if actual != value:
+            report["drift"].append(f"{config}: declared {value}, actual {actual}")
+
+    report["conformant"] = not report["drift"]
+    return report
+
+
+def plan_topic_changes(topics: dict[str, dict[str, Any]], snapshot: dict[str, Any]) -> TopicPlan:
+    """Work out the creates and alterations that make live topics match."""
+    plan = TopicPlan()
+    for name, spec in topics.items():
+        declared_partitions = spec.get("partitions")
+        configs = declared_topic_configs(spec)
+        live = snapshot["topics"].get(name)
+        if live is None:
+            plan.create[name] = (
+                declared_partitions or 1,
+                spec.get("replication_factor", DEFAULT_REPLICATION_FACTOR),
+                configs,
+            )
+            continue
+
+        actual_partitions = len(live["partitions"])
+        if declared_partitions is not None and actual_partitions < declared_partitions:
+            plan.add_partitions[name] = declared_partitions
+        elif declared_partitions is not None and actual_partitions > declared_partitions:
+            plan.unfixable.append(
+                f"{name} has {actual_partitions} partitions; Kafka cannot reduce "
+                f"them to {declared_partitions} (recreate the topic)"
+            )
+
+        live_configs = snapshot.get("topic_configs", {}).get(name, {})
+        changed = {k: v for k, v in configs.items() if live_configs.get(k) != v}
+        if changed:
+            plan.alter_configs[name] = changed
+    return plan
@@ -0,0 +1,79 @@
+"""Topic throughput from high-watermark deltas."""
+
+import time
+from typing import Any
+
+from .kafka_client import KafkaAdminClient
+
+DEFAULT_THROUGHPUT_WINDOW = 10
+DEFAULT_DLQ_ENVIRONMENT = "local"
+
+
+def dlq_topics(ownership: dict[str, Any], environment: str) -> list[str]:
+    """Return the DLQ topic names derived from ``dlq_pattern``."""
+    pattern = ownership.get("dlq_pattern") or {}
+    template = pattern.get("dlq_topic_template")
+    if not pattern.get("enabled") or not template:
+        return []
+    return [template.format(environment=environment)]
+
+
+def sample_throughput(
+    admin: KafkaAdminClient,
+    topics: list[str],
+    dlq: list[str],
+    window: float = DEFAULT_THROUGHPUT_WINDOW,
+) -> dict[str, Any]:
+    """Sample high watermarks ``window`` seconds apart and report rates."""
+    wanted = list(dict.fromkeys(topics + dlq))
+    partitions = {
+        topic: ids for topic, ids in admin.topic_partitions().items() if topic in wanted
+    }
+    before = admin.high_watermarks(partitions)
+    started = time.monotonic()
+    time.sleep(window)
+    after = admin.high_watermarks(partitions)
+    elapsed = time.monotonic() - started
+    return throughput_report(wanted, set(dlq), before, after, elapsed)
+
+
+def throughput_report(
+    topics: list[str],
+    dlq: set[str],
+    before: dict[tuple[str, int], int],
+    after: dict[tuple[str, int], int],
+    elapsed: float,
+) -> dict[str, Any]:
+    """Turn two high-watermark samples into per-topic and per-partition rates."""
+    report: dict[str, Any] = {}
+    for topic in topics:
+        keys = sorted(key for key in after if key[0] == topic and key in before)
+        if not keys:
+            report[topic] = {"exists": False, "dlq": topic in dlq}
+            continue
+
+        produced = {key[1]: max(after[key] - before[key], 0) for key in keys}
+        rates = {partition: round(count / elapsed, 3) for partition, count in produced.items()}
+        total = sum(rates.values())
+        mean = total / len(rates)
+        report[topic] = {
+            "exists": True,
+            "dlq": topic in dlq,
+            "messages": sum(produced.values()),
+            "messages_per_second": round(total, 3),
+            "partitions": rates,
+            # Busiest partition relative to an even spread; 1.0 is perfectly balanced.
+            "partition_skew": round(max(rates.values()) / mean, 3) if mean else None,
+        }
+
+    main_rate = sum(
+        t["messages_per_second"] for t in report.values() if t["exists"] and not t["dlq"]
+    )
+    dlq_rate = sum(t["messages_per_second"] for t in report.values() if t["exists"] and t["dlq"])
+    return {
+        "window_seconds": round(elapsed, 3),
+        "topics": report,
+        "total_messages_per_second": round(main_rate, 3),
+        "dlq_messages_per_second": round(dlq_rate, 3),
+        "dlq_ratio": round(dlq_rate / main_rate, 4) if main_rate else None,
+    }
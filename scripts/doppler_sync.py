@@ -0,0 +1,110 @@
+"""
+Batched Doppler reads and diffed writes shared by the secret sync scripts.
+
+Each project/config is read with a single `doppler secrets download` instead of
+one `doppler secrets get` per key. Writes are diffed against the target's
+current values so only changed keys are sent, and targets are synced
+concurrently.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_PARALLEL_TARGETS = 4
+
+# Keys Doppler injects into every download; never synced.
+DOPPLER_META_KEYS = {"DOPPLER_PROJECT", "DOPPLER_CONFIG", "DOPPLER_ENVIRONMENT"}
+
+Target = tuple[str, str]
+
+
+def _run(cmd: list[str], *, capture_output: bool = False) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        cmd,
+        check=True,
+        text=True,
+        capture_output=capture_output,
+    )
+
+
+def download_secrets(project: str, config: str) -> dict[str, str]:
+    """Return every non-empty secret in a project/config from one download."""
+    result = _run(
+        [
+            "doppler",
+            "secrets",
+            "download",
+            "--project",
+            project,
+            "--config",
+            config,
+            "--no-file",
+            "--format",
+            "json",
+        ],
+        capture_output=True,
+    )
+    secrets = json.loads(result.stdout or "{}")
+    return {
+        key: str(value)
+        for key, value in secrets.items()
+        if key not in DOPPLER_META_KEYS and value not in (None, "")
+    }
+
+
+def download_many(targets: list[Target]) -> dict[Target, dict[str, str]]:
+    """Download several project/configs concurrently."""
+    unique = list(dict.fromkeys(targets))
+    with ThreadPoolExecutor(max_workers=min(len(unique), MAX_PARALLEL_TARGETS) or 1) as pool:
+        return dict(zip(unique, pool.map(lambda t: download_secrets(*t), unique)))
+
+
+def set_secrets(project: str, config: str, secrets: dict[str, str]) -> None:
+    cmd = [
+        "doppler",
+        "secrets",
+        "set",
+        "--project",
+        project,
+        "--config",
+        config,
+        "--silent",
+    ]
+    cmd.extend([f"{k}={v}" for k, v in secrets.items()])
+    _run(cmd)
+
+
+def changed_secrets(current: dict[str, str], desired: dict[str, str]) -> dict[str, str]:
+    """Return the entries of `desired` whose value differs from `current`."""
+    return {key: value for key, value in desired.items() if current.get(key) != value}
+
+
+def sync_targets(
+    desired: dict[Target, dict[str, str]],
+    current: dict[Target, dict[str, str]] | None = None,
+    *,
+    dry_run: bool = False,
+) -> dict[Target, list[str]]:
+    """Write only changed keys to each target, concurrently.
+
+    `current` may hold values already downloaded (for example the source
+    config); other targets are downloaded first. Returns the changed key
+    names per target, which is empty for a target that is already in sync.
+    """
+    known = dict(current or {})
+    missing = [target for target in desired if target not in known]
+    if missing:
+        known.update(download_many(missing))
+
+    changes = {
+        target: changed_secrets(known[target], values) for target, values in desired.items()
+    }
+    if not dry_run:
+        pending = [(target, diff) for target, diff in changes.items() if diff]
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(len(pending), MAX_PARALLEL_TARGETS)) as pool:
+                list(pool.map(lambda item: set_secrets(*item[0], item[1]), pending))
+    return {target: sorted(diff) for target, diff in changes.items()}
@@ -28,6 +28,7 @@ PYTHON_MODULES = [
     "scripts.infra_only",
     "scripts.sync_shared_secrets",
     "scripts.sync_platform_configs",
+    "scripts.doppler_sync",
 ]
 
 
@@ -4,6 +4,7 @@ Show suite-aware platform status.
 Usage:
     uv run platform-status
     uv run platform-status --json
+    uv run platform-status --no-daemon
 """
 
 from __future__ import annotations
@@ -11,6 +12,7 @@ from __future__ import annotations
 import argparse
 import sys
 
+from scripts.control_plane.daemon_client import DaemonClient
 from scripts.control_plane.health import check_all_services_health
 from scripts.control_plane.inventory.services import ServicesCollector
 from scripts.control_plane.presenters.json_output import format_health_json
@@ -18,8 +20,11 @@ from scripts.control_plane.presenters.summary import format_summary
 from scripts.control_plane.registry import get_registry
 
 
-def _collect_status() -> tuple[dict, list]:
+def _collect_status(use_daemon: bool = True) -> tuple[dict, list]:
     """Collect service metadata and health aggregates."""
+    cached = DaemonClient().status() if use_daemon else None
+    if cached is not None:
+        return cached
     registry = get_registry()
     services_result = ServicesCollector(registry).collect()
     services_data = services_result.data if services_result.success and services_result.data else {}
@@ -27,9 +32,9 @@ def _collect_status() -> tuple[dict, list]:
     return services_data, health_results
 
 
-def render_status(*, json_mode: bool) -> str:
+def render_status(*, json_mode: bool, use_daemon: bool = True) -> str:
     """Render the status output."""
-    services_data, health_results = _collect_status()
+    services_data, health_results = _collect_status(use_daemon)
     if json_mode:
         return format_health_json(health_results)
     return format_summary(services_data, health_results)
@@ -38,8 +43,13 @@ def render_status(*, json_mode: bool) -> str:
 def main() -> int:
     parser = argparse.ArgumentParser(description="Card Fraud Platform status view")
     parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Collect locally even if a platformctl daemon is running",
+    )
     args = parser.parse_args()
-    print(render_status(json_mode=args.json))
+    print(render_status(json_mode=args.json, use_daemon=not args.no_daemon))
     return 0
 
 
@@ -25,6 +25,7 @@ from scripts.constants import (
     JFR_OVERRIDE_COMPOSE_FILE,
     PLATFORM_PROFILE,
 )
+from scripts.control_plane.container_state import get_container_snapshot
 
 
 def _check_docker_version() -> bool:
@@ -57,30 +58,12 @@ def _check_docker_version() -> bool:
 
 def _container_exists(name: str) -> bool:
     """Check whether a container exists."""
-    result = subprocess.run(
-        ["docker", "inspect", name],
-        capture_output=True,
-        text=True,
-    )
-    return result.returncode == 0
+    return get_container_snapshot().exists(name)
 
 
 def _container_compose_project(name: str) -> str:
     """Get docker compose project label for a container (if any)."""
-    result = subprocess.run(
-        [
-            "docker",
-            "inspect",
-            "--format",
-            "{{ index .Config.Labels \"com.docker.compose.project\" }}",
-            name,
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return ""
-    return (result.stdout or "").strip()
+    return get_container_snapshot().compose_project(name)
 
 
 def _cleanup_conflicting_containers() -> None:
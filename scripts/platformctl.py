@@ -2,127 +2,254 @@
 
 Usage:
     uv run platformctl status
+    uv run platformctl daemon
+    uv run platformctl db enable-query-stats
     uv run platformctl inventory services
     uv run platformctl inventory infra
     uv run platformctl inventory redis
+    uv run platformctl inventory redis --keys [--max-keys 10000] [--time-budget 5]
     uv run platformctl inventory db
+    uv run platformctl inventory db --stats
+    uv run platformctl inventory db --indexes
+    uv run platformctl inventory db --queries [--top 10] [--window 60]
+    uv run platformctl inventory db --connections [--watch 5]
     uv run platformctl inventory messaging
     uv run platformctl inventory storage
+    uv run platformctl inventory storage --artifacts
     uv run platformctl inventory auth
-    uv run platformctl inventory secrets
-    uv run platformctl action <domain> <action> <service>
+    uv run platformctl inventory secrets [--refresh | --offline]
+    uv run platformctl messaging apply [--dry-run]
+    uv run platformctl messaging throughput [--window 10]
+    uv run platformctl storage probe [--repetitions 5] [--environment local]
+    uv run platformctl bench redis [--workload pipeline] [--concurrency 8] [--duration 10]
+    uv run platformctl action <domain> <action> <service> [--stream]
+    uv run platformctl action <domain> <action> --all [--max-workers 4]
+    uv run platformctl action <domain> <action> --runtime fastapi
     uv run platformctl registry validate
 """
 
 import argparse
 import subprocess
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
+import httpx
+
 sys.path.insert(0, str(Path(__file__).parent))
 
 from control_plane.adapter_manifest import load_adapter
+from control_plane.artifact_probe import DEFAULT_PROBE_ENVIRONMENT, DEFAULT_PROBE_REPETITIONS
 from control_plane.audit import get_audit_logger
-from control_plane.confirm import require_confirmation
+from control_plane.confirm import ConfirmationError, require_confirmation
+from control_plane.container_state import get_container_snapshot
+from control_plane.daemon import (
+    DAEMON_HOST,
+    DAEMON_PORT,
+    DAEMON_REFRESH_INTERVAL,
+    ControlPlaneDaemon,
+    serve,
+)
+from control_plane.daemon_client import DaemonClient
+from control_plane.docker_api import DOCKER_BACKENDS, DockerEngineError, get_docker
 from control_plane.health import check_all_services_health
-from control_plane.inventory.services import ServicesCollector
-from control_plane.inventory.docker_runtime import DockerRuntimeCollector
-from control_plane.inventory.database import DatabaseCollector
+from control_plane.inventory.base import BaseCollector
+from control_plane.inventory.catalog import (
+    INVENTORY_SCOPES,
+    build_collectors,
+    select_collectors,
+)
+from control_plane.inventory.database_connections import DatabaseConnectionCollector
+from control_plane.inventory.database_indexes import DatabaseIndexCollector
+from control_plane.inventory.database_queries import (
+    DEFAULT_TOP_QUERIES,
+    DatabaseQueryCollector,
+)
+from control_plane.inventory.database_stats import DatabaseStatsCollector, format_bytes
 from control_plane.inventory.messaging import MessagingCollector
-from control_plane.inventory.storage import StorageCollector
-from control_plane.inventory.auth import AuthCollector
+from control_plane.inventory.redis_keys import (
+    DEFAULT_MAX_KEYS,
+    DEFAULT_TIME_BUDGET,
+    RedisKeyCollector,
+)
 from control_plane.inventory.secrets import SecretsCollector
-from control_plane.inventory.redis_runtime import RedisRuntimeCollector
+from control_plane.inventory.services import ServicesCollector
+from control_plane.inventory.storage_artifacts import ArtifactIndexCollector
+from control_plane.kafka_client import KafkaError
+from control_plane.redis_bench import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_DURATION,
+    DEFAULT_KEYSPACE,
+    DEFAULT_PIPELINE_DEPTH,
+    WORKLOADS,
+    BenchLog,
+    cleanup_bench_keys,
+    run_bench,
+)
+from control_plane.redis_client import RedisError, get_redis
+from control_plane.s3_client import S3Error, get_s3
+from control_plane.topic_throughput import DEFAULT_DLQ_ENVIRONMENT, DEFAULT_THROUGHPUT_WINDOW
+from control_plane.inventory.scheduler import DEFAULT_MAX_WORKERS, run_collectors
 from control_plane.presenters.json_output import (
     format_action_json,
+    format_json,
     format_health_json,
     format_inventory_json,
 )
-from control_plane.presenters.table import format_inventory
+from control_plane.presenters.table import format_inventory, format_table
 from control_plane.presenters.summary import format_summary
 from control_plane.registry import get_registry
+from control_plane.timeouts import get_collector_timeout
 from control_plane.action_runner import run_action
-from control_plane.models import ActionResult, ActionStatus, ExecutionMode
+from control_plane.models import (
+    ActionResult,
+    ActionSpec,
+    ActionStatus,
+    CollectorResult,
+    ExecutionMode,
+)
 
 SCHEMA_RESET_ACK_TOKEN = "RESET_SHARED_SCHEMA"
+DEFAULT_ACTION_WORKERS = 4
+
+# Alternative inventory views, selected by a --<mode> flag: mode -> (scope, collector).
+INVENTORY_MODES = {
+    "stats": ("db", DatabaseStatsCollector),
+    "indexes": ("db", DatabaseIndexCollector),
+    "queries": ("db", DatabaseQueryCollector),
+    "connections": ("db", DatabaseConnectionCollector),
+    "keys": ("redis", RedisKeyCollector),
+    "artifacts": ("storage", ArtifactIndexCollector),
+}
 
 
 def cmd_status(args) -> int:
     """Show platform status."""
-    registry = get_registry()
+    cached = None if args.no_daemon else DaemonClient().status()
+    if cached is not None:
+        services_data, health_results = cached
+    else:
+        registry = get_registry()
 
-    services_collector = ServicesCollector(registry)
-    services_result = services_collector.collect()
+        services_collector = ServicesCollector(registry)
+        services_result = services_collector.collect()
+        services_data = services_result.data if services_result.data else {}
 
-    health_results = check_all_services_health(registry)
+        health_results = check_all_services_health(registry)
 
     if args.json:
         print(format_health_json(health_results))
     else:
-        print(
-            format_summary(
-                services_result.data if services_result.data else {}, health_results
-            )
-        )
+        print(format_summary(services_data, health_results))
     return 0
 
 
 def cmd_inventory(args) -> int:
     """Show platform inventory."""
-    registry = get_registry()
+    mode = _inventory_mode(args)
+    if mode and args.scope != INVENTORY_MODES[mode][0]:
+        print(f"--{mode} is only supported for 'inventory {INVENTORY_MODES[mode][0]}'")
+        return 1
 
-    collectors = {
-        "services": ServicesCollector(registry),
-        "infra": DockerRuntimeCollector(),
-        "redis": RedisRuntimeCollector(),
-        "db": DatabaseCollector(),
-        "messaging": MessagingCollector(),
-        "storage": StorageCollector(),
-        "auth": AuthCollector(registry=registry),
-        "secrets": SecretsCollector(),
-    }
-
-    if args.scope == "all":
-        selected = collectors
-    elif args.scope == "infra":
-        selected = {
-            "infra": collectors["infra"],
-            "redis": collectors["redis"],
-        }
-    else:
-        selected = {args.scope: collectors.get(args.scope)}
-        if not selected[args.scope]:
-            print(f"Unknown inventory scope: {args.scope}")
-            sys.exit(1)
+    use_daemon = not args.no_daemon and mode is None and not args.refresh
+    selected: dict[str, BaseCollector] | None = None
+    timeouts: dict[str, float] = {}
+    in_flight: dict[str, Future] = {}
+    try:
+        while True:
+            results = DaemonClient().inventory(args.scope) if use_daemon else None
+            if results is None:
+                if args.watch is not None:
+                    # The snapshot is memoized per process; re-read container state every sample.
+                    get_container_snapshot(refresh=True)
+                if selected is None:
+                    try:
+                        docker = get_docker(args.docker_backend)
+                    except DockerEngineError as e:
+                        print(f"Docker backend unavailable: {e}")
+                        return 1
 
-    results = []
-    for _, collector in selected.items():
-        result = collector.collect()
-        results.append(result)
+                    if mode == "queries":
+                        selected = {
+                            "db": DatabaseQueryCollector(
+                                docker=docker, top=args.top, window=args.window
+                            )
+                        }
+                        if args.window:
+                            timeouts["db"] = get_collector_timeout("db") + args.window
+                    elif mode == "keys":
+                        selected = {
+                            "redis": RedisKeyCollector(
+                                max_keys=args.max_keys, time_budget=args.time_budget
+                            )
+                        }
+                        # SCAN stops at the time budget; leave room for DBSIZE and TYPE.
+                        timeouts["redis"] = max(
+                            get_collector_timeout("redis"), args.time_budget + 5
+                        )
+                    elif mode == "artifacts":
+                        selected = {"storage": ArtifactIndexCollector()}
+                    elif mode is not None:
+                        selected = {"db": INVENTORY_MODES[mode][1](docker=docker)}
+                    else:
+                        try:
+                            selected = select_collectors(
+                                build_collectors(get_registry(), docker), args.scope
+                            )
+                        except KeyError:
+                            print(f"Unknown inventory scope: {args.scope}")
+                            sys.exit(1)
+                        if "secrets" in selected and (args.refresh or args.offline):
+                            selected["secrets"] = SecretsCollector(
+                                cache_mode="refresh" if args.refresh else "offline"
+                            )
 
-    if args.json:
-        print(format_inventory_json(results))
-    else:
-        for result in results:
-            if result.success:
-                print(format_inventory(result.collector, result.data or {}))
-            else:
-                print(f"Error in {result.collector}: {result.error}")
-    return 0
+                results = run_collectors(
+                    selected,
+                    max_workers=args.max_workers,
+                    timeouts=timeouts,
+                    deadline=args.deadline,
+                    in_flight=in_flight,
+                )
+
+            _print_inventory(results, args.json, watching=args.watch is not None)
+            if args.watch is None:
+                return 0
+            time.sleep(args.watch)
+    except KeyboardInterrupt:
+        if args.watch is None:
+            raise
+        return 0
+
+
+def _print_inventory(results: list[CollectorResult], as_json: bool, watching: bool) -> None:
+    # While watching, JSON samples are printed one per line and text samples
+    # get a timestamp header so the output can be tailed alongside a load test.
+    if as_json:
+        print(format_inventory_json(results, indent=None if watching else 2), flush=True)
+        return
+    if watching:
+        print(f"\n--- {datetime.now(timezone.utc).isoformat(timespec='seconds')} ---")
+    for result in results:
+        if result.success:
+            print(format_inventory(result.collector, result.data or {}))
+        else:
+            print(f"Error in {result.collector}: {result.error}")
+    sys.stdout.flush()
+
+
+def _inventory_mode(args) -> str | None:
+    """Return the selected inventory mode flag, if any."""
+    for mode in INVENTORY_MODES:
+        if getattr(args, mode, False):
+            return mode
+    return None
 
 
 def _is_container_running(container_name: str) -> bool:
-    try:
-        result = subprocess.run(
-            ["docker", "inspect", "-f", "{{.State.Running}}", container_name],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        return result.returncode == 0 and "true" in result.stdout.lower()
-    except Exception:
-        return False
+    return get_container_snapshot().is_running(container_name)
 
 
 def _build_not_running_result(service_id: str, domain: str, action: str) -> ActionResult:
@@ -145,10 +272,136 @@ def _build_not_running_result(service_id: str, domain: str, action: str) -> Acti
     )
 
 
+def _needs_container_precheck(domain: str, action: str) -> bool:
+    return (domain == "service" and action in {"status", "health"}) or (
+        domain == "runtime" and action == "verify"
+    )
+
+
+def _refused_result(
+    service_id: str, domain: str, action: str, summary: str, destructive: bool = False
+) -> ActionResult:
+    now = datetime.now(timezone.utc)
+    return ActionResult(
+        service=service_id,
+        domain=domain,
+        action=action,
+        target="service",
+        status=ActionStatus.FAILED,
+        summary=summary,
+        destructive=destructive,
+        started_at=now,
+        completed_at=now,
+    )
+
+
+def _execute_action(
+    args,
+    registry,
+    service_id: str,
+    action_spec: ActionSpec,
+    confirm: bool = True,
+) -> ActionResult:
+    """Run one action on one service, with its own audit record.
+
+    ``confirm=False`` is used by fan-out runs, which confirm once for the
+    whole selection before any service starts.
+    """
+    audit = get_audit_logger()
+    audit_record = audit.log_start(
+        service_id,
+        args.domain,
+        args.action,
+        "suite",
+        action_spec.destructive,
+    )
+
+    def refuse(summary: str) -> ActionResult:
+        audit.log_complete(audit_record, ActionStatus.FAILED, summary)
+        return _refused_result(
+            service_id, args.domain, args.action, summary, action_spec.destructive
+        )
+
+    if args.domain == "db" and args.action == "db-reset-schema":
+        if service_id != "rule-management":
+            return refuse("db-reset-schema is reserved for rule-management only")
+        if args.schema_reset_ack != SCHEMA_RESET_ACK_TOKEN:
+            return refuse(
+                "High-risk schema reset requires --schema-reset-ack "
+                f"{SCHEMA_RESET_ACK_TOKEN}"
+            )
+        print(
+            "WARNING: db-reset-schema is a high-risk action that can impact all services using fraud_gov."
+        )
+
+    if confirm:
+        try:
+            require_confirmation(
+                service_id,
+                args.domain,
+                args.action,
+                action_spec.destructive,
+                yes_flag=args.yes,
+                confirm_token=args.confirm,
+            )
+        except Exception as e:
+            return refuse(f"Confirmation failed: {e}")
+
+    repo_path = registry.get_service_repo_path(service_id)
+    if not repo_path:
+        return refuse(f"Could not resolve repo path for {service_id}")
+
+    service = registry.get(service_id)
+    if _needs_container_precheck(args.domain, args.action) and not _is_container_running(
+        service.container
+    ):
+        result = _build_not_running_result(service_id, args.domain, args.action)
+    else:
+        result = run_action(
+            service_id,
+            args.domain,
+            args.action,
+            action_spec,
+            repo_path,
+            stream=args.stream,
+        )
+
+    audit.log_complete(audit_record, result.status, result.summary)
+    return result
+
+
+def _action_selection(args, registry) -> tuple[str, list[str]] | None:
+    """Return ``(label, service ids)`` for a fan-out selector, or None for one service."""
+    if args.all:
+        return "all", registry.list_services()
+    selectors = (
+        ("runtime", args.runtime, registry.list_by_runtime),
+        ("engine-family", args.engine_family, registry.list_by_engine_family),
+        ("action-domain", args.action_domain, registry.list_by_action_domain),
+    )
+    for kind, value, list_by in selectors:
+        if value:
+            return f"{kind}={value}", [s.service_id for s in list_by(value)]
+    return None
+
+
 def cmd_action(args) -> int:
-    """Execute a platform action."""
+    """Execute a platform action on one service or across a selection of services."""
     registry = get_registry()
 
+    selection = _action_selection(args, registry)
+    if selection is not None:
+        if args.service:
+            print("Pass either a service or a selector (--all, --runtime, ...), not both")
+            return 1
+        return _cmd_action_fan_out(args, registry, *selection)
+    if not args.service:
+        print(
+            "Specify a service, or select services with "
+            "--all, --runtime, --engine-family or --action-domain"
+        )
+        return 1
+
     service = registry.get(args.service)
     if not service:
         print(f"Unknown service: {args.service}")
@@ -173,85 +426,360 @@ def cmd_action(args) -> int:
         )
         sys.exit(1)
 
-    audit = get_audit_logger()
-    audit_record = audit.log_start(
-        args.service,
-        args.domain,
-        args.action,
-        "suite",
-        action_spec.destructive,
-    )
+    result = _execute_action(args, registry, args.service, action_spec)
 
-    if args.domain == "db" and args.action == "db-reset-schema":
-        if args.service != "rule-management":
-            summary = "db-reset-schema is reserved for rule-management only"
-            print(summary)
-            audit.log_complete(audit_record, ActionStatus.FAILED, summary)
-            return 1
-        if args.schema_reset_ack != SCHEMA_RESET_ACK_TOKEN:
-            summary = (
-                "High-risk schema reset requires --schema-reset-ack "
-                f"{SCHEMA_RESET_ACK_TOKEN}"
-            )
-            print(summary)
-            audit.log_complete(audit_record, ActionStatus.FAILED, summary)
-            return 1
-        print(
-            "WARNING: db-reset-schema is a high-risk action that can impact all services using fraud_gov."
-        )
+    if args.json:
+        print(format_action_json(result))
+    else:
+        print(f"Status: {result.status.value}")
+        print(f"Summary: {result.summary}")
+        if result.error:
+            print(f"Error: {result.error}")
+        if result.next_steps:
+            print("Next Steps:")
+            for step in result.next_steps:
+                print(f"  - {step}")
+
+    return 0 if result.status == ActionStatus.OK else 1
+
+
+def _cmd_action_fan_out(args, registry, label: str, service_ids: list[str]) -> int:
+    """Run one action across several services on a bounded worker pool.
+
+    Services whose adapter does not offer the action in suite mode are
+    skipped. Destructive actions are confirmed once for the selection
+    (token ``<label>:<domain>:<action>``); every service still gets its own
+    audit record. The exit code is 0 only when every executed service is OK.
+    """
+    specs: dict[str, ActionSpec] = {}
+    skipped: dict[str, str] = {}
+    for service_id in service_ids:
+        adapter_loader = load_adapter(service_id, registry)
+        action_spec = None
+        if adapter_loader:
+            action_spec = adapter_loader.get_action(args.domain, args.action)
+        if action_spec is None:
+            skipped[service_id] = f"no {args.domain}:{args.action} action"
+        elif ExecutionMode.SUITE not in action_spec.mode:
+            skipped[service_id] = "does not support suite mode"
+        else:
+            specs[service_id] = action_spec
+
+    if not specs:
+        print(f"No services in {label} support {args.domain}:{args.action}")
+        return 1
 
     try:
         require_confirmation(
-            args.service,
+            label,
             args.domain,
             args.action,
-            action_spec.destructive,
+            any(spec.destructive for spec in specs.values()),
             yes_flag=args.yes,
             confirm_token=args.confirm,
         )
     except Exception as e:
+        summary = f"Confirmation failed: {e}"
+        audit = get_audit_logger()
+        results = []
+        for service_id, spec in specs.items():
+            record = audit.log_start(
+                service_id, args.domain, args.action, "suite", spec.destructive
+            )
+            audit.log_complete(record, ActionStatus.FAILED, summary)
+            results.append(
+                _refused_result(service_id, args.domain, args.action, summary, spec.destructive)
+            )
+    else:
+        if _needs_container_precheck(args.domain, args.action):
+            # Build the memoized snapshot once instead of racing to build it per worker.
+            get_container_snapshot()
+        with ThreadPoolExecutor(max_workers=min(args.max_workers, len(specs))) as pool:
+            results = list(
+                pool.map(
+                    lambda service_id: _execute_action(
+                        args, registry, service_id, specs[service_id], confirm=False
+                    ),
+                    specs,
+                )
+            )
+
+    failed = [result.service for result in results if result.status != ActionStatus.OK]
+    if args.json:
+        print(
+            format_json(
+                {
+                    "selection": label,
+                    "domain": args.domain,
+                    "action": args.action,
+                    "status": "failed" if failed else "ok",
+                    "results": [result.to_dict() for result in results],
+                    "skipped": skipped,
+                }
+            )
+        )
+    else:
+        print(f"{args.domain}:{args.action} on {label} ({len(results)} services)")
+        print(
+            format_table(
+                ["Service", "Status", "Summary"],
+                [[r.service, r.status.value, r.summary] for r in results],
+            )
+        )
+        for service_id, reason in skipped.items():
+            print(f"Skipped {service_id}: {reason}")
+        print(f"{len(results) - len(failed)} ok, {len(failed)} failed, {len(skipped)} skipped")
+
+    return 1 if failed else 0
+
+
+def cmd_daemon(args) -> int:
+    """Run the control-plane daemon in the foreground."""
+    try:
+        docker = get_docker(args.docker_backend)
+    except DockerEngineError as e:
+        print(f"Docker backend unavailable: {e}")
+        return 1
+
+    daemon = ControlPlaneDaemon(get_registry(), docker=docker, interval=args.interval)
+    print(
+        f"platformctl daemon listening on http://{args.host}:{args.port} "
+        f"(refresh every {args.interval}s, docker backend: {docker.backend})"
+    )
+    try:
+        serve(daemon, host=args.host, port=args.port)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_db_enable_query_stats(args) -> int:
+    """Enable pg_stat_statements on the local Postgres."""
+    try:
+        docker = get_docker(args.docker_backend)
+    except DockerEngineError as e:
+        print(f"Docker backend unavailable: {e}")
+        return 1
+
+    audit = get_audit_logger()
+    audit_record = audit.log_start("postgres", "db", "enable-query-stats", "platform", False)
+    ok, summary = DatabaseQueryCollector(docker=docker).enable_extension()
+    audit.log_complete(audit_record, ActionStatus.OK if ok else ActionStatus.FAILED, summary)
+    print(summary)
+    return 0 if ok else 1
+
+
+def cmd_messaging_apply(args) -> int:
+    """Create or alter topics to match messaging.yaml."""
+    collector = MessagingCollector()
+    try:
+        plan = collector.topic_plan()
+    except (OSError, KafkaError) as e:
+        print(f"Kafka API unreachable: {e}")
+        return 1
+
+    for line in plan.describe():
+        print(line)
+    if plan.empty:
+        print("Topics match messaging.yaml" if not plan.unfixable else "Nothing to apply")
+        return 0 if not plan.unfixable else 1
+    if args.dry_run:
+        return 0
+
+    audit = get_audit_logger()
+    audit_record = audit.log_start(
+        "redpanda", "messaging", "apply", "platform", plan.alters_existing
+    )
+    try:
+        require_confirmation(
+            "redpanda",
+            "messaging",
+            "apply",
+            plan.alters_existing,
+            yes_flag=args.yes,
+            confirm_token=args.confirm,
+        )
+    except ConfirmationError as e:
         summary = f"Confirmation failed: {e}"
         print(summary)
         audit.log_complete(audit_record, ActionStatus.FAILED, summary)
         return 1
 
-    repo_path = registry.get_service_repo_path(args.service)
-    if not repo_path:
-        summary = f"Could not resolve repo path for {args.service}"
+    try:
+        errors = collector.apply_topic_plan(plan)
+    except (OSError, KafkaError) as e:
+        errors = {"*": str(e)}
+    for topic, message in errors.items():
+        print(f"[FAIL] {topic}: {message}")
+
+    ok = not errors and not plan.unfixable
+    summary = (
+        f"Applied topic changes: {len(plan.create)} created, "
+        f"{len(plan.add_partitions)} repartitioned, {len(plan.alter_configs)} reconfigured"
+        if not errors
+        else f"Topic changes failed for {len(errors)} topics"
+    )
+    print(summary)
+    audit.log_complete(audit_record, ActionStatus.OK if ok else ActionStatus.FAILED, summary)
+    return 0 if ok else 1
+
+
+def cmd_messaging_throughput(args) -> int:
+    """Sample topic throughput from high-watermark deltas."""
+    try:
+        report = MessagingCollector().sample_throughput(args.window, args.environment)
+    except (OSError, KafkaError) as e:
+        print(f"Kafka API unreachable: {e}")
+        return 1
+
+    if args.json:
+        print(format_json(report))
+        return 0
+
+    rows = []
+    for topic, stats in report["topics"].items():
+        if not stats["exists"]:
+            rows.append([topic, "dlq" if stats["dlq"] else "", "missing", "", ""])
+            continue
+        busiest = max(stats["partitions"].items(), key=lambda item: item[1])
+        rows.append(
+            [
+                topic,
+                "dlq" if stats["dlq"] else "",
+                f"{stats['messages_per_second']:.1f}",
+                f"p{busiest[0]} {busiest[1]:.1f}",
+                stats["partition_skew"] if stats["partition_skew"] is not None else "-",
+            ]
+        )
+    print(f"Throughput over {report['window_seconds']}s")
+    print(format_table(["Topic", "Kind", "msg/s", "Busiest partition", "Skew"], rows))
+    print(
+        f"\nTotal: {report['total_messages_per_second']:.1f} msg/s, "
+        f"DLQ inflow: {report['dlq_messages_per_second']:.1f} msg/s"
+    )
+    return 0
+
+
+def cmd_bench_redis(args) -> int:
+    """Benchmark Redis round trips with velocity-counter shaped workloads."""
+    workloads = args.workload or list(WORKLOADS)
+    audit = get_audit_logger()
+    audit_record = audit.log_start("redis", "redis", "bench", "platform", False)
+    results = []
+    try:
+        for workload in workloads:
+            results.append(
+                run_bench(
+                    workload,
+                    concurrency=args.concurrency,
+                    duration=args.duration,
+                    pipeline_depth=args.pipeline_depth,
+                    keyspace=args.keyspace,
+                )
+            )
+    except (OSError, RedisError) as e:
+        summary = f"Redis unreachable: {e}"
         print(summary)
         audit.log_complete(audit_record, ActionStatus.FAILED, summary)
         return 1
+    finally:
+        try:
+            cleanup_bench_keys(get_redis(), args.keyspace)
+        except (OSError, RedisError):
+            # The keys carry an expiry, so Redis drops them on its own.
+            pass
 
-    should_precheck_container = (
-        (args.domain == "service" and args.action in {"status", "health"})
-        or (args.domain == "runtime" and args.action == "verify")
-    )
-    if should_precheck_container and not _is_container_running(service.container):
-        result = _build_not_running_result(args.service, args.domain, args.action)
+    bench_log = BenchLog()
+    previous = bench_log.previous()
+    if not args.no_save:
+        bench_log.append(results)
+
+    if args.json:
+        print(format_json(results))
     else:
-        result = run_action(
-            args.service,
-            args.domain,
-            args.action,
-            action_spec,
-            repo_path,
+        rows = []
+        for result in results:
+            latency = result["latency_us"]
+            before = previous.get(result["workload"])
+            rows.append(
+                [
+                    result["workload"],
+                    f"{result['ops_per_second']:.0f}",
+                    *(f"{latency[p]:.0f}" for p in ("p50", "p95", "p99", "p99.9")),
+                    f"{before['latency_us']['p99']:.0f}" if before else "-",
+                    result["errors"],
+                ]
+            )
+        print(
+            f"Redis round trips, {args.concurrency} connections, {args.duration:g}s per workload"
         )
+        print(
+            format_table(
+                ["Workload", "ops/s", "p50 us", "p95 us", "p99 us", "p99.9 us", "Prev p99", "Errors"],
+                rows,
+            )
+        )
+        if not args.no_save:
+            print(f"\nSaved to {bench_log.log_path}")
 
-    audit.log_complete(audit_record, result.status, result.summary)
+    errors = sum(result["errors"] for result in results)
+    summary = f"Benchmarked {', '.join(workloads)} with {errors} errors"
+    audit.log_complete(
+        audit_record, ActionStatus.OK if not errors else ActionStatus.FAILED, summary
+    )
+    return 0 if not errors else 1
+
+
+def cmd_storage_probe(args) -> int:
+    """Time artifact fetches from the host and from inside card-fraud-network."""
+    if get_s3() is None:
+        print("S3 credentials not set (S3_ACCESS_KEY_ID or MINIO_ROOT_USER)")
+        return 1
+    try:
+        docker = get_docker(args.docker_backend)
+    except DockerEngineError as e:
+        print(f"Docker backend unavailable: {e}")
+        return 1
+    try:
+        report = ArtifactIndexCollector(docker=docker).probe_fetch_latency(
+            args.environment, args.repetitions, args.container
+        )
+    except (httpx.HTTPError, S3Error, RuntimeError, subprocess.TimeoutExpired) as e:
+        print(f"Artifact probe failed: {e}")
+        return 1
 
     if args.json:
-        print(format_action_json(result))
-    else:
-        print(f"Status: {result.status.value}")
-        print(f"Summary: {result.summary}")
-        if result.error:
-            print(f"Error: {result.error}")
-        if result.next_steps:
-            print("Next Steps:")
-            for step in result.next_steps:
-                print(f"  - {step}")
+        print(format_json(report))
+        return 0
 
-    return 0 if result.status == ActionStatus.OK else 1
+    rows = []
+    for key, vantages in report["objects"].items():
+        for vantage, stats in vantages.items():
+            if not stats["repetitions"]:
+                rows.append([key, vantage, "", "", "", "", ", ".join(stats["errors"])])
+                continue
+            rows.append(
+                [
+                    key,
+                    vantage,
+                    format_bytes(stats["bytes"]),
+                    f"{stats['ttfb_ms']['p50']:.1f}",
+                    f"{stats['total_ms']['p50']:.1f} (first {stats['first_ms']:.1f})",
+                    stats["throughput_mb_s"],
+                    ", ".join(stats["errors"]),
+                ]
+            )
+    print(f"Artifact fetches from {report['bucket']}, {report['repetitions']} repetitions")
+    print(
+        format_table(
+            ["Object", "From", "Size", "TTFB p50 ms", "Total p50 ms", "MB/s", "Errors"], rows
+        )
+    )
+    if report["network_container"] is None:
+        print("\nNo running container on card-fraud-network with curl; network path skipped")
+    else:
+        print(f"\nNetwork path measured from {report['network_container']} via http://minio:9000")
+    return 0
 
 
 def cmd_registry_validate(args) -> int:
@@ -279,27 +807,181 @@ def cmd_registry_validate(args) -> int:
         return 0
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for worker counts and other values that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def _positive_float(value: str) -> float:
+    """argparse type for durations and intervals that must be greater than zero."""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return number
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Card Fraud Platform Control Plane")
     subparsers = parser.add_subparsers(dest="command")
 
     status_parser = subparsers.add_parser("status", help="Show platform status")
     status_parser.add_argument("--json", action="store_true", help="JSON output")
+    status_parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Collect locally even if a platformctl daemon is running",
+    )
 
     inv_parser = subparsers.add_parser("inventory", help="Show platform inventory")
     inv_parser.add_argument(
         "scope",
         nargs="?",
         default="all",
-        choices=["all", "services", "infra", "redis", "db", "messaging", "storage", "auth", "secrets"],
+        choices=INVENTORY_SCOPES,
         help="Scope: services, infra, redis, db, messaging, storage, auth, secrets, or all",
     )
     inv_parser.add_argument("--json", action="store_true", help="JSON output")
+    inv_parser.add_argument(
+        "--docker-backend",
+        default="auto",
+        choices=list(DOCKER_BACKENDS),
+        help="Docker access: Engine API over the unix socket, docker CLI, or auto (default)",
+    )
+    inv_parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="Overall time budget in seconds; collectors still running are reported as timed out",
+    )
+    inv_parser.add_argument(
+        "--max-workers",
+        type=_positive_int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of collectors to run concurrently (default: {DEFAULT_MAX_WORKERS})",
+    )
+    modes = inv_parser.add_mutually_exclusive_group()
+    modes.add_argument(
+        "--stats",
+        action="store_true",
+        help="db only: per-table row estimates, sizes, dead tuples, scans and vacuum times by owner",
+    )
+    modes.add_argument(
+        "--indexes",
+        action="store_true",
+        help="db only: never-scanned declared indices, undeclared indices and seq-scan hotspots",
+    )
+    modes.add_argument(
+        "--queries",
+        action="store_true",
+        help="db only: top statements from pg_stat_statements, attributed to owning services",
+    )
+    modes.add_argument(
+        "--connections",
+        action="store_true",
+        help="db only: pg_stat_activity grouped by client, state and wait event vs max_connections",
+    )
+    modes.add_argument(
+        "--keys",
+        action="store_true",
+        help="redis only: sample keys with SCAN and report memory and TTLs by key prefix owner",
+    )
+    modes.add_argument(
+        "--artifacts",
+        action="store_true",
+        help="storage only: ruleset/field artifact versions per environment and key, with sizes",
+    )
+    inv_parser.add_argument(
+        "--top",
+        type=_positive_int,
+        default=DEFAULT_TOP_QUERIES,
+        help=f"--queries: statements per ranking (default: {DEFAULT_TOP_QUERIES})",
+    )
+    inv_parser.add_argument(
+        "--window",
+        type=_positive_float,
+        default=None,
+        help="--queries: report only activity during the next N seconds (e.g. a Locust run)",
+    )
+    inv_parser.add_argument(
+        "--max-keys",
+        type=int,
+        default=DEFAULT_MAX_KEYS,
+        help=f"--keys: stop sampling after N keys (default: {DEFAULT_MAX_KEYS})",
+    )
+    inv_parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=DEFAULT_TIME_BUDGET,
+        help=f"--keys: stop sampling after N seconds (default: {DEFAULT_TIME_BUDGET:g})",
+    )
+    inv_parser.add_argument(
+        "--watch",
+        type=_positive_float,
+        default=None,
+        metavar="SECONDS",
+        help="Re-sample every N seconds until interrupted (JSON samples are one per line)",
+    )
+    doppler_cache = inv_parser.add_mutually_exclusive_group()
+    doppler_cache.add_argument(
+        "--refresh",
+        action="store_true",
+        help="secrets: re-list Doppler projects/configs now and rewrite the name cache",
+    )
+    doppler_cache.add_argument(
+        "--offline",
+        action="store_true",
+        help="secrets: answer from the cached Doppler name listing without calling Doppler",
+    )
+    inv_parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Collect locally even if a platformctl daemon is running",
+    )
+
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="Serve cached status and inventory over a loopback HTTP API"
+    )
+    daemon_parser.add_argument("--host", default=DAEMON_HOST, help=f"Bind address (default: {DAEMON_HOST})")
+    daemon_parser.add_argument("--port", type=int, default=DAEMON_PORT, help=f"Port (default: {DAEMON_PORT})")
+    daemon_parser.add_argument(
+        "--interval",
+        type=float,
+        default=DAEMON_REFRESH_INTERVAL,
+        help=f"Full refresh interval in seconds (default: {DAEMON_REFRESH_INTERVAL})",
+    )
+    daemon_parser.add_argument(
+        "--docker-backend",
+        default="auto",
+        choices=list(DOCKER_BACKENDS),
+        help="Docker access used by the daemon's collectors",
+    )
 
     action_parser = subparsers.add_parser("action", help="Execute a platform action")
     action_parser.add_argument("domain", help="Action domain (e.g., db, auth)")
     action_parser.add_argument("action", help="Action name (e.g., verify, reset-data)")
-    action_parser.add_argument("service", help="Target service")
+    action_parser.add_argument(
+        "service", nargs="?", help="Target service (omit when using a selector below)"
+    )
+    action_selectors = action_parser.add_mutually_exclusive_group()
+    action_selectors.add_argument(
+        "--all", action="store_true", help="Run on every registered service"
+    )
+    action_selectors.add_argument("--runtime", help="Run on services with this runtime")
+    action_selectors.add_argument(
+        "--engine-family", help="Run on services in this engine family"
+    )
+    action_selectors.add_argument(
+        "--action-domain", help="Run on services that declare this action domain"
+    )
+    action_parser.add_argument(
+        "--max-workers",
+        type=_positive_int,
+        default=DEFAULT_ACTION_WORKERS,
+        help=f"Selectors: services run concurrently (default: {DEFAULT_ACTION_WORKERS})",
+    )
     action_parser.add_argument(
         "--yes",
         "-y",
@@ -311,8 +993,124 @@ def main() -> int:
         "--schema-reset-ack",
         help=f"Required for db-reset-schema. Must be: {SCHEMA_RESET_ACK_TOKEN}",
     )
+    action_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Echo adapter stderr live, keeping only its tail in the result",
+    )
     action_parser.add_argument("--json", action="store_true", help="JSON output")
 
+    db_parser = subparsers.add_parser("db", help="Shared Postgres commands")
+    db_subparsers = db_parser.add_subparsers(dest="db_command")
+    enable_stats_parser = db_subparsers.add_parser(
+        "enable-query-stats", help="Enable pg_stat_statements in fraud_gov"
+    )
+    enable_stats_parser.add_argument(
+        "--docker-backend",
+        default="auto",
+        choices=list(DOCKER_BACKENDS),
+        help="Docker access used for the psql fallback",
+    )
+
+    messaging_parser = subparsers.add_parser("messaging", help="Redpanda topic commands")
+    messaging_subparsers = messaging_parser.add_subparsers(dest="messaging_command")
+    apply_parser = messaging_subparsers.add_parser(
+        "apply", help="Create or alter topics to match messaging.yaml in one batch"
+    )
+    apply_parser.add_argument(
+        "--dry-run", action="store_true", help="Print the planned changes without applying them"
+    )
+    apply_parser.add_argument(
+        "--yes",
+        "-y",
+        action="store_true",
+        help="Skip confirmation when existing topics are altered",
+    )
+    apply_parser.add_argument("--confirm", help="Explicit confirmation token")
+    throughput_parser = messaging_subparsers.add_parser(
+        "throughput", help="Messages/sec per topic and partition from high-watermark deltas"
+    )
+    throughput_parser.add_argument(
+        "--window",
+        type=_positive_float,
+        default=DEFAULT_THROUGHPUT_WINDOW,
+        help=f"Sampling window in seconds (default: {DEFAULT_THROUGHPUT_WINDOW})",
+    )
+    throughput_parser.add_argument(
+        "--environment",
+        default=DEFAULT_DLQ_ENVIRONMENT,
+        help=f"Environment for dlq_topic_template (default: {DEFAULT_DLQ_ENVIRONMENT})",
+    )
+    throughput_parser.add_argument("--json", action="store_true", help="JSON output")
+
+    bench_parser = subparsers.add_parser("bench", help="Platform benchmarks")
+    bench_subparsers = bench_parser.add_subparsers(dest="bench_command")
+    bench_redis_parser = bench_subparsers.add_parser(
+        "redis", help="Round-trip latency of velocity-counter shaped Redis workloads"
+    )
+    bench_redis_parser.add_argument(
+        "--workload",
+        action="append",
+        choices=list(WORKLOADS),
+        help="Workload to run; repeat for several (default: all)",
+    )
+    bench_redis_parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Concurrent connections (default: {DEFAULT_CONCURRENCY})",
+    )
+    bench_redis_parser.add_argument(
+        "--duration",
+        type=_positive_float,
+        default=DEFAULT_DURATION,
+        help=f"Seconds per workload (default: {DEFAULT_DURATION:g})",
+    )
+    bench_redis_parser.add_argument(
+        "--pipeline-depth",
+        type=_positive_int,
+        default=DEFAULT_PIPELINE_DEPTH,
+        help=f"Counters per pipelined request (default: {DEFAULT_PIPELINE_DEPTH})",
+    )
+    bench_redis_parser.add_argument(
+        "--keyspace",
+        type=_positive_int,
+        default=DEFAULT_KEYSPACE,
+        help=f"Distinct counter keys (default: {DEFAULT_KEYSPACE})",
+    )
+    bench_redis_parser.add_argument(
+        "--no-save", action="store_true", help="Do not append results to the bench log"
+    )
+    bench_redis_parser.add_argument("--json", action="store_true", help="JSON output")
+
+    storage_parser = subparsers.add_parser("storage", help="MinIO artifact commands")
+    storage_subparsers = storage_parser.add_subparsers(dest="storage_command")
+    probe_parser = storage_subparsers.add_parser(
+        "probe", help="Time latest artifact fetches from the host and from card-fraud-network"
+    )
+    probe_parser.add_argument(
+        "--repetitions",
+        type=int,
+        default=DEFAULT_PROBE_REPETITIONS,
+        help=f"Fetches per object and vantage point (default: {DEFAULT_PROBE_REPETITIONS})",
+    )
+    probe_parser.add_argument(
+        "--environment",
+        default=DEFAULT_PROBE_ENVIRONMENT,
+        help=f"Artifact environment (default: {DEFAULT_PROBE_ENVIRONMENT})",
+    )
+    probe_parser.add_argument(
+        "--container",
+        help="Container on card-fraud-network to run curl in (default: first engine with curl)",
+    )
+    probe_parser.add_argument(
+        "--docker-backend",
+        default="auto",
+        choices=list(DOCKER_BACKENDS),
+        help="Docker access: Engine API over the unix socket, docker CLI, or auto (default)",
+    )
+    probe_parser.add_argument("--json", action="store_true", help="JSON output")
+
     reg_parser = subparsers.add_parser("registry", help="Registry commands")
     reg_subparsers = reg_parser.add_subparsers(dest="registry_command")
     validate_parser = reg_subparsers.add_parser("validate", help="Validate registry")
@@ -323,8 +1121,36 @@ def main() -> int:
         return cmd_status(args)
     elif args.command == "inventory":
         return cmd_inventory(args)
+    elif args.command == "daemon":
+        return cmd_daemon(args)
     elif args.command == "action":
         return cmd_action(args)
+    elif args.command == "db":
+        if args.db_command == "enable-query-stats":
+            return cmd_db_enable_query_stats(args)
+        else:
+            db_parser.print_help()
+            return 1
+    elif args.command == "messaging":
+        if args.messaging_command == "apply":
+            return cmd_messaging_apply(args)
+        elif args.messaging_command == "throughput":
+            return cmd_messaging_throughput(args)
+        else:
+            messaging_parser.print_help()
+            return 1
+    elif args.command == "bench":
+        if args.bench_command == "redis":
+            return cmd_bench_redis(args)
+        else:
+            bench_parser.print_help()
+            return 1
+    elif args.command == "storage":
+        if args.storage_command == "probe":
+            return cmd_storage_probe(args)
+        else:
+            storage_parser.print_help()
+            return 1
     elif args.command == "registry":
         if args.registry_command == "validate":
             return cmd_registry_validate(args)
@@ -12,6 +12,8 @@ import argparse
 import subprocess
 import sys
 
+from scripts.doppler_sync import download_secrets, sync_targets
+
 SYNC_KEYS = [
     "POSTGRES_ADMIN_PASSWORD",
     "FRAUD_GOV_APP_PASSWORD",
@@ -39,56 +41,6 @@ SYNC_KEYS = [
 ]
 
 
-def _run(cmd: list[str], *, capture_output: bool = False) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        cmd,
-        check=True,
-        text=True,
-        capture_output=capture_output,
-    )
-
-
-def _get_secret(project: str, config: str, key: str) -> str:
-    result = _run(
-        [
-            "doppler",
-            "secrets",
-            "get",
-            key,
-            "--project",
-            project,
-            "--config",
-            config,
-            "--plain",
-        ],
-        capture_output=True,
-    )
-    return result.stdout.strip()
-
-
-def _try_get_secret(project: str, config: str, key: str) -> str | None:
-    try:
-        value = _get_secret(project, config, key)
-    except subprocess.CalledProcessError:
-        return None
-    return value or None
-
-
-def _set_secrets(project: str, config: str, secrets: dict[str, str]) -> None:
-    cmd = [
-        "doppler",
-        "secrets",
-        "set",
-        "--project",
-        project,
-        "--config",
-        config,
-        "--silent",
-    ]
-    cmd.extend([f"{k}={v}" for k, v in secrets.items()])
-    _run(cmd)
-
-
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Sync card-fraud-platform Doppler configs from source config values."
@@ -116,15 +68,14 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    source_values: dict[str, str] = {}
-    missing: list[str] = []
-    for key in SYNC_KEYS:
-        value = _try_get_secret(args.project, args.source_config, key)
-        if value is None:
-            missing.append(key)
-            continue
-        source_values[key] = value
+    try:
+        source_all = download_secrets(args.project, args.source_config)
+    except subprocess.CalledProcessError as exc:
+        print(f"[ERROR] Could not read {args.project}/{args.source_config}: {exc}")
+        return 1
 
+    source_values = {key: source_all[key] for key in SYNC_KEYS if key in source_all}
+    missing = [key for key in SYNC_KEYS if key not in source_all]
     if missing:
         print("[WARN] Missing keys in source config (skipping):")
         for key in missing:
@@ -138,20 +89,41 @@ def main() -> int:
         f"Syncing {len(source_values)} keys from "
         f"{args.project}/{args.source_config} -> {', '.join(args.target_configs)}"
     )
+
+    desired: dict[tuple[str, str], dict[str, str]] = {}
+    for config in args.target_configs:
+        payload = dict(source_values)
+        payload["APP_ENV"] = config
+        payload["VITE_SENTRY_ENVIRONMENT"] = config
+        desired[(args.project, config)] = payload
+    local = (args.project, "local")
+    desired[local] = {
+        **desired.get(local, {}),
+        "APP_ENV": "local",
+        "VITE_SENTRY_ENVIRONMENT": "local",
+    }
+
+    try:
+        changes = sync_targets(
+            desired,
+            current={(args.project, args.source_config): source_all},
+            dry_run=args.dry_run,
+        )
+    except subprocess.CalledProcessError as exc:
+        print(f"[ERROR] Doppler sync failed: {exc}")
+        return 1
+
+    for (project, config), changed in changes.items():
+        target = f"{project}/{config}"
+        if not changed:
+            print(f"  [OK] {target} already in sync")
+        elif args.dry_run:
+            print(f"  [DRY RUN] Would update {len(changed)} keys in {target}: {', '.join(changed)}")
+        else:
+            print(f"  [OK] Updated {len(changed)} keys in {target}: {', '.join(changed)}")
     if args.dry_run:
         print("[DRY RUN] No Doppler changes were applied.")
         return 0
-
-    for target in args.target_configs:
-        payload = dict(source_values)
-        payload["APP_ENV"] = target
-        payload["VITE_SENTRY_ENVIRONMENT"] = target
-        _set_secrets(args.project, target, payload)
-        print(f"  [OK] Synced {len(payload)} keys to {args.project}/{target}")
-
-    local_payload = {"APP_ENV": "local", "VITE_SENTRY_ENVIRONMENT": "local"}
-    _set_secrets(args.project, "local", local_payload)
-    print(f"  [OK] Ensured APP_ENV/VITE_SENTRY_ENVIRONMENT in {args.project}/local")
     print("Done.")
     return 0
 
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+import httpx
+
+from scripts.control_plane.container_state import ContainerSnapshot, parse_container_state
+from scripts.control_plane.health import AsyncHealthChecker
+from scripts.control_plane.models import (
+    AuthModel,
+    ContainerState,
+    HealthSpec,
+    HealthStatus,
+    ServiceRegistryEntry,
+)
+
+
+def _service(service_id: str, port: int) -> ServiceRegistryEntry:
+    return ServiceRegistryEntry(
+        service_id=service_id,
+        repo=f"../card-fraud-{service_id}",
+        runtime="fastapi",
+        port=port,
+        container=f"card-fraud-{service_id}",
+        health=HealthSpec(
+            kind="http",
+            path="/api/v1/health",
+            readiness_path="/api/v1/health",
+            container_port=port,
+        ),
+        auth_model=AuthModel.IN_PROCESS,
+        engine_family=None,
+        adapter_manifest="platform-adapter.yaml",
+        action_domains=["service"],
+        destructive_actions=[],
+        description="",
+    )
+
+
+def _snapshot(*running: str) -> ContainerSnapshot:
+    return ContainerSnapshot(
+        {name: ContainerState(name=name, status="running", running=True) for name in running}
+    )
+
+
+class AsyncHealthCheckerTests(unittest.TestCase):
+    def test_check_services_maps_http_outcomes_in_order(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.port == 8000:
+                return httpx.Response(200)
+            return httpx.Response(503)
+
+        checker = AsyncHealthChecker(
+            transport=httpx.MockTransport(handler),
+            snapshot=_snapshot("card-fraud-rule-management", "card-fraud-transaction-management"),
+        )
+        services = [_service("rule-management", 8000), _service("transaction-management", 8002)]
+        results = asyncio.run(checker.check_services(services))
+
+        self.assertEqual([r.service for r in results], ["rule-management", "transaction-management"])
+        self.assertEqual(results[0].status, HealthStatus.HEALTHY)
+        self.assertEqual(results[1].status, HealthStatus.UNREACHABLE)
+        self.assertIn("503", results[1].message)
+
+    def test_check_services_skips_probe_when_container_stopped(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+        checker = AsyncHealthChecker(transport=transport, snapshot=_snapshot())
+        results = asyncio.run(checker.check_services([_service("rule-management", 8000)]))
+        self.assertEqual(results[0].status, HealthStatus.NOT_RUNNING)
+
+    def test_check_services_enforces_overall_deadline(self) -> None:
+        async def slow_handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(5)
+            return httpx.Response(200)
+
+        checker = AsyncHealthChecker(
+            transport=httpx.MockTransport(slow_handler),
+            deadline=0.05,
+            snapshot=_snapshot("card-fraud-rule-management"),
+        )
+        results = asyncio.run(checker.check_services([_service("rule-management", 8000)]))
+        self.assertEqual(results[0].status, HealthStatus.UNREACHABLE)
+        self.assertIn("deadline", results[0].message)
+
+
+class ContainerSnapshotTests(unittest.TestCase):
+    def test_parse_container_state_reads_inspect_document(self) -> None:
+        state = parse_container_state(
+            {
+                "Name": "/card-fraud-postgres",
+                "RestartCount": 2,
+                "State": {"Status": "running", "Running": True, "Health": {"Status": "healthy"}},
+                "Config": {"Labels": {"com.docker.compose.project": "card-fraud-platform"}},
+                "NetworkSettings": {
+                    "Ports": {"5432/tcp": [{"HostIp": "0.0.0.0", "HostPort": "5432"}]}
+                },
+            }
+        )
+        self.assertEqual(state.name, "card-fraud-postgres")
+        self.assertEqual(state.health, "healthy")
+        self.assertEqual(state.compose_project, "card-fraud-platform")
+        self.assertEqual(state.restart_count, 2)
+        self.assertEqual(state.ports, ["0.0.0.0:5432->5432/tcp"])
+
+    def test_snapshot_status_distinguishes_missing_and_unavailable(self) -> None:
+        self.assertEqual(ContainerSnapshot().status("card-fraud-redis"), "not-found")
+        self.assertEqual(
+            ContainerSnapshot(available=False).status("card-fraud-redis"), "unknown"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,14 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from scripts import constants, platform_check, platform_down, platform_status, platform_up
+from scripts import (
+    constants,
+    doppler_sync,
+    platform_check,
+    platform_down,
+    platform_status,
+    platform_up,
+)
 
 
 class ConstantsTests(unittest.TestCase):
@@ -139,6 +146,15 @@ class PlatformStatusTests(unittest.TestCase):
         self.assertIn("services", parsed)
         self.assertEqual(parsed["services"][0]["service"], "rule-management")
 
+    @patch("scripts.platform_status.check_all_services_health", return_value=[])
+    @patch("scripts.platform_status.ServicesCollector")
+    @patch("scripts.platform_status.DaemonClient")
+    def test_collect_status_skips_daemon_when_disabled(
+        self, mock_client: MagicMock, _mock_services: MagicMock, _mock_health: MagicMock
+    ) -> None:
+        platform_status._collect_status(use_daemon=False)
+        mock_client.assert_not_called()
+
 
 class PlatformCheckTests(unittest.TestCase):
     def test_discover_control_plane_modules_includes_core_modules(self) -> None:
@@ -147,5 +163,35 @@ class PlatformCheckTests(unittest.TestCase):
         self.assertIn("scripts.control_plane.inventory.redis_runtime", modules)
 
 
+class DopplerSyncTests(unittest.TestCase):
+    def test_sync_targets_downloads_once_and_writes_only_changed_keys(self) -> None:
+        downloads = {
+            "card-fraud-platform/test": {"DOPPLER_CONFIG": "test", "A": "1", "B": "old"},
+            "card-fraud-platform/prod": {"A": "1", "B": "2"},
+        }
+        commands: list[list[str]] = []
+
+        def run(cmd: list[str], *, capture_output: bool = False) -> MagicMock:
+            commands.append(cmd)
+            target = f"{cmd[cmd.index('--project') + 1]}/{cmd[cmd.index('--config') + 1]}"
+            return MagicMock(stdout=json.dumps(downloads[target]))
+
+        desired = {
+            ("card-fraud-platform", "test"): {"A": "1", "B": "2"},
+            ("card-fraud-platform", "prod"): {"A": "1", "B": "2"},
+        }
+        with patch.object(doppler_sync, "_run", side_effect=run):
+            changes = doppler_sync.sync_targets(desired)
+
+        self.assertEqual(
+            changes,
+            {("card-fraud-platform", "test"): ["B"], ("card-fraud-platform", "prod"): []},
+        )
+        self.assertEqual([cmd[2] for cmd in commands].count("download"), 2)
+        writes = [cmd for cmd in commands if cmd[2] == "set"]
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(writes[0][-1], "B=2")
+
+
 if __name__ == "__main__":
     unittest.main()
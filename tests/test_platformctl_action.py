@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import argparse
+import io
+import sys
+import time
 import types
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from scripts import platformctl
+from scripts.control_plane.action_runner import ActionRunner, _StdoutPayload
 from scripts.control_plane.models import ActionResult, ActionSpec, ActionStatus, ExecutionMode
 
 
@@ -17,9 +23,24 @@ def _args(domain: str, action: str, service: str) -> types.SimpleNamespace:
         confirm=f"{service}:{domain}:{action}",
         schema_reset_ack=None,
         json=True,
+        all=False,
+        runtime=None,
+        engine_family=None,
+        action_domain=None,
+        max_workers=4,
+        stream=False,
     )
 
 
+def _fan_out_args(domain: str, action: str, **selector: object) -> types.SimpleNamespace:
+    args = _args(domain, action, "")
+    args.service = None
+    args.confirm = None
+    for key, value in selector.items():
+        setattr(args, key, value)
+    return args
+
+
 class PlatformCtlActionTests(unittest.TestCase):
     def test_cmd_action_returns_zero_on_ok(self) -> None:
         service_entry = types.SimpleNamespace(container="card-fraud-rule-management")
@@ -188,6 +209,227 @@ class PlatformCtlActionTests(unittest.TestCase):
         denied_outcome = audit.log_complete.call_args.args[1]
         self.assertEqual(denied_outcome, ActionStatus.FAILED)
 
+    def test_cmd_action_fans_out_by_runtime(self) -> None:
+        services = [
+            types.SimpleNamespace(service_id=name, container=f"card-fraud-{name}")
+            for name in ("rule-management", "transaction-management", "ops-agent")
+        ]
+        registry = MagicMock()
+        registry.list_by_runtime.return_value = services
+        registry.get.side_effect = lambda service_id: next(
+            s for s in services if s.service_id == service_id
+        )
+        registry.get_service_repo_path.return_value = "."
+
+        spec = ActionSpec(
+            command=["uv", "run", "platform-adapter", "db", "verify"],
+            destructive=False,
+            timeout_seconds=60,
+            mode=[ExecutionMode.SUITE],
+        )
+        loaders = {}
+        for service in services:
+            loaders[service.service_id] = MagicMock()
+            loaders[service.service_id].get_action.return_value = (
+                None if service.service_id == "ops-agent" else spec
+            )
+
+        def run(service, domain, action, action_spec, repo_path, stream=False):
+            status = ActionStatus.FAILED if service == "transaction-management" else ActionStatus.OK
+            return ActionResult(
+                service=service,
+                domain=domain,
+                action=action,
+                target="service",
+                status=status,
+                summary=status.value,
+            )
+
+        audit = MagicMock()
+        args = _fan_out_args("db", "verify", runtime="fastapi", json=False)
+
+        with patch("scripts.platformctl.get_registry", return_value=registry):
+            with patch(
+                "scripts.platformctl.load_adapter",
+                side_effect=lambda service_id, _registry: loaders[service_id],
+            ):
+                with patch("scripts.platformctl.run_action", side_effect=run) as run_action_mock:
+                    with patch("scripts.platformctl.get_audit_logger", return_value=audit):
+                        with patch("builtins.print"):
+                            code = platformctl.cmd_action(args)
+
+        self.assertEqual(code, 1)
+        registry.list_by_runtime.assert_called_once_with("fastapi")
+        self.assertEqual(
+            sorted(call.args[0] for call in run_action_mock.call_args_list),
+            ["rule-management", "transaction-management"],
+        )
+        self.assertEqual(
+            sorted(call.args[0] for call in audit.log_start.call_args_list),
+            ["rule-management", "transaction-management"],
+        )
+        self.assertEqual(audit.log_complete.call_count, 2)
+
+    def test_cmd_action_fan_out_confirms_destructive_once_for_selection(self) -> None:
+        registry = MagicMock()
+        registry.list_services.return_value = ["rule-management", "transaction-management"]
+
+        loader = MagicMock()
+        loader.get_action.return_value = ActionSpec(
+            command=["uv", "run", "platform-adapter", "db", "db-reset-data"],
+            destructive=True,
+            timeout_seconds=60,
+            mode=[ExecutionMode.SUITE],
+        )
+        audit = MagicMock()
+        args = _fan_out_args("db", "db-reset-data", all=True)
+
+        with patch("scripts.platformctl.get_registry", return_value=registry):
+            with patch("scripts.platformctl.load_adapter", return_value=loader):
+                with patch(
+                    "scripts.platformctl.require_confirmation",
+                    side_effect=RuntimeError("confirmation token mismatch"),
+                ) as confirm_mock:
+                    with patch("scripts.platformctl.run_action") as run_action_mock:
+                        with patch("scripts.platformctl.get_audit_logger", return_value=audit):
+                            with patch("builtins.print"):
+                                code = platformctl.cmd_action(args)
+
+        self.assertEqual(code, 1)
+        confirm_mock.assert_called_once()
+        self.assertEqual(confirm_mock.call_args.args[0], "all")
+        run_action_mock.assert_not_called()
+        self.assertEqual(audit.log_complete.call_count, 2)
+        for call in audit.log_complete.call_args_list:
+            self.assertEqual(call.args[1], ActionStatus.FAILED)
+
+    def test_max_workers_must_be_positive(self) -> None:
+        self.assertEqual(platformctl._positive_int("2"), 2)
+        for value in ("0", "-1"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                platformctl._positive_int(value)
+
+    def test_durations_must_be_positive(self) -> None:
+        self.assertEqual(platformctl._positive_float("0.5"), 0.5)
+        for value in ("0", "-2", "nan"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                platformctl._positive_float(value)
+
+
+def _python_spec(script: str, timeout_seconds: int = 30) -> ActionSpec:
+    return ActionSpec(
+        command=[sys.executable, "-c", script],
+        destructive=False,
+        timeout_seconds=timeout_seconds,
+        mode=[ExecutionMode.SUITE],
+    )
+
+
+class ActionRunnerStreamingTests(unittest.TestCase):
+    def test_stream_echoes_stderr_and_keeps_bounded_tail(self) -> None:
+        script = (
+            "import json, sys\n"
+            "for n in range(50):\n"
+            "    print(f'seeding batch {n}', file=sys.stderr, flush=True)\n"
+            "print(json.dumps({'status': 'ok', 'summary': 'seeded'}))\n"
+        )
+        sink = io.StringIO()
+        runner = ActionRunner(Path("."), stderr_sink=sink, stderr_tail_lines=5)
+
+        result = runner.run(
+            "rule-management", "db", "seed", _python_spec(script), format_json=False, stream=True
+        )
+
+        self.assertEqual(result.status, ActionStatus.OK)
+        self.assertEqual(result.summary, "seeded")
+        echoed = sink.getvalue().splitlines()
+        self.assertEqual(len(echoed), 50)
+        self.assertEqual(echoed[0], "[rule-management] seeding batch 0")
+
+    def test_stream_failure_reports_stderr_tail_only(self) -> None:
+        script = (
+            "import sys\n"
+            "for n in range(50):\n"
+            "    print(f'line {n}', file=sys.stderr)\n"
+            "sys.exit(3)\n"
+        )
+        runner = ActionRunner(Path("."), stderr_sink=io.StringIO(), stderr_tail_lines=3)
+
+        result = runner.run(
+            "rule-management", "db", "init", _python_spec(script), format_json=False, stream=True
+        )
+
+        self.assertEqual(result.status, ActionStatus.FAILED)
+        self.assertEqual(result.summary, "Command exited with code 3")
+        self.assertEqual(result.error, "line 47\nline 48\nline 49\n")
+
+    def test_stream_stdout_over_cap_is_invalid_output(self) -> None:
+        script = "import sys\nsys.stdout.write('x' * 200000)\n"
+        runner = ActionRunner(Path("."), stderr_sink=io.StringIO(), max_stdout_bytes=1000)
+
+        result = runner.run(
+            "rule-management", "db", "seed", _python_spec(script), format_json=False, stream=True
+        )
+
+        self.assertEqual(result.status, ActionStatus.INVALID_OUTPUT)
+        self.assertIn("200000 bytes", result.summary)
+
+    def test_stream_timeout_kills_adapter(self) -> None:
+        script = "import time\ntime.sleep(30)\n"
+        runner = ActionRunner(Path("."), stderr_sink=io.StringIO())
+
+        result = runner.run(
+            "rule-management",
+            "db",
+            "seed",
+            _python_spec(script, timeout_seconds=1),
+            format_json=False,
+            stream=True,
+        )
+
+        self.assertEqual(result.status, ActionStatus.TIMEOUT)
+
+    def test_stream_timeout_kills_children_holding_the_pipes(self) -> None:
+        script = (
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "time.sleep(30)\n"
+        )
+        runner = ActionRunner(Path("."), stderr_sink=io.StringIO())
+
+        began = time.monotonic()
+        result = runner.run(
+            "rule-management",
+            "db",
+            "seed",
+            _python_spec(script, timeout_seconds=1),
+            format_json=False,
+            stream=True,
+        )
+
+        self.assertEqual(result.status, ActionStatus.TIMEOUT)
+        self.assertLess(time.monotonic() - began, 10)
+
+
+class StdoutPayloadTests(unittest.TestCase):
+    def test_parses_document_split_across_chunks(self) -> None:
+        payload = _StdoutPayload(limit=1024)
+        for chunk in (b'  {"status": "ok", "sum', b'mary": "caf\xc3', b'\xa9"}\n'):
+            payload.feed(chunk)
+        self.assertEqual(payload.close(), {"status": "ok", "summary": "caf\u00e9"})
+
+    def test_rejects_trailing_data_and_non_json(self) -> None:
+        trailing = _StdoutPayload(limit=1024)
+        trailing.feed(b'{"status": "ok"}\nextra')
+        self.assertIsNone(trailing.close())
+
+        text = _StdoutPayload(limit=1024)
+        text.feed(b"seeding...\n")
+        self.assertIsNone(text.close())
+
+        empty = _StdoutPayload(limit=1024)
+        self.assertIsNone(empty.close())
+
 
 if __name__ == "__main__":
     unittest.main()